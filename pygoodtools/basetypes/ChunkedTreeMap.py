@@ -0,0 +1,293 @@
+# COPYRIGHT (c) 2024 Massonskyi
+# All rights reserved.
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+import itertools
+from bisect import bisect_left, bisect_right
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+from ._buffers import as_list, pairs
+
+
+class ChunkedTreeMap:
+    """
+    ChunkedTreeMap: Ordered map with the TreeMap API stored as a list of sorted chunks.
+
+    Keys live in sorted Python lists of roughly `load` entries each, with parallel
+    value lists and a list of every chunk's maximum key. A lookup bisects the
+    maxima and then one chunk, so there is no per-key node object, and range scans
+    are plain list slices. A chunk is split once it grows past twice the load and
+    merged into a neighbour once it drops below half of it. Positional offsets for
+    `rank` and `select` are rebuilt lazily after the chunk layout changes.
+    """
+
+    def __init__(self, load: int = 1000) -> None:
+        """Initializes an empty map whose chunks hold about `load` keys."""
+        if load < 4:
+            raise ValueError("load must be at least 4")
+        self._load = load
+        self._keys: List[List[Any]] = []
+        self._values: List[List[Any]] = []
+        self._maxes: List[Any] = []
+        self._len = 0
+        self._offsets: Optional[List[int]] = None
+
+    @classmethod
+    def from_sorted(cls, items: Any, values: Optional[Any] = None, load: int = 1000) -> 'ChunkedTreeMap':
+        """
+        Bulk-loads a map in O(n) from pairs with strictly increasing keys, or from
+        parallel sorted keys and values (NumPy arrays and buffers are accepted).
+        Raises ValueError if the keys are not strictly increasing.
+        """
+        result = cls(load)
+        if values is not None:
+            keys, values = as_list(items), as_list(values)
+            if len(keys) != len(values):
+                raise ValueError("Keys and values must have the same length")
+        else:
+            items = pairs(items)
+            keys = [key for key, _ in items]
+            values = [value for _, value in items]
+        for previous, key in zip(keys, itertools.islice(keys, 1, None)):
+            if not previous < key:
+                raise ValueError("Keys must be strictly increasing")
+        for start in range(0, len(keys), load):
+            result._keys.append(keys[start:start + load])
+            result._values.append(values[start:start + load])
+            result._maxes.append(result._keys[-1][-1])
+        result._len = len(keys)
+        return result
+
+    def _locate(self, key: Any) -> Tuple[int, int]:
+        """Returns (chunk, position) of the first key not below `key`; chunk is len(chunks) past the end."""
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return i, 0
+        return i, bisect_left(self._keys[i], key)
+
+    def put(self, key: Any, value: Any) -> None:
+        """Inserts a key-value pair into the map."""
+        maxes = self._maxes
+        if not maxes:
+            self._keys.append([key])
+            self._values.append([value])
+            maxes.append(key)
+            self._len = 1
+            self._offsets = None
+            return
+        i = bisect_left(maxes, key)
+        if i == len(maxes):
+            # Ключ больше всех: дописываем в конец последнего блока
+            i -= 1
+            self._keys[i].append(key)
+            self._values[i].append(value)
+            maxes[i] = key
+        else:
+            keys = self._keys[i]
+            j = bisect_left(keys, key)
+            if not key < keys[j]:
+                self._values[i][j] = value
+                return
+            keys.insert(j, key)
+            self._values[i].insert(j, value)
+        self._len += 1
+        if len(self._keys[i]) > 2 * self._load:
+            self._split(i)
+        elif self._offsets is not None:
+            for n in range(i + 1, len(self._offsets)):
+                self._offsets[n] += 1
+
+    def _split(self, i: int) -> None:
+        """Splits chunk `i` in two halves."""
+        keys, values = self._keys[i], self._values[i]
+        half = len(keys) // 2
+        self._keys[i:i + 1] = [keys[:half], keys[half:]]
+        self._values[i:i + 1] = [values[:half], values[half:]]
+        self._maxes[i:i + 1] = [keys[half - 1], keys[-1]]
+        self._offsets = None
+
+    def get(self, key: Any) -> Union[None, Any]:
+        """Retrieves the value associated with the given key."""
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return None
+        keys = self._keys[i]
+        j = bisect_left(keys, key)
+        if key < keys[j]:
+            return None
+        return self._values[i][j]
+
+    def remove(self, key: Any) -> bool:
+        """Removes the key and its value; returns False if the key is absent."""
+        i, j = self._locate(key)
+        if i == len(self._maxes) or key < self._keys[i][j]:
+            return False
+        keys, values = self._keys[i], self._values[i]
+        del keys[j]
+        del values[j]
+        self._len -= 1
+        self._offsets = None
+        if not keys:
+            del self._keys[i], self._values[i], self._maxes[i]
+            return True
+        self._maxes[i] = keys[-1]
+        if len(keys) < self._load // 2 and len(self._keys) > 1:
+            self._merge(i)
+        return True
+
+    def _merge(self, i: int) -> None:
+        """Merges the undersized chunk `i` into a neighbour, splitting the result if it is too large."""
+        if i == len(self._keys) - 1:
+            i -= 1
+        self._keys[i] += self._keys[i + 1]
+        self._values[i] += self._values[i + 1]
+        self._maxes[i] = self._keys[i][-1]
+        del self._keys[i + 1], self._values[i + 1], self._maxes[i + 1]
+        if len(self._keys[i]) > 2 * self._load:
+            self._split(i)
+
+    def __len__(self) -> int:
+        """Returns the number of keys in the map."""
+        return self._len
+
+    def __contains__(self, key: Any) -> bool:
+        """Checks if the given key exists in the map."""
+        i, j = self._locate(key)
+        return i < len(self._maxes) and not key < self._keys[i][j]
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over the keys in order."""
+        return itertools.chain.from_iterable(self._keys)
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """Lazily yields key-value pairs in key order."""
+        return itertools.chain.from_iterable(map(zip, self._keys, self._values))
+
+    def keys(self) -> Iterator[Any]:
+        """Lazily yields the keys in order."""
+        return itertools.chain.from_iterable(self._keys)
+
+    def values(self) -> Iterator[Any]:
+        """Lazily yields the values in key order."""
+        return itertools.chain.from_iterable(self._values)
+
+    def _bound(self, key: Any, right: bool) -> Tuple[int, int]:
+        """Returns the (chunk, position) bisect_left/bisect_right of `key` across all chunks."""
+        maxes = self._maxes
+        i = bisect_right(maxes, key) if right else bisect_left(maxes, key)
+        if i == len(maxes):
+            return i, 0
+        keys = self._keys[i]
+        return i, bisect_right(keys, key) if right else bisect_left(keys, key)
+
+    def irange(self, lo: Any = None, hi: Any = None, inclusive: Tuple[bool, bool] = (True, True),
+               reverse: bool = False) -> Iterator[Tuple[Any, Any]]:
+        """
+        Lazily yields the key-value pairs with `lo <= key <= hi` in key order.
+        None leaves a bound open; `inclusive` makes either bound strict and
+        `reverse` walks from `hi` down to `lo`.
+        """
+        start = (0, 0) if lo is None else self._bound(lo, not inclusive[0])
+        stop = (len(self._maxes), 0) if hi is None else self._bound(hi, inclusive[1])
+        return self._slice(start, stop, reverse)
+
+    def _slice(self, start: Tuple[int, int], stop: Tuple[int, int], reverse: bool) -> Iterator[Tuple[Any, Any]]:
+        """Yields the pairs between two (chunk, position) bounds, one list slice per chunk."""
+        (i, j), (k, m) = start, stop
+        if (i, j) >= (k, m):
+            return
+        chunks = []
+        for n in range(i, min(k, len(self._keys) - 1) + 1):
+            begin = j if n == i else 0
+            end = m if n == k else len(self._keys[n])
+            if begin < end:
+                chunks.append((n, begin, end))
+        if reverse:
+            for n, begin, end in reversed(chunks):
+                yield from zip(reversed(self._keys[n][begin:end]), reversed(self._values[n][begin:end]))
+        else:
+            for n, begin, end in chunks:
+                yield from zip(self._keys[n][begin:end], self._values[n][begin:end])
+
+    def floor(self, key: Any) -> Optional[Tuple[Any, Any]]:
+        """Returns the pair with the greatest key not above `key`, or None."""
+        i, j = self._bound(key, True)
+        if j == 0:
+            if i == 0:
+                return None
+            i -= 1
+            j = len(self._keys[i])
+        return self._keys[i][j - 1], self._values[i][j - 1]
+
+    def ceiling(self, key: Any) -> Optional[Tuple[Any, Any]]:
+        """Returns the pair with the smallest key not below `key`, or None."""
+        i, j = self._bound(key, False)
+        if i == len(self._maxes):
+            return None
+        return self._keys[i][j], self._values[i][j]
+
+    def first(self) -> Optional[Tuple[Any, Any]]:
+        """Returns the pair with the smallest key, or None if the map is empty."""
+        if not self._len:
+            return None
+        return self._keys[0][0], self._values[0][0]
+
+    def last(self) -> Optional[Tuple[Any, Any]]:
+        """Returns the pair with the greatest key, or None if the map is empty."""
+        if not self._len:
+            return None
+        return self._keys[-1][-1], self._values[-1][-1]
+
+    def _chunk_offsets(self) -> List[int]:
+        """Returns the number of keys before each chunk, rebuilding it if the layout changed."""
+        if self._offsets is None:
+            self._offsets = [0, *itertools.accumulate(map(len, self._keys[:-1]))] if self._keys else []
+        return self._offsets
+
+    def rank(self, key: Any) -> int:
+        """Returns the number of keys strictly less than `key`."""
+        i, j = self._bound(key, False)
+        if i == len(self._maxes):
+            return self._len
+        return self._chunk_offsets()[i] + j
+
+    def select(self, index: int) -> Tuple[Any, Any]:
+        """Returns the key-value pair at position `index` in key order; negative indexes count from the end."""
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("ChunkedTreeMap index out of range")
+        offsets = self._chunk_offsets()
+        i = bisect_right(offsets, index) - 1
+        j = index - offsets[i]
+        return self._keys[i][j], self._values[i][j]
+
+    def islice(self, start: Optional[int] = None, stop: Optional[int] = None,
+               reverse: bool = False) -> Iterator[Tuple[Any, Any]]:
+        """Lazily yields the key-value pairs at positions `start` to `stop` in key order."""
+        start, stop, _ = slice(start, stop).indices(self._len)
+        if start >= stop:
+            return iter(())
+        offsets = self._chunk_offsets()
+        i = bisect_right(offsets, start) - 1
+        k = bisect_right(offsets, stop - 1) - 1
+        return self._slice((i, start - offsets[i]), (k, stop - offsets[k]), reverse)
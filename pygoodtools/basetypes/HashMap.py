@@ -23,77 +23,471 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 import ctypes
-from typing import List, Any, Optional, Union
+from array import array
+from typing import Iterable, List, Any, Optional, Union
+
+from ._buffers import as_list, pairs
+
+# Маркер пустой ячейки в массиве ключей
+_EMPTY = object()
+# Маркер удалённой ячейки старой таблицы во время пошагового перехеширования
+_TOMBSTONE = object()
+# Максимальная доля занятых ячеек
+_MAX_LOAD = 0.8
+# Доля, ниже которой таблица сжимается
+_MIN_LOAD = 0.2
+# Минимум ячеек старой таблицы, переносимых за одну операцию
+_REHASH_STEP = 16
+
+
+def _table_size(n: int) -> int:
+    """Returns the smallest power of two, at least 8, that holds `n` entries under the load limit."""
+    capacity = 8
+    while capacity * _MAX_LOAD < n:
+        capacity <<= 1
+    return capacity
+
 
 class HashMap:
     """
-    Hash table implementation using ctypes for separate chaining and optimized for ARM architecture.
+    Hash table implementation using open addressing with Robin Hood probing.
+
+    Entries live in three parallel arrays indexed by slot: keys, values and the
+    cached hash of each key (a compact signed 64-bit `array`). An entry that has
+    probed further from its home slot than the resident one takes its place, which
+    keeps probe sequences short and lets lookups stop early. Removal shifts the
+    following entries back, so the table never accumulates tombstones.
+
+    The table doubles when it is 80% full and halves when it drops below 20%,
+    but never below the initial or reserved capacity. With `incremental=True` a
+    resize does not rehash everything at once: the old table stays live and every
+    operation moves a bounded number of its slots into the new one, so no single
+    `put` pays for the whole table. The step grows with the ratio of the old table
+    to the free room of the new one, so the old table is always drained before
+    the new one needs to grow again.
     """
 
-    def __init__(self, initial_capacity: Optional[int] = 16) -> None:
+    def __init__(self, initial_capacity: Optional[int] = 16, incremental: bool = False) -> None:
         """Initializes the hash table with a given initial capacity."""
-        self.capacity = ctypes.c_int(initial_capacity)
+        self.capacity = ctypes.c_int(0)
         self.size = ctypes.c_int(0)
-        self.buckets = (ctypes.py_object * initial_capacity)()  # Массив списков
-        for i in range(initial_capacity):
-            self.buckets[i] = []
+        self.incremental = incremental
+        self._min_capacity = _table_size(initial_capacity * _MAX_LOAD)
+        self._allocate(self._min_capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        """Replaces the slot arrays with empty ones of the given power-of-two capacity."""
+        self.capacity.value = capacity
+        self._mask = capacity - 1
+        self._limit = int(capacity * _MAX_LOAD)
+        self._keys = [_EMPTY] * capacity
+        self._values = [None] * capacity
+        self._hashes = array('q', bytes(8 * capacity))
+        # Число элементов в основной таблице
+        self._used = 0
+        self._old_keys = None
+
+    def _find(self, key: Any) -> int:
+        """Returns the slot holding `key` in the main table, or -1 if it is absent."""
+        h = hash(key)
+        keys = self._keys
+        hashes = self._hashes
+        mask = self._mask
+        i = h & mask
+        dist = 0
+        while True:
+            k = keys[i]
+            if k is key:
+                return i
+            if k is _EMPTY:
+                return -1
+            kh = hashes[i]
+            if kh == h and k == key:
+                return i
+            # Чужой элемент ближе к своему месту, чем мы: ключа в таблице нет
+            if (i - kh) & mask < dist:
+                return -1
+            i = (i + 1) & mask
+            dist += 1
 
-    def _hash(self, key: Any) -> Optional[int]:
-        """Computes the hash value for a given key."""
-        return hash(key) % self.capacity.value
+    def _find_old(self, key: Any) -> int:
+        """Returns the slot holding `key` in the table being migrated, or -1 if it is absent."""
+        h = hash(key)
+        keys = self._old_keys
+        hashes = self._old_hashes
+        mask = len(keys) - 1
+        i = h & mask
+        dist = 0
+        while True:
+            k = keys[i]
+            if k is key:
+                return i
+            if k is _EMPTY:
+                return -1
+            kh = hashes[i]
+            # Надгробие хранит хеш, поэтому проверка расстояния остаётся верной
+            if kh == h and k is not _TOMBSTONE and k == key:
+                return i
+            if (i - kh) & mask < dist:
+                return -1
+            i = (i + 1) & mask
+            dist += 1
+
+    def _place(self, i: int, dist: int, h: int, key: Any, value: Any) -> None:
+        """Stores an entry known to be absent, starting the probe at slot `i`."""
+        keys = self._keys
+        values = self._values
+        hashes = self._hashes
+        mask = self._mask
+        while True:
+            k = keys[i]
+            if k is _EMPTY:
+                keys[i] = key
+                values[i] = value
+                hashes[i] = h
+                return
+            kh = hashes[i]
+            kdist = (i - kh) & mask
+            if kdist < dist:
+                keys[i], key = key, k
+                values[i], value = value, values[i]
+                hashes[i], h = h, kh
+                dist = kdist
+            i = (i + 1) & mask
+            dist += 1
 
     def put(self, key: Any, value: Any) -> None:
         """Inserts or updates the key-value pair in the hash table."""
-        hashed_key = self._hash(key)
-        bucket = self.buckets[hashed_key]
-
-        for i in range(len(bucket)):
-            if bucket[i][0] == key:
-                bucket[i] = (key, value)
+        if self._old_keys is not None:
+            self._migrate(self._step)
+            i = self._find_old(key) if self._old_keys is not None else -1
+            if i >= 0:
+                self._old_values[i] = value
                 return
+        h = hash(key)
+        keys = self._keys
+        hashes = self._hashes
+        mask = self._mask
+        i = h & mask
+        dist = 0
+        while True:
+            k = keys[i]
+            if k is key:
+                self._values[i] = value
+                return
+            if k is _EMPTY:
+                keys[i] = key
+                self._values[i] = value
+                hashes[i] = h
+                break
+            kh = hashes[i]
+            if kh == h and k == key:
+                self._values[i] = value
+                return
+            kdist = (i - kh) & mask
+            if kdist < dist:
+                # Вытесняем более «богатый» элемент и дальше вставляем его
+                values = self._values
+                keys[i] = key
+                hashes[i] = h
+                displaced = values[i]
+                values[i] = value
+                self._place((i + 1) & mask, kdist + 1, kh, k, displaced)
+                break
+            i = (i + 1) & mask
+            dist += 1
 
-        bucket.append((key, value))
         self.size.value += 1
-
-        if self.size.value / self.capacity.value > 0.7:
-            self._resize()
+        self._used += 1
+        if self._used > self._limit:
+            self._resize(self.capacity.value * 2)
 
     def get(self, key: Any) -> Union[Optional[Any], None]:
         """Retrieves the value associated with the given key."""
-        hashed_key = self._hash(key)
-        bucket = self.buckets[hashed_key]
-        for k, v in bucket:
-            if k == key:
-                return v
+        if self._old_keys is not None:
+            return self._get_migrating(key)
+        h = hash(key)
+        keys = self._keys
+        hashes = self._hashes
+        mask = self._mask
+        i = h & mask
+        dist = 0
+        while True:
+            k = keys[i]
+            if k is key:
+                return self._values[i]
+            if k is _EMPTY:
+                return None
+            kh = hashes[i]
+            if kh == h and k == key:
+                return self._values[i]
+            if (i - kh) & mask < dist:
+                return None
+            i = (i + 1) & mask
+            dist += 1
+
+    def _get_migrating(self, key: Any) -> Union[Optional[Any], None]:
+        """Looks `key` up in both tables while a resize is in progress."""
+        self._migrate(self._step)
+        i = self._find(key)
+        if i >= 0:
+            return self._values[i]
+        if self._old_keys is not None:
+            i = self._find_old(key)
+            if i >= 0:
+                return self._old_values[i]
         return None
 
     def remove(self, key: Any) -> Optional[bool]:
         """Removes the key-value pair associated with the given key."""
-        hashed_key = self._hash(key)
-        bucket = self.buckets[hashed_key]
+        removed = self._remove(key)
+        if removed:
+            self._shrink()
+        return removed
 
-        for i in range(len(bucket)):
-            if bucket[i][0] == key:
-                del bucket[i]
+    def _remove(self, key: Any) -> bool:
+        """Removes `key` without shrinking the table."""
+        if self._old_keys is not None:
+            self._migrate(self._step)
+            i = self._find_old(key) if self._old_keys is not None else -1
+            if i >= 0:
+                # В старой таблице сдвигать нельзя: курсор переноса уже мог пройти эти ячейки
+                self._old_keys[i] = _TOMBSTONE
+                self._old_values[i] = None
+                self._old_live -= 1
                 self.size.value -= 1
                 return True
-        return False
+        i = self._find(key)
+        if i < 0:
+            return False
+        keys = self._keys
+        values = self._values
+        hashes = self._hashes
+        mask = self._mask
+        # Сдвигаем назад хвост цепочки, пока элементы не на своих местах
+        j = (i + 1) & mask
+        while keys[j] is not _EMPTY and (j - hashes[j]) & mask:
+            keys[i] = keys[j]
+            values[i] = values[j]
+            hashes[i] = hashes[j]
+            i = j
+            j = (j + 1) & mask
+        keys[i] = _EMPTY
+        values[i] = None
+        self.size.value -= 1
+        self._used -= 1
+        return True
+
+    def _shrink(self, at_once: bool = False) -> None:
+        """Halves the table (or more) once it is mostly empty."""
+        capacity = self.capacity.value
+        # size учитывает и элементы, ещё не перенесённые из старой таблицы
+        live = self.size.value
+        if live < capacity * _MIN_LOAD and capacity > self._min_capacity and self._old_keys is None:
+            self._resize(max(self._min_capacity, _table_size(2 * live)), at_once)
+
+    @classmethod
+    def from_items(cls, items: Any, values: Optional[Any] = None, incremental: bool = False) -> 'HashMap':
+        """
+        Builds a hash table sized for the input in one pass.
 
-    def _resize(self) -> None:
-        """Resizes the hash table when the load factor exceeds 0.7."""
-        new_capacity = self.capacity.value * 2
-        new_buckets = (ctypes.py_object * new_capacity)()
+        `items` is a mapping, an iterable of (key, value) pairs, or, when `values`
+        is given, the keys as a sequence, NumPy array or buffer parallel to `values`.
+        """
+        result = cls(incremental=incremental)
+        result.put_many(items, values)
+        return result
 
-        for i in range(new_capacity):
-            new_buckets[i] = []
+    def put_many(self, items: Any, values: Optional[Any] = None) -> None:
+        """
+        Inserts or updates many key-value pairs, growing the table at most once.
+        Accepts the same arguments as `from_items`.
+        """
+        items = pairs(items, values)
+        if self._old_keys is not None:
+            self._migrate(len(self._old_keys))
+        needed = _table_size(self._used + len(items))
+        if needed > self.capacity.value:
+            self._rebuild(needed)
+        self._put_pairs(items)
 
-        for i in range(self.capacity.value):
-            for k, v in self.buckets[i]:
-                hashed_key = hash(k) % new_capacity
-                new_buckets[hashed_key].append((k, v))
+    def _put_pairs(self, items: Iterable[Any]) -> None:
+        """Inserts pairs into a table that is known to have room for all of them."""
+        keys = self._keys
+        values = self._values
+        hashes = self._hashes
+        mask = self._mask
+        place = self._place
+        added = 0
+        for key, value in items:
+            h = hash(key)
+            i = h & mask
+            dist = 0
+            while True:
+                k = keys[i]
+                if k is key:
+                    values[i] = value
+                    break
+                if k is _EMPTY:
+                    keys[i] = key
+                    values[i] = value
+                    hashes[i] = h
+                    added += 1
+                    break
+                kh = hashes[i]
+                if kh == h and k == key:
+                    values[i] = value
+                    break
+                kdist = (i - kh) & mask
+                if kdist < dist:
+                    keys[i] = key
+                    hashes[i] = h
+                    displaced = values[i]
+                    values[i] = value
+                    place((i + 1) & mask, kdist + 1, kh, k, displaced)
+                    added += 1
+                    break
+                i = (i + 1) & mask
+                dist += 1
+        self.size.value += added
+        self._used += added
 
-        self.buckets = new_buckets
-        self.capacity.value = new_capacity
+    def get_many(self, keys: Any, default: Any = None) -> List[Any]:
+        """Returns the values of `keys` in order, `default` for the missing ones."""
+        keys = as_list(keys)
+        if self._old_keys is not None:
+            self._migrate(len(self._old_keys))
+        slots = self._keys
+        values = self._values
+        hashes = self._hashes
+        mask = self._mask
+        result = []
+        append = result.append
+        for key in keys:
+            h = hash(key)
+            i = h & mask
+            dist = 0
+            while True:
+                k = slots[i]
+                if k is key:
+                    append(values[i])
+                    break
+                if k is _EMPTY:
+                    append(default)
+                    break
+                kh = hashes[i]
+                if kh == h and k == key:
+                    append(values[i])
+                    break
+                if (i - kh) & mask < dist:
+                    append(default)
+                    break
+                i = (i + 1) & mask
+                dist += 1
+        return result
+
+    def remove_many(self, keys: Any) -> int:
+        """Removes every key of `keys` that is present and returns how many were removed."""
+        if self._old_keys is not None:
+            self._migrate(len(self._old_keys))
+        remove = self._remove
+        removed = 0
+        for key in as_list(keys):
+            if remove(key):
+                removed += 1
+        # Массовая операция уже заплатила O(n), поэтому сжатие делается сразу
+        self._shrink(at_once=True)
+        return removed
+
+    def reserve(self, n: int) -> None:
+        """Presizes the table for `n` entries and keeps it from shrinking below that."""
+        capacity = _table_size(n)
+        self._min_capacity = max(self._min_capacity, capacity)
+        if self._old_keys is not None:
+            self._migrate(len(self._old_keys))
+        if capacity > self.capacity.value:
+            self._rebuild(capacity)
+
+    def _resize(self, capacity: int, at_once: bool = False) -> None:
+        """Moves the entries to a table of the given capacity, at once or step by step."""
+        if self._old_keys is not None:
+            # Предыдущий перенос ещё не закончен: доводим его до конца
+            self._migrate(len(self._old_keys))
+        # Новая таблица должна вместить все элементы, а не только основной таблицы
+        capacity = max(capacity, _table_size(self.size.value))
+        # Шаг переноса пропорционален размеру старой таблицы: она должна опустеть
+        # раньше, чем новая наберёт предельную загрузку, даже если каждая операция
+        # добавляет по элементу
+        headroom = int(capacity * _MAX_LOAD) - self._used
+        if at_once or not self.incremental or headroom <= 0:
+            self._rebuild(capacity)
+            return
+        keys, values, hashes, live = self._keys, self._values, self._hashes, self._used
+        self._allocate(capacity)
+        self._step = max(_REHASH_STEP, -(-len(keys) // headroom) + 1)
+        self._old_keys = keys
+        self._old_values = values
+        self._old_hashes = hashes
+        self._old_live = live
+        self._cursor = 0
+
+    def _migrate(self, steps: int) -> None:
+        """Moves up to `steps` slots of the old table into the main one."""
+        keys = self._old_keys
+        values = self._old_values
+        hashes = self._old_hashes
+        mask = self._mask
+        place = self._place
+        i = self._cursor
+        end = min(i + steps, len(keys))
+        moved = 0
+        while i < end:
+            k = keys[i]
+            if k is not _EMPTY and k is not _TOMBSTONE:
+                h = hashes[i]
+                place(h & mask, 0, h, k, values[i])
+                keys[i] = _TOMBSTONE
+                values[i] = None
+                moved += 1
+            i += 1
+        self._cursor = i
+        self._used += moved
+        self._old_live -= moved
+        if i == len(keys) or not self._old_live:
+            self._old_keys = self._old_values = self._old_hashes = None
+
+    def _rebuild(self, capacity: int) -> None:
+        """Rehashes every entry into a table of the given capacity in one pass."""
+        old = zip(self._hashes, self._keys, self._values)
+        used = self._used
+        self._allocate(capacity)
+        self._used = used
+        keys = self._keys
+        values = self._values
+        hashes = self._hashes
+        mask = self._mask
+        # Все ключи уникальны, поэтому вставка идёт без сравнения ключей
+        for h, key, value in old:
+            if key is _EMPTY:
+                continue
+            i = h & mask
+            dist = 0
+            while True:
+                k = keys[i]
+                if k is _EMPTY:
+                    keys[i] = key
+                    values[i] = value
+                    hashes[i] = h
+                    break
+                kh = hashes[i]
+                kdist = (i - kh) & mask
+                if kdist < dist:
+                    keys[i], key = key, k
+                    values[i], value = value, values[i]
+                    hashes[i], h = h, kh
+                    dist = kdist
+                i = (i + 1) & mask
+                dist += 1
 
     def __len__(self) -> Optional[int]:
         """Returns the number of key-value pairs in the hash table."""
@@ -101,33 +495,37 @@ class HashMap:
 
     def __str__(self) -> Optional[str]:
         """Returns a string representation of the hash table."""
-        return str({k: v for bucket in self.buckets for k, v in bucket})
+        return str(dict(self.items()))
+
+    def _tables(self) -> List[Any]:
+        """Returns the (keys, values) pairs of the live tables."""
+        if self._old_keys is None:
+            return [(self._keys, self._values)]
+        return [(self._keys, self._values), (self._old_keys, self._old_values)]
 
     def keys(self) -> Optional[List[Any]]:
         """Returns a list of all keys in the hash table."""
-        return [k for bucket in self.buckets for k, v in bucket]
+        return [k for keys, _ in self._tables() for k in keys if k is not _EMPTY and k is not _TOMBSTONE]
 
     def values(self) -> Optional[List[Any]]:
         """Returns a list of all values in the hash table."""
-        return [v for bucket in self.buckets for k, v in bucket]
+        return [v for keys, values in self._tables() for k, v in zip(keys, values)
+                if k is not _EMPTY and k is not _TOMBSTONE]
 
     def items(self) -> Optional[List[Any]]:
         """Returns a list of all key-value pairs in the hash table."""
-        return [(k, v) for bucket in self.buckets for k, v in bucket]
+        return [(k, v) for keys, values in self._tables() for k, v in zip(keys, values)
+                if k is not _EMPTY and k is not _TOMBSTONE]
 
     def clear(self) -> None:
         """Clears the hash table, resetting it to its initial state."""
-        self.capacity = ctypes.c_int(16)
         self.size = ctypes.c_int(0)
-        self.buckets = (ctypes.py_object * self.capacity.value)()
-        for i in range(self.capacity.value):
-            self.buckets[i] = []
+        self._allocate(self._min_capacity)
 
     def contains_key(self, key: Any) -> Optional[bool]:
         """Checks if the given key exists in the hash table."""
-        hashed_key = self._hash(key)
-        bucket = self.buckets[hashed_key]
-        for k, v in bucket:
-            if k == key:
+        if self._old_keys is not None:
+            self._migrate(self._step)
+            if self._old_keys is not None and self._find_old(key) >= 0:
                 return True
-        return False
+        return self._find(key) >= 0
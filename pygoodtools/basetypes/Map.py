@@ -22,118 +22,179 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import bisect
 import ctypes
-from typing import List, Optional, Any, final
+from typing import Dict, List, Optional, Any, final
+
+# Маркер удалённой ячейки
+_DELETED = object()
+# Минимальное число удалённых ячеек, после которого возможно уплотнение
+_COMPACT_MIN = 16
+
+
 @final
 class Map:
     """
-    A dictionary-like data structure using ctypes for optimized performance, especially for ARM architecture.
+    A dictionary-like data structure that keeps insertion order.
+
+    Keys and values are stored in parallel slot lists in insertion order. A hash
+    index maps each key to its slot and a reverse index maps each value to the
+    slots holding it, so `get`, `contains`, `update`, `remove` and `get_key` are
+    O(1) on average. Removal leaves a tombstone in the slot lists; once tombstones
+    outnumber live entries the lists are compacted. Keys must be hashable and are
+    unique: putting an existing key replaces its value in place. Unhashable values
+    are allowed and are found by `get_key` with a scan over those values only.
     """
 
     def __init__(self, initial_capacity: Optional[int] = 16) -> None:
-        """Initializes the hash table with a given initial capacity."""
+        """Initializes the map with a given initial capacity."""
         self.capacity = ctypes.c_int(initial_capacity)
         self.size = ctypes.c_int(0)
-        self._map = (ctypes.py_object * initial_capacity)()  # Массив значений
-        self._keys = (ctypes.py_object * initial_capacity)()  # Массив ключей
-
-    def _resize(self) -> None:
-        """Resize the internal storage if capacity is exceeded."""
-        new_capacity = self.capacity.value * 2
-        new_map = (ctypes.py_object * new_capacity)()
-        new_keys = (ctypes.py_object * new_capacity)()
-
-        # Копируем старые значения в новый массив
-        for i in range(self.size.value):
-            new_map[i] = self._map[i]
-            new_keys[i] = self._keys[i]
-
-        self._map = new_map
-        self._keys = new_keys
-        self.capacity.value = new_capacity
+        self._clear()
+
+    def _clear(self) -> None:
+        """Drops all slots and indexes."""
+        self._keys: List[Any] = []  # Ключи по порядку вставки
+        self._map: List[Any] = []  # Значения по порядку вставки
+        self._index: Dict[Any, int] = {}  # Ключ -> ячейка
+        self._reverse: Dict[Any, List[int]] = {}  # Значение -> ячейки по возрастанию
+        self._unhashable: Dict[int, Any] = {}  # Ячейка -> нехешируемое значение
+        self._deleted = 0
+
+    def _link_value(self, slot: int, value: Any) -> None:
+        """Adds `slot` to the reverse index of `value`."""
+        try:
+            slots = self._reverse.get(value)
+        except TypeError:
+            self._unhashable[slot] = value
+            return
+        if slots is None:
+            self._reverse[value] = [slot]
+        elif slots[-1] < slot:
+            slots.append(slot)
+        else:
+            bisect.insort(slots, slot)
+
+    def _unlink_value(self, slot: int, value: Any) -> None:
+        """Removes `slot` from the reverse index of `value`."""
+        if self._unhashable.pop(slot, _DELETED) is not _DELETED:
+            return
+        slots = self._reverse[value]
+        if len(slots) == 1:
+            del self._reverse[value]
+        else:
+            del slots[bisect.bisect_left(slots, slot)]
+
+    def _compact(self) -> None:
+        """Rewrites the slot lists without tombstones and rebuilds the indexes."""
+        items = self.items()
+        self._clear()
+        for key, value in items:
+            self._append(key, value)
+
+    def _append(self, key: Any, value: Any) -> None:
+        """Stores a new key in the next free slot."""
+        slot = len(self._keys)
+        self._index[key] = slot
+        self._keys.append(key)
+        self._map.append(value)
+        self._link_value(slot, value)
+        while len(self._keys) > self.capacity.value:
+            self.capacity.value *= 2
 
     def put(self, key: Any, value: Any) -> None:
-        """Add a key-value pair to the map."""
-        if self.size.value == self.capacity.value:
-            self._resize()
-
-        # Сохраняем ключ и значение
-        self._keys[self.size.value] = ctypes.py_object(key)
-        self._map[self.size.value] = ctypes.py_object(value)
+        """Add a key-value pair to the map, replacing the value of an existing key."""
+        slot = self._index.get(key)
+        if slot is not None:
+            self._set(slot, value)
+            return
+        self._append(key, value)
         self.size.value += 1
-        
+
+    def _set(self, slot: int, value: Any) -> None:
+        """Replaces the value in `slot`, keeping the reverse index in sync."""
+        self._unlink_value(slot, self._map[slot])
+        self._map[slot] = value
+        self._link_value(slot, value)
+
     def remove(self, key: Any) -> bool:
         """Remove a key-value pair from the map by key."""
-        for i in range(self.size.value):
-            if self._keys[i] == key:
-                # Удаляем ключ и значение, смещая оставшиеся элементы
-                for j in range(i, self.size.value - 1):
-                    self._keys[j] = self._keys[j + 1]
-                    self._map[j] = self._map[j + 1]
-                self.size.value -= 1
-                return True
-        return False
+        slot = self._index.pop(key, None)
+        if slot is None:
+            return False
+        self._unlink_value(slot, self._map[slot])
+        # Ячейка остаётся надгробием до уплотнения, порядок остальных не меняется
+        self._keys[slot] = _DELETED
+        self._map[slot] = None
+        self._deleted += 1
+        self.size.value -= 1
+        if self._deleted >= _COMPACT_MIN and self._deleted > self.size.value:
+            self._compact()
+        return True
 
     def get(self, key: Any) -> Any:
         """Retrieve a value by key from the map."""
-        for i in range(self.size.value):
-            if self._keys[i] == key:
-                return self._map[i]
-        return None
+        slot = self._index.get(key)
+        return None if slot is None else self._map[slot]
 
     def get_p(self, key: Any) -> Optional[ctypes.POINTER(ctypes.py_object)]: # type: ignore
         """Retrieve a pointer to the value by key from the map."""
-        for i in range(self.size.value):
-            if self._keys[i] == key:
-                return ctypes.pointer(self._map[i])
-        return None
+        slot = self._index.get(key)
+        return None if slot is None else ctypes.pointer(ctypes.py_object(self._map[slot]))
 
     def contains(self, key: Any) -> Optional[bool]:
         """Check if a key is in the map."""
-        for i in range(self.size.value):
-            if self._keys[i] == key:
-                return True
-        return False
-
-    def size(self) -> Optional[int]:
-        """Return the number of key-value pairs in the map."""
-        return self.size.value
+        return key in self._index
 
     def clear(self) -> None:
         """Remove all key-value pairs from the map."""
+        self._clear()
         self.size.value = 0
 
     def keys(self) -> Optional[List[Any]]:
         """Return a list of all keys in the map."""
-        return [self._keys[i] for i in range(self.size.value)]
+        if not self._deleted:
+            return list(self._keys)
+        return [k for k in self._keys if k is not _DELETED]
 
     def values(self) -> Optional[List[Any]]:
         """Return a list of all values in the map."""
-        return [self._map[i] for i in range(self.size.value)]
+        if not self._deleted:
+            return list(self._map)
+        return [v for k, v in zip(self._keys, self._map) if k is not _DELETED]
 
     def items(self) -> Optional[List[Any]]:
         """Return a list of all key-value pairs in the map."""
-        return [(self._keys[i], self._map[i]) for i in range(self.size.value)]
+        if not self._deleted:
+            return list(zip(self._keys, self._map))
+        return [(k, v) for k, v in zip(self._keys, self._map) if k is not _DELETED]
 
     def update(self, key: Any, value: Any) -> None:
         """Update the value for a given key in the map."""
-        for i in range(self.size.value):
-            if self._keys[i] == key:
-                self._map[i] = ctypes.py_object(value)
-                return
-        raise KeyError(f"Key {key} not found in map.")
+        slot = self._index.get(key)
+        if slot is None:
+            raise KeyError(f"Key {key} not found in map.")
+        self._set(slot, value)
 
-    def merge(self, other_map: 'ArmMap') -> None:
-        """Merge another map into this map."""
-        for i in range(other_map.size()):
-            self.add(other_map._keys[i], other_map._map[i])
+    def merge(self, other_map: 'Map') -> None:
+        """Merge another map into this map, overwriting the values of shared keys."""
+        for key, value in other_map.items():
+            self.put(key, value)
 
     def get_key(self, value: Any) -> Any:
-        """Retrieve a key by value from the map."""
-        for i in range(self.size.value):
-            if self._map[i] == value:
-                return self._keys[i]
-        return None
+        """Retrieve the first inserted key holding the given value."""
+        found = None
+        try:
+            slots = self._reverse.get(value)
+        except TypeError:
+            slots = None
+        if slots:
+            found = slots[0]
+        # Нехешируемые значения индексом не покрыты, их немного просматриваем напрямую
+        for slot, candidate in self._unhashable.items():
+            if (found is None or slot < found) and candidate == value:
+                found = slot
+        return None if found is None else self._keys[found]
 
     def is_empty(self) -> Optional[bool]:
         """Check if the map is empty."""
@@ -145,4 +206,4 @@ class Map:
     
     def __str__(self) -> Optional[str]:
         """Return a string representation of the map."""
-        return str({self._keys[i]: self._map[i] for i in range(self.size.value)})
+        return str(dict(self.items()))
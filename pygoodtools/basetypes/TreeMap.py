@@ -22,29 +22,33 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
-import ctypes
-from typing import List, Optional, Any, Union
-
-class TreeNode(ctypes.Structure):
-    _fields_ = [
-        ("key", ctypes.py_object),
-        ("value", ctypes.py_object),
-        ("left", ctypes.POINTER(ctypes.py_object)),
-        ("right", ctypes.POINTER(ctypes.py_object)),
-        ("height", ctypes.c_int)
-    ]
-
-    def __init__(self, key: Any = None, value: Any = None, *args: Any, **kw: Any):
-        super().__init__(*args, **kw)
+from typing import Any, Iterator, List, Optional, Tuple, Union
+
+
+class TreeNode:
+    """
+    Node of the AVL tree. `size` is the number of nodes in the subtree rooted here,
+    which makes rank and select queries logarithmic.
+    """
+    __slots__ = ('key', 'value', 'left', 'right', 'height', 'size')
+
+    def __init__(self, key: Any = None, value: Any = None):
         self.key = key
         self.value = value
         self.left = None
         self.right = None
         self.height = 1
+        self.size = 1
+
 
 class TreeMap:
     """
-    TreeMap: Balanced binary search tree (AVL tree) using ctypes for memory management.
+    TreeMap: Balanced binary search tree (AVL tree) with ordered iteration.
+
+    Insertion, lookup and removal walk the tree iteratively and rebalance along the
+    recorded path, so deep trees never hit the recursion limit. Iteration, range
+    scans and the neighbour queries (`floor`, `ceiling`, `first`, `last`) are lazy,
+    and every node keeps the size of its subtree for `rank` and `select`.
     """
 
     def __init__(self):
@@ -58,8 +62,18 @@ class TreeMap:
         return node.height
 
     def _update_height(self, node: TreeNode) -> None:
-        """Updates the height of the node based on its children."""
-        node.height = 1 + max(self._height(node.left), self._height(node.right))
+        """Updates the height and the subtree size of the node based on its children."""
+        left, right = node.left, node.right
+        if left is None:
+            if right is None:
+                node.height, node.size = 1, 1
+            else:
+                node.height, node.size = right.height + 1, right.size + 1
+        elif right is None:
+            node.height, node.size = left.height + 1, left.size + 1
+        else:
+            node.height = (left.height if left.height > right.height else right.height) + 1
+            node.size = left.size + right.size + 1
 
     def _balance_factor(self, node: TreeNode) -> int:
         """Calculates and returns the balance factor of the node."""
@@ -100,47 +114,256 @@ class TreeMap:
 
         return node
 
-    def _put(self, node: Optional[TreeNode], key: Any, value: Any) -> TreeNode:
-        """Recursively inserts the key-value pair into the tree."""
+    def _rebalance(self, path: List[TreeNode], delta: int) -> None:
+        """
+        Rebalances the nodes of `path` bottom-up after their subtree sizes changed by
+        `delta`, relinking rotated subtrees. Once a node keeps its height without a
+        rotation the ancestors above it only need their sizes adjusted.
+        """
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            left, right = node.left, node.right
+            lh = 0 if left is None else left.height
+            rh = 0 if right is None else right.height
+            if -1 <= lh - rh <= 1:
+                height = (lh if lh > rh else rh) + 1
+                if height == node.height:
+                    # Выше высоты не меняются, остаётся поправить размеры
+                    for j in range(i, -1, -1):
+                        path[j].size += delta
+                    return
+                node.height = height
+                node.size += delta
+                continue
+            top = self._balance(node)
+            if i == 0:
+                self.root = top
+            else:
+                parent = path[i - 1]
+                if parent.left is node:
+                    parent.left = top
+                else:
+                    parent.right = top
+
+    def put(self, key: Any, value: Any) -> None:
+        """Inserts a key-value pair into the tree."""
+        node = self.root
         if node is None:
-            return TreeNode(key, value)
+            self.root = TreeNode(key, value)
+            return
+        path = []
+        append = path.append
+        while True:
+            append(node)
+            if key < node.key:
+                if node.left is None:
+                    node.left = TreeNode(key, value)
+                    break
+                node = node.left
+            elif node.key < key:
+                if node.right is None:
+                    node.right = TreeNode(key, value)
+                    break
+                node = node.right
+            else:
+                node.value = value
+                return
+        self._rebalance(path, 1)
+
+    def _find(self, key: Any) -> Optional[TreeNode]:
+        """Returns the node holding `key`, or None."""
+        node = self.root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                node = node.right
+            else:
+                return node
+        return None
+
+    def get(self, key: Any) -> Union[None, Any]:
+        """Retrieves the value associated with the given key."""
+        node = self.root
+        while node is not None:
+            if key < node.key:
+                node = node.left
+            elif node.key < key:
+                node = node.right
+            else:
+                return node.value
+        return None
+
+    def remove(self, key: Any) -> bool:
+        """Removes the key and its value; returns False if the key is absent."""
+        path = []
+        node = self.root
+        while node is not None:
+            if key < node.key:
+                path.append(node)
+                node = node.left
+            elif node.key < key:
+                path.append(node)
+                node = node.right
+            else:
+                break
+        if node is None:
+            return False
+
+        if node.left is not None and node.right is not None:
+            # Узел с двумя детьми забирает ключ преемника, удаляется сам преемник
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.key, node.value = successor.key, successor.value
+            node = successor
 
-        if key < node.key:
-            node.left = self._put(node.left, key, value)
-        elif key > node.key:
-            node.right = self._put(node.right, key, value)
+        child = node.left if node.left is not None else node.right
+        if not path:
+            self.root = child
+            return True
+        parent = path[-1]
+        if parent.left is node:
+            parent.left = child
         else:
-            node.value = value
+            parent.right = child
+        self._rebalance(path, -1)
+        return True
 
-        return self._balance(node)
+    def __len__(self) -> int:
+        """Returns the number of keys in the tree."""
+        return 0 if self.root is None else self.root.size
 
-    def put(self, key: Any, value: Any) -> None:
-        """Inserts a key-value pair into the tree."""
-        self.root = self._put(self.root, key, value)
+    def __contains__(self, key: Any) -> bool:
+        """Checks if the given key exists in the tree."""
+        return self._find(key) is not None
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterates over the keys in order."""
+        return (key for key, _ in self.items())
+
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        """Lazily yields key-value pairs in in-order."""
+        return self.irange()
+
+    def keys(self) -> Iterator[Any]:
+        """Lazily yields the keys in order."""
+        return (key for key, _ in self.irange())
+
+    def values(self) -> Iterator[Any]:
+        """Lazily yields the values in key order."""
+        return (value for _, value in self.irange())
+
+    def irange(self, lo: Any = None, hi: Any = None, inclusive: Tuple[bool, bool] = (True, True),
+               reverse: bool = False) -> Iterator[Tuple[Any, Any]]:
+        """
+        Lazily yields the key-value pairs with `lo <= key <= hi` in key order.
+        None leaves a bound open; `inclusive` makes either bound strict and
+        `reverse` walks from `hi` down to `lo`.
+        """
+        if reverse:
+            return self._irange_reverse(lo, hi, inclusive)
+        return self._irange(lo, hi, inclusive)
+
+    def _irange(self, lo: Any, hi: Any, inclusive: Tuple[bool, bool]) -> Iterator[Tuple[Any, Any]]:
+        """Forward range scan over an explicit stack of pending ancestors."""
+        lo_inclusive, hi_inclusive = inclusive
+        stack = []
+        node = self.root
+        # Спускаемся к первому ключу не меньше нижней границы
+        while node is not None:
+            if lo is None or lo < node.key or (lo_inclusive and not node.key < lo):
+                stack.append(node)
+                node = node.left
+            else:
+                node = node.right
+        while stack:
+            node = stack.pop()
+            key = node.key
+            if hi is not None and (hi < key or (not hi_inclusive and not key < hi)):
+                return
+            yield key, node.value
+            node = node.right
+            while node is not None:
+                stack.append(node)
+                node = node.left
+
+    def _irange_reverse(self, lo: Any, hi: Any, inclusive: Tuple[bool, bool]) -> Iterator[Tuple[Any, Any]]:
+        """Backward range scan, the mirror image of `_irange`."""
+        lo_inclusive, hi_inclusive = inclusive
+        stack = []
+        node = self.root
+        while node is not None:
+            if hi is None or node.key < hi or (hi_inclusive and not hi < node.key):
+                stack.append(node)
+                node = node.right
+            else:
+                node = node.left
+        while stack:
+            node = stack.pop()
+            key = node.key
+            if lo is not None and (key < lo or (not lo_inclusive and not lo < key)):
+                return
+            yield key, node.value
+            node = node.left
+            while node is not None:
+                stack.append(node)
+                node = node.right
 
-    def _get(self, node: Optional[TreeNode], key: Any) -> Union[None, Any]:
-        """Recursively retrieves the value associated with the key."""
+    def floor(self, key: Any) -> Optional[Tuple[Any, Any]]:
+        """Returns the pair with the greatest key not above `key`, or None."""
+        return next(self._irange_reverse(None, key, (True, True)), None)
+
+    def ceiling(self, key: Any) -> Optional[Tuple[Any, Any]]:
+        """Returns the pair with the smallest key not below `key`, or None."""
+        return next(self._irange(key, None, (True, True)), None)
+
+    def first(self) -> Optional[Tuple[Any, Any]]:
+        """Returns the pair with the smallest key, or None if the tree is empty."""
+        node = self.root
         if node is None:
             return None
-        if key < node.key:
-            return self._get(node.left, key)
-        elif key > node.key:
-            return self._get(node.right, key)
-        return node.value
+        while node.left is not None:
+            node = node.left
+        return node.key, node.value
 
-    def get(self, key: Any) -> Union[None, Any]:
-        """Retrieves the value associated with the given key."""
-        return self._get(self.root, key)
-
-    def _inorder(self, node: Optional[TreeNode], result: List) -> None:
-        """Performs an in-order traversal of the tree."""
-        if node is not None:
-            self._inorder(node.left, result)
-            result.append((node.key, node.value))
-            self._inorder(node.right, result)
-
-    def items(self) -> List:
-        """Returns a list of key-value pairs in in-order."""
-        result = []
-        self._inorder(self.root, result)
-        return result
+    def last(self) -> Optional[Tuple[Any, Any]]:
+        """Returns the pair with the greatest key, or None if the tree is empty."""
+        node = self.root
+        if node is None:
+            return None
+        while node.right is not None:
+            node = node.right
+        return node.key, node.value
+
+    def rank(self, key: Any) -> int:
+        """Returns the number of keys strictly less than `key`."""
+        rank = 0
+        node = self.root
+        while node is not None:
+            if node.key < key:
+                rank += 1 if node.left is None else node.left.size + 1
+                node = node.right
+            else:
+                node = node.left
+        return rank
+
+    def select(self, index: int) -> Tuple[Any, Any]:
+        """Returns the key-value pair at position `index` in key order; negative indexes count from the end."""
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("TreeMap index out of range")
+        node = self.root
+        while True:
+            left = 0 if node.left is None else node.left.size
+            if index < left:
+                node = node.left
+            elif index == left:
+                return node.key, node.value
+            else:
+                index -= left + 1
+                node = node.right
@@ -23,7 +23,16 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 import ctypes
-from typing import Any, List, final
+from typing import Any, Dict, Iterable, List, Optional, final
+
+from ._buffers import as_list
+
+# Маркер удалённой позиции в позиционном индексе
+_REMOVED = object()
+# Минимальное число дыр, после которого индекс уплотняется при удалении
+_COMPACT_MIN = 16
+
+
 class UniqueMapNode(ctypes.Structure):
     _fields_ = [
         ("key", ctypes.py_object),
@@ -33,16 +42,40 @@ class UniqueMapNode(ctypes.Structure):
 @final
 class UniqueMap:
     """
-    Unique map class using ctypes for memory efficiency.
-    Maintains a collection of unique elements in the order of their insertion.
+    Unique map class backed by a single insertion-ordered dict.
+    Maintains a collection of unique elements in the order of their insertion,
+    with O(1) add, remove and membership tests.
+
+    Positional access (`item_at`, `index`) uses a slot list built on first use.
+    Removal only marks the slot as a hole; the list is compacted once holes
+    outnumber live items. Positions before the first hole are read directly;
+    later ones are resolved by skipping holes from the nearer end of the list.
     """
 
     def __init__(self) -> None:
         """
-        Initialize the UniqueMap instance with an empty data structure and order list.
+        Initialize the UniqueMap instance with an empty data structure.
         """
         self._data: dict = {}
-        self._order: List = []
+        self._drop_index()
+
+    def _drop_index(self) -> None:
+        """
+        Forget the positional index; it is rebuilt on the next positional query.
+        """
+        self._slots: Optional[List] = None
+        self._slot_of: Dict[Any, int] = {}
+        self._holes = 0
+        self._first_hole = 0
+
+    def _compact(self) -> None:
+        """
+        Rebuild the positional index from the dict, dropping all holes.
+        """
+        self._slots = list(self._data)
+        self._slot_of = {item: i for i, item in enumerate(self._slots)}
+        self._holes = 0
+        self._first_hole = len(self._slots)
 
     @property
     def collection(self) -> set:
@@ -56,7 +89,7 @@ class UniqueMap:
         """
         Returns the insertion order of the items in the map.
         """
-        return self._order
+        return list(self._data)
 
     @collection.setter
     def collection(self, collection: set) -> None:
@@ -70,7 +103,7 @@ class UniqueMap:
             raise ValueError('collection cannot overwrite an existing map')
 
         self._data = {item: None for item in collection}
-        self._order = list(self._data.keys())
+        self._drop_index()
 
     @order.setter
     def order(self, order: List) -> None:
@@ -83,8 +116,18 @@ class UniqueMap:
         if self._data:
             raise ValueError('order cannot overwrite an existing map')
 
-        self._order = order.copy()
-        self._data = {item: None for item in self._order}
+        self._data = {item: None for item in order}
+        self._drop_index()
+
+    def _append_slot(self, item: Any) -> None:
+        """
+        Record a new item at the end of the positional index, if it is built.
+        """
+        if self._slots is not None:
+            self._slot_of[item] = len(self._slots)
+            self._slots.append(item)
+            if not self._holes:
+                self._first_hole = len(self._slots)
 
     def add(self, item: Any) -> None:
         """
@@ -93,7 +136,19 @@ class UniqueMap:
         """
         if item not in self._data:
             self._data[item] = None
-            self._order.append(item)
+            self._append_slot(item)
+
+    def add_many(self, items: Iterable[Any]) -> None:
+        """
+        Add every item that is not present yet, keeping the order of first occurrence.
+        NumPy arrays and buffers are read as lists of Python scalars.
+        """
+        data = self._data
+        new = [item for item in dict.fromkeys(as_list(items)) if item not in data]
+        data.update(dict.fromkeys(new))
+        if self._slots is not None:
+            for item in new:
+                self._append_slot(item)
 
     def remove(self, key: Any) -> None:
         """
@@ -101,7 +156,79 @@ class UniqueMap:
         """
         if key in self._data:
             del self._data[key]
-            self._order.remove(key)
+            if self._slots is not None:
+                slot = self._slot_of.pop(key)
+                self._slots[slot] = _REMOVED
+                self._holes += 1
+                if slot < self._first_hole:
+                    self._first_hole = slot
+                if self._holes >= _COMPACT_MIN and self._holes > len(self._data):
+                    self._compact()
+
+    def difference_update(self, items: Iterable[Any]) -> None:
+        """
+        Remove every given item that is present, like `set.difference_update`.
+        """
+        others = items if isinstance(items, (set, frozenset, dict, UniqueMap)) else set(as_list(items))
+        if len(others) * 4 < len(self._data):
+            for item in others:
+                self.remove(item)
+            return
+        # Удаляется заметная часть: дешевле пересобрать словарь целиком
+        self._data = {item: value for item, value in self._data.items() if item not in others}
+        self._drop_index()
+
+    def item_at(self, position: int) -> Any:
+        """
+        Return the item at the given insertion position; negative positions count from the end.
+        """
+        size = len(self._data)
+        if position < 0:
+            position += size
+        if not 0 <= position < size:
+            raise IndexError('UniqueMap index out of range')
+        if self._slots is None:
+            self._compact()
+        slots = self._slots
+        first_hole = self._first_hole
+        if position < first_hole:
+            return slots[position]
+        # Отсчитываем живые элементы от ближайшего конца, пропуская дыры
+        if position - first_hole <= size - 1 - position:
+            live = first_hole
+            for i in range(first_hole, len(slots)):
+                if slots[i] is not _REMOVED:
+                    if live == position:
+                        return slots[i]
+                    live += 1
+        else:
+            live = size - 1
+            for i in range(len(slots) - 1, first_hole - 1, -1):
+                if slots[i] is not _REMOVED:
+                    if live == position:
+                        return slots[i]
+                    live -= 1
+        raise AssertionError('positional index is inconsistent')
+
+    def index(self, item: Any) -> int:
+        """
+        Return the insertion position of an item. Raises ValueError if it is absent.
+        """
+        if item not in self._data:
+            raise ValueError(f'{item!r} is not in UniqueMap')
+        if self._slots is None:
+            self._compact()
+        slot = self._slot_of[item]
+        first_hole = self._first_hole
+        if slot < first_hole:
+            return slot
+        # Позиция = номер ячейки минус число дыр перед ней; дыры считаем с ближней стороны
+        slots = self._slots
+        if slot - first_hole <= len(slots) - slot:
+            before = sum(1 for i in range(first_hole, slot) if slots[i] is _REMOVED)
+        else:
+            before = self._holes - sum(1 for i in range(slot + 1, len(slots)) if slots[i] is _REMOVED)
+        return slot - before
 
     def __contains__(self, key: Any) -> bool:
         """
@@ -119,7 +246,7 @@ class UniqueMap:
         """
         Iterate over the items in the map in their insertion order.
         """
-        return iter(self._order)
+        return iter(self._data)
 
     def __repr__(self) -> str:
         """
@@ -143,6 +270,8 @@ class UniqueMap:
         """
         Set an item by its key.
         """
+        if key not in self._data:
+            self._append_slot(key)
         self._data[key] = value
 
     def __delitem__(self, key: Any) -> None:
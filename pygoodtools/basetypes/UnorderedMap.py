@@ -23,7 +23,9 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 import ctypes
-from typing import Any, Dict, final
+from typing import Any, Dict, List, Optional, final
+
+from ._buffers import as_list, pairs
 
 class KeyValuePair(ctypes.Structure):
     _fields_ = [
@@ -144,9 +146,48 @@ class UnorderedMap:
         overwriting existing keys. Raises a TypeError if the argument is not of type
         UnorderedMap or dict.
         """
-        if isinstance(other, ArmUnorderedMap):
+        if isinstance(other, UnorderedMap):
             self._data.update(other._data)
         elif isinstance(other, dict):
             self._data.update(other)
         else:
             raise TypeError("Argument must be of type UnorderedMap or dict.")
+
+    @classmethod
+    def from_items(cls, items: Any, values: Optional[Any] = None) -> 'UnorderedMap':
+        """
+        Build a map from a mapping, an iterable of (key, value) pairs, or parallel
+        sequences of keys and values (NumPy arrays and buffers are accepted).
+        """
+        result = cls()
+        result.put_many(items, values)
+        return result
+
+    def put_many(self, items: Any, values: Optional[Any] = None) -> None:
+        """
+        Insert or overwrite many key-value pairs at once.
+        Accepts the same arguments as `from_items`.
+        """
+        if values is not None:
+            items = pairs(items, values)
+        self._data.update(items)
+
+    def get_many(self, keys: Any, default: Any = None) -> List[Any]:
+        """
+        Return the values of the given keys in order, `default` for missing keys.
+        """
+        get = self._data.get
+        return [get(key, default) for key in as_list(keys)]
+
+    def remove_many(self, keys: Any) -> int:
+        """
+        Remove every given key that is present and return how many were removed.
+        Unlike `remove`, missing keys are skipped instead of raising KeyError.
+        """
+        pop = self._data.pop
+        missing = object()
+        removed = 0
+        for key in as_list(keys):
+            if pop(key, missing) is not missing:
+                removed += 1
+        return removed
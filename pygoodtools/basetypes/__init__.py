@@ -29,6 +29,7 @@ from .HashMap import HashMap
 from .UnorderedMap import UnorderedMap, KeyValuePair
 from .UniqueMap import UniqueMap, UniqueMapNode
 from .TreeMap import TreeMap, TreeNode
+from .ChunkedTreeMap import ChunkedTreeMap
 
 __all__ = [
     'Void',
@@ -41,5 +42,6 @@ __all__ = [
     'UnorderedMap',
     'KeyValuePair',
     'TreeMap',
-    'TreeNode'
+    'TreeNode',
+    'ChunkedTreeMap'
 ]
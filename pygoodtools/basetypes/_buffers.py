@@ -0,0 +1,65 @@
+# COPYRIGHT (c) 2024 Massonskyi
+# All rights reserved.
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""
+Helpers for the bulk operations of the map types.
+
+Functions:
+    as_list(obj): Converts a NumPy array, `array.array` or any buffer of numbers
+        into a list of Python scalars; other iterables are returned unchanged.
+    pairs(items, values): Normalizes the arguments of `put_many`/`from_items`
+        into a sized sequence of (key, value) pairs.
+"""
+from typing import Any, Optional, Sequence, Tuple
+
+
+def as_list(obj: Any) -> Any:
+    """
+    Returns the elements of a NumPy array or a buffer as a list of Python scalars.
+    NumPy is not imported: anything with `tolist()` is converted through it, and
+    objects supporting the buffer protocol are read through a `memoryview`.
+    """
+    tolist = getattr(obj, 'tolist', None)
+    if tolist is not None:
+        return tolist()
+    try:
+        view = memoryview(obj)
+    except TypeError:
+        return obj
+    with view:
+        return view.tolist()
+
+
+def pairs(items: Any, values: Optional[Any] = None) -> Sequence[Tuple[Any, Any]]:
+    """
+    Returns a sized sequence of (key, value) pairs built from either a mapping,
+    an iterable of pairs, or parallel sequences of keys and values.
+    """
+    if values is not None:
+        keys, values = as_list(items), as_list(values)
+        if len(keys) != len(values):
+            raise ValueError("Keys and values must have the same length")
+        return list(zip(keys, values))
+    if hasattr(items, 'items'):
+        items = items.items()
+    return items if isinstance(items, (list, tuple)) else list(items)
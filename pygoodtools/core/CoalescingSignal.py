@@ -0,0 +1,152 @@
+# COPYRIGHT (c) 2024 Massonskyi
+# All rights reserved.
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""
+This module defines CoalescingSignal, a Signal that delivers accumulated emits at once.
+
+Emits are collected and flushed to the slots when `max_count` values are pending
+or, at the latest, every `window` seconds. In BATCH mode a slot receives the list
+of values emitted since the last flush; in LATEST mode it receives only the last
+one. A flush that finds nothing pending calls no slots.
+
+The timer runs only while values arrive: a window without emits stops it and the
+next emit starts it again, so an idle signal holds no scheduler entry and an
+abandoned one can be garbage collected.
+
+Classes:
+    CoalescingSignal: Batching front end for `Signal`, flushed by a `Timer`.
+"""
+import threading
+from typing import Any, Callable, List, Optional, final
+
+from .Signal import Connection, Signal
+from .Timer import Timer
+
+__all__ = ['CoalescingSignal']
+
+
+@final
+class CoalescingSignal:
+    """
+    Signal that coalesces emits over a time window or a count threshold.
+    """
+    BATCH = 'batch'
+    LATEST = 'latest'
+
+    def __init__(self, window: float = 0.1, max_count: Optional[int] = None, mode: str = BATCH) -> None:
+        """
+        Initialize the signal. The flush timer starts on the first emit after an idle window.
+        :param window: seconds between periodic flushes
+        :param max_count: flush as soon as this many values are pending
+        :param mode: BATCH to deliver lists of values, LATEST to deliver the last value
+        """
+        if mode not in (self.BATCH, self.LATEST):
+            raise ValueError(f'unknown coalescing mode: {mode!r}')
+        if window <= 0:
+            raise ValueError('window must be positive')
+        self.window = window
+        self.max_count = max_count
+        self.mode = mode
+        self._signal = Signal()
+        self._lock = threading.Lock()  # Защищает накопленные значения
+        self._flush_lock = threading.Lock()  # Сохраняет порядок доставки пачек
+        self._pending: List[Any] = []
+        self._latest: Any = None
+        self._count = 0
+        self._timer: Optional[Timer] = None
+
+    def connect(self, func: Callable, *args, **kwargs) -> Connection:
+        """
+        Connect a callback; accepts the same options as `Signal.connect`.
+        """
+        return self._signal.connect(func, *args, **kwargs)
+
+    def disconnect(self, func: Any) -> None:
+        """
+        Disconnect a callback or a `Connection` handle.
+        """
+        self._signal.disconnect(func)
+
+    def __len__(self) -> int:
+        """
+        Return the number of connected callbacks.
+        """
+        return len(self._signal)
+
+    def emit(self, value: Any) -> None:
+        """
+        Record a value; it is delivered with the next flush.
+        """
+        with self._lock:
+            if self.mode == self.BATCH:
+                self._pending.append(value)
+            else:
+                self._latest = value
+            self._count += 1
+            full = self.max_count is not None and self._count >= self.max_count
+            if self._timer is None:
+                self._timer = Timer(self.window, self._tick)
+                self._timer.start()
+        if full:
+            self.flush()
+
+    def _tick(self) -> None:
+        """
+        Timer callback; returns None so the periodic timer keeps running.
+        Stops the timer once a whole window passed without emits.
+        """
+        with self._lock:
+            if not self._count:
+                timer, self._timer = self._timer, None
+            else:
+                timer = None
+        if timer is not None:
+            # Запись планировщика держит сильную ссылку на self._tick: снимаем её
+            timer.stop()
+            return
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Deliver the pending values now.
+        """
+        with self._flush_lock:
+            with self._lock:
+                if not self._count:
+                    return
+                if self.mode == self.BATCH:
+                    value, self._pending = self._pending, []
+                else:
+                    value, self._latest = self._latest, None
+                self._count = 0
+            self._signal.emit(value)
+
+    def close(self) -> None:
+        """
+        Stop the flush timer and deliver what is still pending.
+        """
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.stop()
+        self.flush()
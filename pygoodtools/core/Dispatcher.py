@@ -0,0 +1,156 @@
+# COPYRIGHT (c) 2024 Massonskyi
+# All rights reserved.
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""
+This module defines a Dispatcher: a small pool of worker threads fed by a bounded queue.
+
+Signal uses it for queued connections, so a slow slot runs on a worker thread
+instead of stalling the thread that emits.
+
+Classes:
+    Dispatcher: Thread pool with a bounded task queue and an overflow policy.
+
+Overflow policies:
+    BLOCK: `submit` waits until the queue has room.
+    DROP_OLDEST: the oldest queued task is discarded to make room.
+    DROP_NEWEST: the submitted task is discarded.
+"""
+import collections
+import threading
+import traceback
+from typing import Any, Callable, Dict, Optional, Tuple, final
+
+__all__ = ['Dispatcher', 'BLOCK', 'DROP_OLDEST', 'DROP_NEWEST']
+
+BLOCK = 'block'
+DROP_OLDEST = 'drop_oldest'
+DROP_NEWEST = 'drop_newest'
+
+
+@final
+class Dispatcher:
+    """
+    Runs submitted calls on a fixed number of daemon worker threads.
+    """
+
+    def __init__(self, workers: int = 1, maxsize: int = 1024, overflow: str = BLOCK,
+                 name: str = 'Dispatcher') -> None:
+        """
+        Initialize the dispatcher. Worker threads are started on the first submit.
+        :param workers: number of worker threads
+        :param maxsize: maximum number of queued calls
+        :param overflow: what to do when the queue is full: BLOCK, DROP_OLDEST or DROP_NEWEST
+        :param name: prefix of the worker thread names
+        """
+        if overflow not in (BLOCK, DROP_OLDEST, DROP_NEWEST):
+            raise ValueError(f'unknown overflow policy: {overflow!r}')
+        if workers < 1 or maxsize < 1:
+            raise ValueError('workers and maxsize must be positive')
+        self.workers = workers
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.name = name
+        self.dropped = 0  # Число отброшенных вызовов
+        self._queue = collections.deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._threads = []
+        self._closed = False
+
+    def submit(self, func: Callable, args: Tuple = (), kwargs: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Queue a call. Returns False if the call was dropped by the DROP_NEWEST policy.
+        With BLOCK, a worker that submits into its own full dispatcher deadlocks.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('dispatcher is shut down')
+            if not self._threads:
+                self._start()
+            queue = self._queue
+            if len(queue) >= self.maxsize:
+                if self.overflow == DROP_NEWEST:
+                    self.dropped += 1
+                    return False
+                if self.overflow == DROP_OLDEST:
+                    queue.popleft()
+                    self.dropped += 1
+                else:
+                    while len(queue) >= self.maxsize and not self._closed:
+                        self._not_full.wait()
+                    if self._closed:
+                        raise RuntimeError('dispatcher is shut down')
+            queue.append((func, args, kwargs or {}))
+            self._not_empty.notify()
+            return True
+
+    def _start(self) -> None:
+        """
+        Start the worker threads; called with the lock held.
+        """
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f'{self.name}-{i}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def _work(self) -> None:
+        """
+        Worker loop: run queued calls until the dispatcher is shut down and drained.
+        """
+        queue = self._queue
+        while True:
+            with self._lock:
+                while not queue and not self._closed:
+                    self._not_empty.wait()
+                if not queue:
+                    return
+                func, args, kwargs = queue.popleft()
+                self._not_full.notify()
+            try:
+                func(*args, **kwargs)
+            except Exception:
+                # Ошибка слота не должна останавливать рабочий поток
+                traceback.print_exc()
+
+    def pending(self) -> int:
+        """
+        Return the number of queued calls.
+        """
+        return len(self._queue)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop accepting calls; workers finish the queued ones and exit.
+        :param wait: wait for the workers to exit
+        """
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+            threads = list(self._threads)
+        if wait:
+            current = threading.current_thread()
+            for thread in threads:
+                if thread is not current:
+                    thread.join()
@@ -0,0 +1,187 @@
+# COPYRIGHT (c) 2024 Massonskyi
+# All rights reserved.
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""
+This module defines the Scheduler that runs every Timer from one shared thread.
+
+Pending calls are kept in a binary heap ordered by deadline. Scheduling is
+O(log n); cancelling only clears the entry's callback, which is O(1), and the
+dead entry is skipped when it reaches the top of the heap (the heap is rebuilt
+once more than half of it is cancelled). Callbacks run on the scheduler thread,
+so a slow callback delays the others; hand long work to a `Dispatcher`.
+
+A child process created by `os.fork()` starts with every scheduler empty:
+calls scheduled in the parent, including running timers, do not run in the child.
+
+Classes:
+    Scheduler: Heap of deadlines driven by a single daemon thread.
+"""
+import heapq
+import itertools
+import os
+import threading
+import time
+import traceback
+import weakref
+from typing import Callable, List, Optional, final
+
+__all__ = ['Scheduler']
+
+# Все планировщики процесса, чтобы очистить их в дочернем процессе после fork
+_schedulers = weakref.WeakSet()
+
+
+@final
+class Scheduler:
+    """
+    Calls callbacks at monotonic-clock deadlines from a single daemon thread.
+    """
+    _default: Optional['Scheduler'] = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, name: str = 'Scheduler') -> None:
+        """
+        Initialize the scheduler. The thread is started by the first `call_at`.
+        :param name: name of the scheduler thread
+        """
+        self.name = name
+        self._heap: List[list] = []  # Элементы [срок, номер, callback]
+        self._cond = threading.Condition()
+        self._counter = itertools.count()
+        self._cancelled = 0
+        self._thread: Optional[threading.Thread] = None
+        _schedulers.add(self)
+
+    @classmethod
+    def default(cls) -> 'Scheduler':
+        """
+        Return the scheduler shared by all timers that do not name one.
+        """
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def call_at(self, deadline: float, callback: Callable[[], None]) -> list:
+        """
+        Schedule `callback` at the `time.monotonic()` deadline.
+        :return: entry to pass to `cancel`
+        """
+        entry = [deadline, next(self._counter), callback]
+        with self._cond:
+            heapq.heappush(self._heap, entry)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._loop, name=self.name, daemon=True)
+                self._thread.start()
+            if self._heap[0] is entry:
+                # Новый ближайший срок: будим поток, чтобы он пересчитал ожидание
+                self._cond.notify()
+        return entry
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> list:
+        """
+        Schedule `callback` after `delay` seconds.
+        :return: entry to pass to `cancel`
+        """
+        return self.call_at(time.monotonic() + delay, callback)
+
+    def cancel(self, entry: list) -> None:
+        """
+        Cancel a scheduled call. Cancelling a call that already ran does nothing.
+        """
+        with self._cond:
+            if entry[2] is None:
+                return
+            entry[2] = None
+            self._cancelled += 1
+            if self._cancelled > len(self._heap) // 2:
+                self._heap = [e for e in self._heap if e[2] is not None]
+                heapq.heapify(self._heap)
+                self._cancelled = 0
+
+    def pending(self) -> int:
+        """
+        Return the number of scheduled, not cancelled calls.
+        """
+        return len(self._heap) - self._cancelled
+
+    def in_scheduler_thread(self) -> bool:
+        """
+        Check whether the caller runs on the scheduler thread.
+        """
+        return threading.current_thread() is self._thread
+
+    def _reset_after_fork(self) -> None:
+        """
+        Forget the calls inherited from the parent process.
+        """
+        for entry in self._heap:
+            # Отменённая запись: cancel() из дочернего процесса ничего не сделает
+            entry[2] = None
+        self._heap = []
+        self._cond = threading.Condition()
+        self._cancelled = 0
+        self._thread = None
+
+    def _loop(self) -> None:
+        """
+        Scheduler thread: wait for the earliest deadline and run its callback.
+        """
+        while True:
+            with self._cond:
+                while True:
+                    heap = self._heap
+                    if not heap:
+                        self._cond.wait()
+                        continue
+                    entry = heap[0]
+                    if entry[2] is None:
+                        heapq.heappop(heap)
+                        self._cancelled -= 1
+                        continue
+                    delay = entry[0] - time.monotonic()
+                    if delay <= 0:
+                        heapq.heappop(heap)
+                        callback, entry[2] = entry[2], None
+                        break
+                    self._cond.wait(delay)
+            try:
+                callback()
+            except Exception:
+                # Ошибка одного таймера не должна останавливать остальные
+                traceback.print_exc()
+            # Не держим последний callback, пока поток ждёт следующий срок
+            callback = entry = None
+
+
+def _after_fork_in_child() -> None:
+    """
+    Reset the schedulers inherited by a forked child process.
+    """
+    Scheduler._default_lock = threading.Lock()
+    for scheduler in list(_schedulers):
+        scheduler._reset_after_fork()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -22,57 +22,231 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
-import ctypes
+import asyncio
+import functools
+import inspect
 import threading
-from typing import Callable, final
+import weakref
+from typing import Any, Callable, Optional, Tuple, final
+
+from .Dispatcher import Dispatcher
+
+_default_dispatcher: Optional[Dispatcher] = None
+_default_lock = threading.Lock()
+# Минимальное число мёртвых соединений, после которого кортеж уплотняется
+_COMPACT_MIN = 8
+
+
+def _shared_dispatcher() -> Dispatcher:
+    """
+    Return the dispatcher used by queued connections that do not name one.
+    """
+    global _default_dispatcher
+    with _default_lock:
+        if _default_dispatcher is None:
+            _default_dispatcher = Dispatcher(workers=1, name='Signal')
+        return _default_dispatcher
+
+
+@final
+class Connection:
+    """
+    Handle returned by `Signal.connect`. Disconnecting through it is O(1): the
+    connection is only flagged dead and skipped by `emit`; the signal drops dead
+    connections from its slot tuple once they make up half of it.
+    """
+    __slots__ = ('signal', 'alive', 'invoke', '_func', '_ref', '__weakref__')
+
+    def __init__(self, signal: 'Signal', func: Optional[Callable], ref: Optional[weakref.ref]) -> None:
+        """
+        Initialize the handle. Exactly one of `func` (strong) and `ref` (weak) is set.
+        """
+        self.signal = signal
+        self.alive = True
+        self.invoke: Callable = func
+        self._func = func
+        self._ref = ref
+
+    @property
+    def func(self) -> Optional[Callable]:
+        """
+        The connected callback, or None if a weakly referenced callback was collected.
+        """
+        return self._func if self._ref is None else self._ref()
+
+    @property
+    def weak(self) -> bool:
+        """
+        True if the connection holds only a weak reference to the callback.
+        """
+        return self._ref is not None
+
+    def disconnect(self) -> None:
+        """
+        Disconnect the callback. Disconnecting twice does nothing.
+        """
+        self.signal._release(self)
+
+    def __repr__(self) -> str:
+        """
+        Return the representation of the connection.
+        """
+        state = 'alive' if self.alive else 'dead'
+        return f'<Connection {self.func!r} {state}{" weak" if self.weak else ""}>'
+
 
 @final
 class Signal:
     """
     Callback class to be called when an event occurs.
-    Optimized for ARM architecture with low-level improvements.
+
+    Connections are kept in an immutable tuple. `connect` builds a new tuple
+    under a lock and swaps it in with a single assignment, so `emit` reads the
+    current snapshot and iterates it without locking or copying. Slots added
+    while an emit is running are called from the next emit; a disconnected slot
+    is not called again, even by an emit already in progress.
+
+    `connect` returns a `Connection` handle whose `disconnect` is O(1).
+    With `weak=True` the signal keeps only a `weakref.WeakMethod` (bound methods)
+    or `weakref.ref` to the callback, so subscribers can be garbage collected;
+    connections whose target is gone are dropped lazily by the next emit.
+
+    Every connection has a dispatch mode, like Qt connection types:
+        DIRECT: the slot runs on the emitting thread.
+        QUEUED: the call is queued onto a `Dispatcher` thread pool; its bounded
+            queue and overflow policy decide what happens under backlog. The
+            shared default dispatcher has one worker, so queued calls run one at
+            a time in emit order; a dispatcher with several workers runs them
+            concurrently and gives no ordering guarantee.
+        LOOP: the call is scheduled on an asyncio event loop; coroutine slots
+            are run as tasks on that loop.
     """
+    DIRECT = 'direct'
+    QUEUED = 'queued'
+    LOOP = 'loop'
 
     def __init__(self) -> None:
         """
         Initialize the callback class.
         """
-        self._lock = threading.Lock()  # Добавлена блокировка для потокобезопасности
-        self._slots = (ctypes.py_object * 64)()  # Увеличен размер буфера до 64
-        self._slot_count = ctypes.c_int(0)
-    
-    def connect(self, func: Callable) -> None:
+        self._lock = threading.Lock()  # Сериализует только изменения списка слотов
+        self._slots: Tuple[Connection, ...] = ()
+        self._dead = 0  # Отключённые соединения, ещё лежащие в кортеже
+
+    def connect(self, func: Callable, mode: str = DIRECT, dispatcher: Optional[Dispatcher] = None,
+                loop: Optional[asyncio.AbstractEventLoop] = None, weak: bool = False) -> Connection:
         """
         Connect a callback to the event signals.
+        :param func: callback
+        :param mode: DIRECT, QUEUED or LOOP
+        :param dispatcher: thread pool for QUEUED; a shared single-thread pool by default
+        :param loop: event loop for LOOP; the running loop by default
+        :param weak: hold the callback through a weak reference
+        :return: connection handle
         """
         if not callable(func):
             raise ValueError('callback must be callable')
-        
-        with self._lock:  # Блокировка для атомарной операции
-            if self._slot_count.value < len(self._slots):
-                self._slots[self._slot_count.value] = ctypes.py_object(func)
-                self._slot_count.value += 1
+        if mode == Signal.QUEUED:
+            dispatcher = dispatcher or _shared_dispatcher()
+        elif mode == Signal.LOOP and loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                raise ValueError('LOOP connections need an event loop') from None
+        elif mode != Signal.DIRECT:
+            raise ValueError(f'unknown dispatch mode: {mode!r}')
+
+        if weak:
+            ref = weakref.WeakMethod(func) if inspect.ismethod(func) else weakref.ref(func)
+            connection = Connection(self, None, ref)
+            connection.invoke = self._weak_invoker(connection, ref, mode, dispatcher, loop)
+        else:
+            connection = Connection(self, func, None)
+            connection.invoke = self._invoker(func, mode, dispatcher, loop)
+
+        with self._lock:
+            self._slots = self._slots + (connection,)
+        return connection
+
+    @staticmethod
+    def _invoker(func: Callable, mode: str, dispatcher: Optional[Dispatcher],
+                 loop: Optional[asyncio.AbstractEventLoop]) -> Callable:
+        """
+        Build the callable that delivers an emit to `func` in the given mode.
+        """
+        if mode == Signal.DIRECT:
+            return func
+        if mode == Signal.QUEUED:
+            submit = dispatcher.submit
+
+            def queued(*args, **kwargs):
+                submit(func, args, kwargs)
+            return queued
+        if inspect.iscoroutinefunction(func):
+            def scheduled(*args, **kwargs):
+                asyncio.run_coroutine_threadsafe(func(*args, **kwargs), loop)
+        else:
+            def scheduled(*args, **kwargs):
+                loop.call_soon_threadsafe(functools.partial(func, *args, **kwargs))
+        return scheduled
+
+    @staticmethod
+    def _weak_invoker(connection: Connection, ref: weakref.ref, mode: str, dispatcher: Optional[Dispatcher],
+                      loop: Optional[asyncio.AbstractEventLoop]) -> Callable:
+        """
+        Build the invoker of a weak connection: it resolves the reference on every
+        emit and disconnects itself once the target has been collected.
+        """
+        def weak(*args, **kwargs):
+            target = ref()
+            if target is None:
+                connection.disconnect()
+                return
+            if mode == Signal.DIRECT:
+                target(*args, **kwargs)
             else:
-                raise OverflowError('Maximum number of callbacks reached')
-    
-    def disconnect(self, func: Callable) -> None:
+                Signal._invoker(target, mode, dispatcher, loop)(*args, **kwargs)
+        return weak
+
+    def _release(self, connection: Connection) -> None:
+        """
+        Flag a connection dead; compact the slot tuple once dead connections are half of it.
+        """
+        with self._lock:
+            if not connection.alive:
+                return
+            connection.alive = False
+            self._dead += 1
+            if self._dead >= _COMPACT_MIN and 2 * self._dead >= len(self._slots):
+                self._slots = tuple(c for c in self._slots if c.alive)
+                self._dead = 0
+
+    def disconnect(self, func: Any) -> None:
         """
         Disconnect a callback from the event signals.
+        Accepts a `Connection` handle (O(1)) or the connected callback itself,
+        which is looked up among the live connections.
         """
+        if isinstance(func, Connection):
+            if func.signal is not self:
+                raise ValueError('connection belongs to another signal')
+            func.disconnect()
+            return
         if not callable(func):
             raise ValueError('callback must be callable')
 
-        # Удаление функции, минимизируя операции с памятью
-        with self._lock:  # Блокировка для атомарной операции
-            for i in range(self._slot_count.value):
-                if self._slots[i] == ctypes.py_object(func):
-                    # Оптимизированное удаление O(1) вместо O(n)
-                    self._slots[i] = self._slots[self._slot_count.value - 1]
-                    self._slots[self._slot_count.value - 1] = None
-                    self._slot_count.value -= 1
-                    return
-            raise ValueError('callback not connected')
-        
+        for connection in self._slots:
+            if connection.alive and connection.func == func:
+                self._release(connection)
+                return
+        raise ValueError('callback not connected')
+
+    def __len__(self) -> int:
+        """
+        Return the number of connected callbacks.
+        """
+        return len(self._slots) - self._dead
+
     def emit(self, *args, **kwargs) -> None:
         """
         Emit an event.
@@ -80,11 +254,7 @@ class Signal:
             *args: positional arguments
             **kwargs: keyword arguments
         """
-        # Прямой вызов функций с передачей аргументов
-        count = self._slot_count.value
-        callbacks = [self._slots[i] for i in range(count)]
-        
-        # Выполняем без блокировки для минимизации времени удержания lock
-        for callback in callbacks:
-            if callback:
-                callback(*args, **kwargs)
+        # Снимок слотов неизменяем, поэтому обходится без блокировки
+        for connection in self._slots:
+            if connection.alive:
+                connection.invoke(*args, **kwargs)
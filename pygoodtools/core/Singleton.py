@@ -34,6 +34,7 @@ Metaclass:
         
         Attributes:
             _instances (dict): A dictionary to store the singleton instances.
+            _locks (dict): A per-class lock guarding the first construction.
         
         Methods:
             __call__(cls, *args, **kwargs):
@@ -45,15 +46,41 @@ Metaclass:
                 
                 Returns:
                     object: The singleton instance of the class.
+
+            reset_instance(cls, teardown=None):
+                Forget the instance of `cls`, optionally passing it to `teardown`.
+
+            reset_all(teardown=None):
+                Forget the instances of every singleton class.
+
+Instances are created with double-checked locking on a per-class lock, and a
+child process created by `os.fork()` starts without any instances.
 """
+import os
+import threading
+
 __all__ = ['Singleton']
 
 
+_MISSING = object()
+
+
 class Singleton(type):
     """
     Metaclass for singleton classes.
     """
     _instances = {}
+    _locks = {}
+
+    def __init__(cls, name, bases, attrs):
+        """
+        Create the construction lock of the new class.
+        :param name: class name
+        :param bases: base classes
+        :param attrs: class attributes
+        """
+        super().__init__(name, bases, attrs)
+        Singleton._locks[cls] = threading.Lock()
 
     def __call__(cls, *args, **kwargs):
         """
@@ -62,7 +89,46 @@ class Singleton(type):
         :param kwargs: keyword arguments
         :return: singleton instance
         """
-        if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
+        instance = cls._instances.get(cls, _MISSING)
+        if instance is _MISSING:
+            # Блокировка своя у каждого класса, конструкторы разных классов не мешают друг другу
+            with Singleton._locks[cls]:
+                instance = cls._instances.get(cls, _MISSING)
+                if instance is _MISSING:
+                    instance = super(Singleton, cls).__call__(*args, **kwargs)
+                    cls._instances[cls] = instance
+        return instance
+
+    def reset_instance(cls, teardown=None):
+        """
+        Forget the singleton instance so the next call builds a new one.
+        :param teardown: optional callable receiving the dropped instance
+        :return: the dropped instance or None
+        """
+        with Singleton._locks[cls]:
+            instance = cls._instances.pop(cls, None)
+        if instance is not None and teardown is not None:
+            teardown(instance)
+        return instance
+
+    @classmethod
+    def reset_all(mcs, teardown=None):
+        """
+        Forget the instances of all singleton classes.
+        :param teardown: optional callable receiving every dropped instance
+        """
+        for cls in list(mcs._instances):
+            mcs.reset_instance(cls, teardown)
+
+    @classmethod
+    def _after_fork_in_child(mcs):
+        """
+        Drop inherited instances and locks in a forked child process.
+        """
+        mcs._instances.clear()
+        for cls in mcs._locks:
+            mcs._locks[cls] = threading.Lock()
+
 
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=Singleton._after_fork_in_child)
@@ -25,6 +25,11 @@
 """
 ArmTimer is a high-performance timer class designed to execute a callback function at specified intervals. 
 It is optimized for speed, CPU, and memory usage compared to standard timers.
+
+Timers do not own threads: every timer is an entry in a shared `Scheduler` heap
+driven by one thread, so starting, stopping and rescheduling are O(log n) and
+thousands of timers cost no more threads than one. Callbacks run on the
+scheduler thread.
 Attributes:
     interval (float): Time interval in seconds.
     callback (Callable): Function to be called when the timer expires.
@@ -48,6 +53,8 @@ import threading
 import time
 from typing import Callable, List, Optional, final
 
+from .Scheduler import Scheduler
+
 @final
 class Timer:
     def __init__(self, 
@@ -67,8 +74,12 @@ class Timer:
         self.interval = interval
         self.callback = callback
         self.single_shot = single_shot
-        self._timer_thread: Optional[threading.Thread] = None
-        self._stop_event = threading.Event()
+        self._scheduler = Scheduler.default()
+        self._entry: Optional[list] = None  # Запланированный вызов в планировщике
+        self._active = False
+        self._next_call = 0.0
+        self._idle = threading.Event()  # Сброшен, пока выполняется callback
+        self._idle.set()
         
         # Parse additional positional arguments
         self.argv = argv if argv is not None else []
@@ -80,7 +91,7 @@ class Timer:
         
     def setInterval(self, interval: float) -> None:
         """
-        Set the timer interval.
+        Set the timer interval. It applies from the next scheduled call.
 
         :param interval: Time interval in seconds.
         """
@@ -91,57 +102,67 @@ class Timer:
         for key, value in kwargs.items():
             if key == '_ext':
                 setattr(self, key, value)
+            elif key == '_scheduler':
+                # Собственный планировщик вместо общего
+                self._scheduler = value
             # Add more keyword arguments if needed
 
     def _run(self):
         """
-        Run the timer and execute the callback function.
+        Execute the callback function once and schedule the next call.
         """
-        print('Timer is running...')
-        next_call = time.perf_counter()
-        while not self._stop_event.is_set():
-            with self._lock:  # Защищаем чтение интервала
-                current_interval = self.interval
-            next_call += current_interval
-            time_to_sleep = next_call - time.perf_counter()
-            if time_to_sleep > 0:
-                time.sleep(time_to_sleep)
-            
-            if self._stop_event.is_set():
-                break
-            
+        with self._lock:
+            if not self._active:
+                return
+            self._idle.clear()
+        try:
             result = self.callback(*self.argv) if self.argv else self.callback()
+        except BaseException:
+            # Как и прежде, исключение в callback останавливает таймер
+            with self._lock:
+                self._active = False
+                self._entry = None
+            raise
+        finally:
+            self._idle.set()
 
-            if result is None:
-                continue
-            
+        if result is not None:
             if hasattr(self, '_ext'):
                 self._ext.emit(result)
             else:
                 print(f"WARNING! Function {self.callback.__name__} returned a raw result, to process the result, add signal=\n")
 
-            if self.single_shot:
-                break
+        with self._lock:
+            if not self._active or (self.single_shot and result is not None):
+                self._active = False
+                self._entry = None
+                return
+            # Расписание без дрейфа: следующий срок отсчитывается от предыдущего
+            self._next_call += self.interval
+            self._entry = self._scheduler.call_at(self._next_call, self._run)
     
     def start(self):
         """
         Start the timer
         """
         with self._lock:  # Защищаем запуск блокировкой
-            if self._timer_thread is None or not self._timer_thread.is_alive():
-                self._stop_event.clear()
-                self._timer_thread = threading.Thread(target=self._run, daemon=True)
-                self._timer_thread.start()
+            if not self._active:
+                self._active = True
+                self._next_call = time.monotonic() + self.interval
+                self._entry = self._scheduler.call_at(self._next_call, self._run)
         
     def stop(self):
         """
         Stop the timer
         """
-        if not self._timer_thread:
-            return
-        self._stop_event.set()
         with self._lock:  # Защищаем остановку блокировкой
-            if self._timer_thread.is_alive():
-                self._timer_thread.join(timeout=1)
-                if self._timer_thread.is_alive():
-                    print("Warning: Thread did not terminate properly")
\ No newline at end of file
+            if not self._active:
+                return
+            self._active = False
+            if self._entry is not None:
+                self._scheduler.cancel(self._entry)
+                self._entry = None
+        # Дожидаемся уже начатого вызова, если останавливают из другого потока
+        if not self._scheduler.in_scheduler_thread():
+            if not self._idle.wait(timeout=1):
+                print("Warning: Thread did not terminate properly")
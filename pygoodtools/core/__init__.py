@@ -23,10 +23,13 @@
 # POSSIBILITY OF SUCH DAMAGE.
 from .Callback import Callback
 from .Pointer import Pointer
-from .Signal import Signal
+from .Signal import Signal, Connection
+from .Dispatcher import Dispatcher
+from .CoalescingSignal import CoalescingSignal
 from .SmartPointer import SmartPointer
 from .TimeitPtr import TimeitPtr
 from .Timer import Timer
+from .Scheduler import Scheduler
 from .Command import Command
 from .Functor import F
 from .Mediator import Mediator
@@ -39,9 +42,13 @@ __all__=[
     'Callback',
     'Pointer',
     'Signal',
+    'Connection',
+    'Dispatcher',
+    'CoalescingSignal',
     'SmartPointer',
     'TimeitPtr',
     'Timer',
+    'Scheduler',
     'Command',
     'F',
     'Mediator',
@@ -55,12 +55,14 @@ Exposed Classes:
 from .cache import lru_cache
 from .class_method_checked import ensure_method_exists
 from .context_manager import contextmanager
-from .log_calls import log_calls
+from .log_calls import log_calls, start_background_logging
 from .memoization import memoize
 from .timeit import timeit
 from .singleton import singleton
 from .type_checked import is_type
-from .retry import retry
+from .retry import retry, RetryBudget
+from .circuit_breaker import circuit_breaker, CircuitBreaker, CircuitOpenError
+from .storage import Storage, SqliteStorage
 
 
 __all__ = [
@@ -68,9 +70,16 @@ __all__ = [
     'ensure_method_exists',
     'contextmanager',
     'log_calls',
+    'start_background_logging',
     'memoize',
     'timeit',
     'singleton',
     'is_type',
     'retry',
+    'RetryBudget',
+    'circuit_breaker',
+    'CircuitBreaker',
+    'CircuitOpenError',
+    'Storage',
+    'SqliteStorage',
 ]
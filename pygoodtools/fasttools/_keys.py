@@ -0,0 +1,74 @@
+# COPYRIGHT (c) 2024 Massonskyi
+# All rights reserved.
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""
+Key builders shared by the caching decorators.
+
+A builder is chosen once, at decoration time, so the per-call work is limited
+to concatenating tuples. Keys are plain tuples: they hash and compare quickly
+and do not hold anything besides the call arguments.
+"""
+
+__all__ = ['make_key_builder']
+
+# Отделяет позиционные аргументы от именованных внутри ключа
+_KWD_MARK = (object(),)
+_FAST_TYPES = frozenset({int, str})
+
+
+def make_key_builder(typed=False):
+    """
+    Return a function `(args, kwargs) -> key` for caching call results.
+
+    Args:
+        typed (bool, optional): Cache arguments of different types separately,
+            so that f(3) and f(3.0) get different keys. Defaults to False.
+    Returns:
+        callable: The key builder.
+    """
+    if typed:
+        def make_key(args, kwargs):
+            key = args
+            if kwargs:
+                key += _KWD_MARK
+                for item in kwargs.items():
+                    key += item
+            key += tuple(type(v) for v in args)
+            if kwargs:
+                key += tuple(type(v) for v in kwargs.values())
+            return key
+
+        return make_key
+
+    def make_key(args, kwargs):
+        if kwargs:
+            key = args + _KWD_MARK
+            for item in kwargs.items():
+                key += item
+            return key
+        # Один аргумент быстрого типа сам является ключом
+        if len(args) == 1 and type(args[0]) in _FAST_TYPES:
+            return args[0]
+        return args
+
+    return make_key
@@ -23,50 +23,315 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 
+import asyncio
 import ctypes
 import functools
+import inspect
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict, namedtuple
 
-__all__ = ['lru_cache', 'LRUCache']
-__version__ = '0.1.0'
+__all__ = ['lru_cache', 'LRUCache', 'CacheStats', 'CacheInfo']
+__version__ = '0.7.0'
 __description__ = 'Кэширует результаты функции с ограничением на размер кэша.'
 
-from typing import Any
+from typing import Any, Callable, Optional
+
+from .storage import read_through
+
+CacheStats = namedtuple('CacheStats', ['hits', 'misses', 'evictions', 'expirations', 'currsize', 'currbytes'])
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+# Маркер промаха: None и другие "ложные" значения тоже можно кэшировать
+_MISSING = object()
+
 
 class LRUCache(ctypes.Structure):
-    _fields_ = [("cache", ctypes.py_object), ("order", ctypes.py_object), ("maxsize", ctypes.c_int)]
+    """
+    Least Recently Used cache with constant-time lookups and evictions.
+
+    Entries live in an ``OrderedDict`` that doubles as the recency list:
+    a hit moves the key to the end, an eviction pops the first key. Both
+    operations are O(1) regardless of ``maxsize``.
+
+    With ``thread_safe=True`` every operation runs under a single lock, so
+    the cache can be shared between threads without corrupting the order.
+
+    Entries can expire: ``ttl`` sets the default lifetime in seconds and
+    ``put(key, value, ttl=...)`` overrides it per entry. Expired entries are
+    dropped lazily on lookup, or periodically by a background thread when
+    ``sweep_interval`` is given. ``maxbytes`` adds a memory budget measured by
+    ``sizeof`` (``sys.getsizeof`` by default); the least recently used entries
+    are evicted until the cache fits both limits.
+    """
+    _fields_ = [
+        ("cache", ctypes.py_object),
+        ("maxsize", ctypes.c_int),
+        ("lock", ctypes.py_object),
+        ("ttl", ctypes.py_object),
+        ("expires", ctypes.py_object),
+        ("maxbytes", ctypes.py_object),
+        ("sizeof", ctypes.py_object),
+        ("sizes", ctypes.py_object),
+        ("currbytes", ctypes.c_longlong),
+        ("hits", ctypes.c_ulonglong),
+        ("misses", ctypes.c_ulonglong),
+        ("evictions", ctypes.c_ulonglong),
+        ("expirations", ctypes.c_ulonglong),
+        ("sweeper", ctypes.py_object),
+    ]
 
-    def __init__(self, maxsize=128, *args: Any, **kw: Any):
+    def __init__(self,
+                 maxsize=128,
+                 thread_safe=False,
+                 ttl: Optional[float] = None,
+                 maxbytes: Optional[int] = None,
+                 sizeof: Optional[Callable[[Any], int]] = None,
+                 sweep_interval: Optional[float] = None,
+                 *args: Any,
+                 **kw: Any):
         super().__init__(*args, **kw)
-        self.cache = {}
-        self.order = []
+        self.cache = OrderedDict()
         self.maxsize = maxsize
+        # Фоновая очистка работает в другом потоке, поэтому ей нужна блокировка
+        self.lock = threading.Lock() if thread_safe or sweep_interval else None
+        self.ttl = ttl
+        self.expires = {}
+        self.maxbytes = maxbytes
+        self.sizeof = (sizeof or sys.getsizeof) if maxbytes is not None else None
+        self.sizes = {} if maxbytes is not None else None
+        self.sweeper = None
+        if sweep_interval:
+            self.sweeper = _Sweeper(self, sweep_interval)
+            self.sweeper.start()
+
+    def _discard(self, key):
+        self.cache.pop(key, None)
+        self.expires.pop(key, None)
+        sizes = self.sizes
+        if sizes is not None:
+            self.currbytes -= sizes.pop(key, 0)
+
+    def _expired(self, key):
+        deadline = self.expires.get(key)
+        if deadline is not None and deadline <= time.monotonic():
+            self._discard(key)
+            self.expirations += 1
+            return True
+        return False
+
+    def _get(self, key, default=None):
+        cache = self.cache
+        if key not in cache or (self.expires and self._expired(key)):
+            self.misses += 1
+            return default
+        cache.move_to_end(key)
+        self.hits += 1
+        return cache[key]
+
+    def _peek(self, key, default=None):
+        if key not in self.cache or (self.expires and self._expired(key)):
+            return default
+        return self.cache[key]
+
+    def _put(self, key, value, ttl=None):
+        cache = self.cache
+        sizes = self.sizes
+        if sizes is not None:
+            size = self.sizeof(value)
+            if size > self.maxbytes:
+                # Значение больше всего бюджета: хранить его бессмысленно
+                self._discard(key)
+                return
+            self.currbytes += size - sizes.get(key, 0)
+            sizes[key] = size
+
+        if key in cache:
+            cache.move_to_end(key)
+        cache[key] = value
+
+        if ttl is None:
+            ttl = self.ttl
+        if ttl is not None:
+            self.expires[key] = time.monotonic() + ttl
+        elif self.expires:
+            self.expires.pop(key, None)
+
+        maxsize = self.maxsize
+        while len(cache) > maxsize or (sizes is not None and self.currbytes > self.maxbytes):
+            oldest_key, _ = cache.popitem(last=False)
+            if self.expires:
+                self.expires.pop(oldest_key, None)
+            if sizes is not None:
+                self.currbytes -= sizes.pop(oldest_key)
+            self.evictions += 1
+
+    def get(self, key, default=None):
+        """
+        Return the value for `key` and mark it as recently used, or `default` on a miss.
+        """
+        lock = self.lock
+        if lock is None:
+            return self._get(key, default)
+        with lock:
+            return self._get(key, default)
+
+    def peek(self, key, default=None):
+        """
+        Return the value for `key` without touching the recency order or the counters.
+        """
+        lock = self.lock
+        if lock is None:
+            return self._peek(key, default)
+        with lock:
+            return self._peek(key, default)
+
+    def put(self, key, value, ttl: Optional[float] = None):
+        lock = self.lock
+        if lock is None:
+            self._put(key, value, ttl)
+            return
+        with lock:
+            self._put(key, value, ttl)
+
+    def pop(self, key, default=None):
+        """
+        Remove `key` and return its value, or `default` if it is not cached.
+        """
+        lock = self.lock
+        if lock is None:
+            return self._pop(key, default)
+        with lock:
+            return self._pop(key, default)
+
+    def _pop(self, key, default=None):
+        value = self.cache.get(key, default)
+        self._discard(key)
+        return value
+
+    def sweep(self) -> int:
+        """
+        Remove every expired entry and return how many were removed.
+        """
+        lock = self.lock
+        if lock is None:
+            return self._sweep()
+        with lock:
+            return self._sweep()
+
+    def _sweep(self) -> int:
+        now = time.monotonic()
+        expired = [key for key, deadline in self.expires.items() if deadline <= now]
+        for key in expired:
+            self._discard(key)
+        self.expirations += len(expired)
+        return len(expired)
+
+    def stats(self) -> CacheStats:
+        """
+        Return the hit, miss, eviction and expiration counters with the current size.
+        """
+        return CacheStats(self.hits, self.misses, self.evictions, self.expirations,
+                          len(self.cache), self.currbytes)
+
+    def clear(self) -> None:
+        """
+        Remove all entries and reset the counters.
+        """
+        lock = self.lock
+        if lock is None:
+            self._clear()
+            return
+        with lock:
+            self._clear()
+
+    def _clear(self) -> None:
+        self.cache.clear()
+        self.expires.clear()
+        if self.sizes is not None:
+            self.sizes.clear()
+        self.currbytes = 0
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def close(self) -> None:
+        """
+        Stop the background sweep thread, if any.
+        """
+        sweeper = self.sweeper
+        if sweeper is not None:
+            sweeper.stop()
+            self.sweeper = None
+
+    def __len__(self):
+        return len(self.cache)
+
+
+class _Sweeper(threading.Thread):
+    """
+    Daemon thread that periodically removes expired entries from an LRUCache.
+    Holds only a weak reference, so an abandoned cache can still be collected.
+    """
+
+    def __init__(self, cache: LRUCache, interval: float):
+        super().__init__(name='LRUCacheSweeper', daemon=True)
+        self._cache = weakref.ref(cache)
+        self._interval = interval
+        self._stop_event = threading.Event()
 
-    def get(self, key):
-        if key in self.cache:
-            self.order.remove(key)
-            self.order.append(key)
-            return self.cache[key]
-        return None
-
-    def put(self, key, value):
-        if key in self.cache:
-            self.order.remove(key)
-        self.cache[key] = value
-        self.order.append(key)
-        if len(self.order) > self.maxsize:
-            oldest_key = self.order.pop(0)
-            del self.cache[oldest_key]
-
-def lru_cache(maxsize=128):
+    def run(self):
+        while not self._stop_event.wait(self._interval):
+            cache = self._cache()
+            if cache is None:
+                return
+            cache.sweep()
+            del cache
+
+    def stop(self):
+        self._stop_event.set()
+
+
+class _InFlight:
+    """
+    A computation in progress for one key, shared by all threads that miss on it.
+    """
+    __slots__ = ('event', 'result', 'error')
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def lru_cache(maxsize=128, thread_safe=False, ttl=None, maxbytes=None, sizeof=None, sweep_interval=None,
+              storage=None):
     """
     Decorator to implement a Least Recently Used (LRU) cache.
     Args:
         maxsize (int, optional): The maximum size of the cache. Defaults to 128.
+        thread_safe (bool, optional): Guard the cache with a lock and coalesce concurrent
+            misses on the same key into a single call. Defaults to False.
+        ttl (float, optional): Lifetime of a cached result in seconds. Defaults to None (no expiry).
+        maxbytes (int, optional): Memory budget for cached results, measured by `sizeof`.
+        sizeof (callable, optional): Returns the size of a result in bytes. Defaults to `sys.getsizeof`.
+        sweep_interval (float, optional): Period in seconds of the background removal of expired results.
+        storage (Storage, optional): Persistent backend consulted on a miss, e.g. `SqliteStorage('cache.db')`.
     Returns:
         function: A decorator that wraps a function with LRU caching.
     The LRU cache stores the results of function calls and reuses them when the same inputs occur again, 
     up to a maximum number of cached items specified by `maxsize`. When the cache exceeds `maxsize`, 
     the least recently used items are discarded to make room for new ones.
+
+    Any result is cached, including `None` and other falsy values. The wrapper exposes
+    `cache_info()`, `cache_clear()` and `cache_parameters()` like `functools.lru_cache`.
+
+    In thread-safe mode the first thread to miss on a key computes the result while the
+    other threads missing on that key wait for it instead of calling the function again.
+    If the call raises, the waiting threads receive the same exception.
+
+    A coroutine function gets an awaitable wrapper that caches the awaited result.
+    Concurrent awaits on the same key share a single task.
     Example:
         @lru_cache(maxsize=100)
         def expensive_function(x, y):
@@ -78,18 +343,131 @@ def lru_cache(maxsize=128):
     """
     
     def decorator_lru_cache(func):
-        cache = LRUCache(maxsize)
-
-        @functools.wraps(func)
-        def wrapper_lru_cache(*args, **kwargs):
-            key = (args, frozenset(kwargs.items()))
-            cached_result = cache.get(key)
-            if cached_result is not None:
-                return cached_result
-            result = func(*args, **kwargs)
-            cache.put(key, result)
-            return result
+        if storage is not None:
+            func = read_through(func, storage)
+        cache = LRUCache(maxsize, thread_safe, ttl, maxbytes, sizeof, sweep_interval)
+
+        if inspect.iscoroutinefunction(func):
+            wrapper_lru_cache = _async_wrapper(func, cache)
+        elif not thread_safe:
+            @functools.wraps(func)
+            def wrapper_lru_cache(*args, **kwargs):
+                key = (args, frozenset(kwargs.items()))
+                cached_result = cache.get(key, _MISSING)
+                if cached_result is not _MISSING:
+                    return cached_result
+                result = func(*args, **kwargs)
+                cache.put(key, result)
+                return result
+        else:
+            wrapper_lru_cache = _thread_safe_wrapper(func, cache)
+
+        def cache_info():
+            """
+            Report cache statistics.
+            """
+            return CacheInfo(cache.hits, cache.misses, maxsize, len(cache))
 
+        def cache_clear():
+            """
+            Clear the cache and cache statistics.
+            """
+            cache.clear()
+
+        def cache_parameters():
+            """
+            Return the parameters the cache was created with.
+            """
+            return {
+                'maxsize': maxsize,
+                'typed': False,
+                'thread_safe': thread_safe,
+                'ttl': ttl,
+                'maxbytes': maxbytes,
+            }
+
+        wrapper_lru_cache.cache_info = cache_info
+        wrapper_lru_cache.cache_clear = cache_clear
+        wrapper_lru_cache.cache_parameters = cache_parameters
         return wrapper_lru_cache
 
-    return decorator_lru_cache
\ No newline at end of file
+    return decorator_lru_cache
+
+
+def _thread_safe_wrapper(func, cache):
+    """
+    Build the lru_cache wrapper that coalesces concurrent misses on the same key.
+    """
+    in_flight = {}
+    in_flight_lock = threading.Lock()
+
+    @functools.wraps(func)
+    def wrapper_lru_cache(*args, **kwargs):
+        key = (args, frozenset(kwargs.items()))
+        cached_result = cache.get(key, _MISSING)
+        if cached_result is not _MISSING:
+            return cached_result
+
+        with in_flight_lock:
+            call = in_flight.get(key)
+            leader = call is None
+            if leader:
+                # Результат мог появиться, пока мы ждали блокировку
+                cached_result = cache.peek(key, _MISSING)
+                if cached_result is not _MISSING:
+                    return cached_result
+                call = in_flight[key] = _InFlight()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+            cache.put(key, call.result)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with in_flight_lock:
+                del in_flight[key]
+            call.event.set()
+
+    return wrapper_lru_cache
+
+
+def _async_wrapper(func, cache):
+    """
+    Build the lru_cache wrapper for a coroutine function. Concurrent awaits on
+    the same key share one task; its result is cached once it completes.
+    """
+    in_flight = {}
+
+    @functools.wraps(func)
+    async def wrapper_lru_cache(*args, **kwargs):
+        key = (args, frozenset(kwargs.items()))
+        cached_result = cache.get(key, _MISSING)
+        if cached_result is not _MISSING:
+            return cached_result
+
+        task = in_flight.get(key)
+        # Задачу другого цикла событий ждать нельзя
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            in_flight[key] = task
+
+            def done(task, key=key):
+                if in_flight.get(key) is task:
+                    del in_flight[key]
+                if not task.cancelled() and task.exception() is None:
+                    cache.put(key, task.result())
+
+            task.add_done_callback(done)
+
+        # Отмена одного ожидающего не должна отменять общую задачу
+        return await asyncio.shield(task)
+
+    return wrapper_lru_cache
@@ -0,0 +1,314 @@
+# COPYRIGHT (c) 2024 Massonskyi
+# All rights reserved.
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""
+Circuit breaker, the companion of `retry` for dependencies that are down.
+
+While the failure rate over a rolling window stays low the circuit is closed
+and calls pass through. Once it exceeds the threshold the circuit opens and
+calls fail immediately with `CircuitOpenError`, without touching the dependency.
+After `recovery_timeout` the circuit becomes half-open and lets a few trial
+calls through: if they succeed it closes again, otherwise it reopens.
+"""
+
+import functools
+import inspect
+import threading
+import time
+import traceback
+from typing import Callable, Optional, Tuple, Type
+
+__all__ = ['circuit_breaker', 'CircuitBreaker', 'CircuitOpenError']
+__version__ = '0.1.0'
+__description__ = 'Прекращает вызовы недоступного сервиса до его восстановления.'
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(RuntimeError):
+    """
+    Raised instead of calling the function while the circuit is open.
+    """
+
+
+class CircuitBreaker(object):
+    """
+    State machine shared by all calls of the protected functions.
+
+    Outcomes are counted in `buckets` time slots covering the last `window` seconds,
+    so old failures stop counting without any background work.
+
+    Every state change starts a new generation. `before_call` returns the generation
+    that admitted the call, and outcomes reported with an older generation are
+    ignored: a call admitted while closed that finishes after the circuit went
+    half-open is not taken for a trial call.
+    """
+
+    def __init__(self,
+                 failure_rate: float = 0.5,
+                 window: float = 10.0,
+                 min_calls: int = 20,
+                 recovery_timeout: float = 30.0,
+                 half_open_calls: int = 1,
+                 exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+                 on_state_change: Optional[Callable[[str, str], None]] = None,
+                 buckets: int = 10) -> None:
+        """
+        :param failure_rate: share of failed calls in the window that opens the circuit.
+        :param window: length of the rolling window in seconds.
+        :param min_calls: minimum number of calls in the window before the rate is trusted.
+        :param recovery_timeout: seconds the circuit stays open before trial calls.
+        :param half_open_calls: number of successful trial calls needed to close the circuit.
+        :param exceptions: exception types counted as failures; others pass through uncounted.
+        :param on_state_change: listener called as `listener(old_state, new_state)`.
+        :param buckets: number of time slots the window is split into.
+        """
+        self.failure_rate = failure_rate
+        self.window = window
+        self.min_calls = min_calls
+        self.recovery_timeout = recovery_timeout
+        self.half_open_calls = half_open_calls
+        self.exceptions = exceptions
+        self.state = CLOSED
+        self._listeners = [] if on_state_change is None else [on_state_change]
+        self._lock = threading.Lock()
+        self._bucket_width = window / buckets
+        self._epochs = [-1] * buckets
+        self._successes = [0] * buckets
+        self._failures = [0] * buckets
+        self._opened_until = 0.0
+        self._trials = 0
+        self._trial_successes = 0
+        self._generation = 0
+
+    def add_listener(self, listener: Callable[[str, str], None]) -> None:
+        """
+        Call `listener(old_state, new_state)` on every state change, e.g. `signal.emit`.
+        """
+        self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, str], None]) -> None:
+        """
+        Stop notifying `listener`.
+        """
+        self._listeners.remove(listener)
+
+    def _slot(self, now: float) -> int:
+        epoch = int(now / self._bucket_width)
+        slot = epoch % len(self._epochs)
+        if self._epochs[slot] != epoch:
+            # Слот принадлежит старому отрезку окна: обнуляем его
+            self._epochs[slot] = epoch
+            self._successes[slot] = 0
+            self._failures[slot] = 0
+        return slot
+
+    def _totals(self, now: float) -> Tuple[int, int]:
+        oldest = int(now / self._bucket_width) - len(self._epochs) + 1
+        calls = failures = 0
+        for slot, epoch in enumerate(self._epochs):
+            if epoch >= oldest:
+                calls += self._successes[slot] + self._failures[slot]
+                failures += self._failures[slot]
+        return calls, failures
+
+    def _reset_window(self) -> None:
+        self._epochs = [-1] * len(self._epochs)
+
+    def _transition(self, state: str) -> Optional[Tuple[str, str]]:
+        old, self.state = self.state, state
+        if old == state:
+            return None
+        self._generation += 1
+        return old, state
+
+    def _stale(self, generation: Optional[int]) -> bool:
+        # Вызов допущен в другом состоянии: его результат уже ничего не значит
+        return generation is not None and generation != self._generation
+
+    def _notify(self, change: Optional[Tuple[str, str]]) -> None:
+        # Слушатели вызываются вне блокировки: они могут обращаться к выключателю
+        if change is not None:
+            for listener in self._listeners:
+                try:
+                    listener(*change)
+                except Exception:
+                    # Ошибка слушателя не должна подменять результат защищённого вызова
+                    traceback.print_exc()
+
+    def before_call(self) -> int:
+        """
+        Raise CircuitOpenError if the call must not go through.
+        Returns the generation that admitted the call, to pass to `record_success`
+        and `record_failure`.
+        """
+        # Поколение читается до состояния: при гонке результат будет лишь отброшен
+        generation = self._generation
+        if self.state == CLOSED:
+            return generation
+        now = time.monotonic()
+        if self.state == OPEN and now < self._opened_until:
+            raise CircuitOpenError(f'circuit is open for another {self._opened_until - now:.3f}s')
+        change = None
+        with self._lock:
+            if self.state == OPEN:
+                if now < self._opened_until:
+                    raise CircuitOpenError('circuit is open')
+                change = self._transition(HALF_OPEN)
+                self._trials = self._trial_successes = 0
+            if self._trials >= self.half_open_calls:
+                raise CircuitOpenError('circuit is half-open and its trial calls are in progress')
+            self._trials += 1
+            generation = self._generation
+        self._notify(change)
+        return generation
+
+    def record_success(self, generation: Optional[int] = None) -> None:
+        """
+        Count a successful call. A call admitted by an older `generation` is ignored.
+        """
+        change = None
+        with self._lock:
+            if self._stale(generation):
+                return
+            if self.state == HALF_OPEN:
+                self._trial_successes += 1
+                if self._trial_successes >= self.half_open_calls:
+                    self._reset_window()
+                    change = self._transition(CLOSED)
+            else:
+                self._successes[self._slot(time.monotonic())] += 1
+        self._notify(change)
+
+    def record_failure(self, generation: Optional[int] = None) -> None:
+        """
+        Count a failed call and open the circuit if the failure rate is too high.
+        A call admitted by an older `generation` is ignored.
+        """
+        change = None
+        now = time.monotonic()
+        with self._lock:
+            if self._stale(generation):
+                return
+            if self.state == HALF_OPEN:
+                self._opened_until = now + self.recovery_timeout
+                change = self._transition(OPEN)
+            elif self.state == CLOSED:
+                self._failures[self._slot(now)] += 1
+                calls, failures = self._totals(now)
+                if calls >= self.min_calls and failures >= calls * self.failure_rate:
+                    self._opened_until = now + self.recovery_timeout
+                    change = self._transition(OPEN)
+        self._notify(change)
+
+    def _abandon(self, generation: int) -> None:
+        # Пробный вызов прерван исключением, которое не считается отказом
+        with self._lock:
+            if self.state == HALF_OPEN and not self._stale(generation) and self._trials > 0:
+                self._trials -= 1
+
+    def reset(self) -> None:
+        """
+        Close the circuit and forget the recorded calls.
+        """
+        with self._lock:
+            self._reset_window()
+            change = self._transition(CLOSED)
+        self._notify(change)
+
+    def __call__(self, func: Callable) -> Callable:
+        """
+        Protect `func` with this breaker.
+        """
+        exceptions = self.exceptions
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper_circuit_breaker(*args, **kwargs):
+                generation = self.before_call()
+                try:
+                    result = await func(*args, **kwargs)
+                except exceptions:
+                    self.record_failure(generation)
+                    raise
+                except BaseException:
+                    self._abandon(generation)
+                    raise
+                self.record_success(generation)
+                return result
+        else:
+            @functools.wraps(func)
+            def wrapper_circuit_breaker(*args, **kwargs):
+                generation = self.before_call()
+                try:
+                    result = func(*args, **kwargs)
+                except exceptions:
+                    self.record_failure(generation)
+                    raise
+                except BaseException:
+                    self._abandon(generation)
+                    raise
+                self.record_success(generation)
+                return result
+
+        wrapper_circuit_breaker.breaker = self
+        return wrapper_circuit_breaker
+
+
+def circuit_breaker(failure_rate=0.5, window=10.0, min_calls=20, recovery_timeout=30.0,
+                    half_open_calls=1, exceptions=(Exception,), on_state_change=None):
+    """
+    A decorator that stops calling a failing dependency for a while.
+
+    Args:
+        failure_rate (float): Share of failed calls in the window that opens the circuit. Default is 0.5.
+        window (float): Length of the rolling window in seconds. Default is 10.
+        min_calls (int): Minimum number of calls in the window before the circuit may open. Default is 20.
+        recovery_timeout (float): Seconds the circuit stays open before trial calls are let through. Default is 30.
+        half_open_calls (int): Successful trial calls needed to close the circuit again. Default is 1.
+        exceptions (tuple): Exception types counted as failures. Default is (Exception,).
+        on_state_change (callable, optional): Called as `on_state_change(old_state, new_state)`;
+            pass `signal.emit` to route state changes into a `core.Signal`.
+
+    Returns:
+        function: A decorator. The wrapped function exposes its `CircuitBreaker` as `.breaker`;
+        to share one breaker between functions, decorate them with the same `CircuitBreaker` instance.
+
+    Raises:
+        CircuitOpenError: When the wrapped function is called while the circuit is open.
+
+    Example:
+        @circuit_breaker(failure_rate=0.5, min_calls=10, recovery_timeout=5)
+        @retry(retries=3, delay=0.1, backoff=2)
+        def fetch(url):
+            ...
+    """
+
+    def decorator_circuit_breaker(func):
+        breaker = CircuitBreaker(failure_rate, window, min_calls, recovery_timeout,
+                                 half_open_calls, exceptions, on_state_change)
+        return breaker(func)
+
+    return decorator_circuit_breaker
@@ -21,35 +21,204 @@
 # CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
+import copy
 import functools
+import inspect
+import logging
+import logging.handlers
+import queue
 
-__all__ = ['log_calls']
-__version__ = '0.1.0'
+__all__ = ['log_calls', 'start_background_logging']
+__version__ = '0.2.0'
 __description__ = 'Логирует вызовы функции, включая аргументы и возвращаемое значение.'
 
 
-def log_calls(func):
+class _LazyRepr(object):
+    """
+    Argument of a log record whose repr is computed, and truncated, only when
+    a handler actually formats the record.
+    """
+    __slots__ = ('obj', 'maxlen')
+
+    def __init__(self, obj, maxlen):
+        self.obj = obj
+        self.maxlen = maxlen
+
+    def __str__(self):
+        text = repr(self.obj)
+        if len(text) > self.maxlen:
+            return text[:self.maxlen - 3] + '...'
+        return text
+
+    __repr__ = __str__
+
+
+class _BackgroundQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that does not block the caller: records are dropped while the
+    queue is full.
+
+    The message is rendered on the calling thread, so argument reprs are taken
+    at call time, before a mutable argument can change and without running
+    `__repr__` concurrently with the caller. Formatting with the handlers'
+    formatters is still left to the listener thread.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def _effective_handlers(logger):
+    """
+    Return the handlers a record of `logger` reaches through propagation.
+    """
+    handlers = []
+    current = logger
+    while current is not None:
+        handlers.extend(current.handlers)
+        if not current.propagate:
+            break
+        current = current.parent
+    return tuple(handlers)
+
+
+def start_background_logging(logger=None, *handlers, maxsize=10000):
+    """
+    Move the handlers of `logger` to a background thread.
+
+    The logger gets a single queue handler; a `QueueListener` thread takes records
+    from the bounded queue and passes them to `handlers` (by default the handlers the
+    logger had before). Records that do not fit into the queue are dropped and counted
+    in `listener.handler.dropped` instead of blocking the logging call.
+
+    A logger without handlers of its own normally relies on propagation. Its records
+    then go to the handlers found by walking `propagate` up to the root logger, and
+    `propagate` is switched off so that those handlers do not receive them twice.
+
+    Args:
+        logger (logging.Logger | str, optional): The logger or its name. Defaults to the root logger.
+        *handlers (logging.Handler): Handlers to run in the background.
+        maxsize (int, optional): Capacity of the queue. Defaults to 10000.
+    Returns:
+        logging.handlers.QueueListener: The started listener; call `stop()` to flush and stop it.
+    Raises:
+        ValueError: If no handlers are given and the logger would use none.
+    """
+    if not isinstance(logger, logging.Logger):
+        logger = logging.getLogger(logger)
+    if not handlers:
+        handlers = tuple(logger.handlers)
+    if not handlers:
+        handlers = _effective_handlers(logger)
+        if not handlers:
+            raise ValueError(f'logger {logger.name!r} has no handlers to run in the background')
+        # Записи теперь идут через очередь: без этого предки получили бы их дважды
+        logger.propagate = False
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+
+    log_queue = queue.Queue(maxsize)
+    queue_handler = _BackgroundQueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.handler = queue_handler
+    listener.start()
+    return listener
+
+
+def log_calls(func=None, *, logger=None, level=logging.DEBUG, maxlen=200, sample=1):
     """
     A decorator that logs the function calls, including the arguments and the return value.
+
+    Calls are reported through `logging`, one record per call. Whether the level is enabled
+    is checked before anything else, so a disabled logger costs a single method call. The
+    reprs of the arguments and of the result are computed only when the record is handled
+    (on the calling thread, also with background logging), and are truncated to `maxlen`
+    characters. The record also carries the raw values
+    as `call_args`, `call_kwargs` and `call_result` for structured handlers. Combine with
+    `start_background_logging` to keep the handlers' I/O off the calling thread.
     Args:
         func (callable): The function to be decorated.
+        logger (logging.Logger | str, optional): Target logger. Defaults to the logger of the function's module.
+        level (int, optional): Level of the records. Defaults to logging.DEBUG.
+        maxlen (int, optional): Maximum length of each repr. Defaults to 200.
+        sample (int, optional): Log only every `sample`-th call. Defaults to 1.
     Returns:
         callable: The wrapped function that logs its calls.
     Example:
-        @log_calls
+        @log_calls(level=logging.INFO)
         def add(a, b):
             return a + b
         add(2, 3)
-        # Output:
-        # Calling add with args=(2, 3) kwargs={}
-        # add returned 5
+        # INFO:__main__:add called with args=(2, 3) kwargs={} returned 5
     """
-    
+    if func is None:
+        return functools.partial(log_calls, logger=logger, level=level, maxlen=maxlen, sample=sample)
+    if sample < 1:
+        raise ValueError("sample must be a positive integer")
+    if not isinstance(logger, logging.Logger):
+        logger = logging.getLogger(logger if logger is not None else func.__module__)
+
+    name = func.__qualname__
+    is_enabled = logger.isEnabledFor
+    counter = [0]
+
+    def should_log():
+        if not is_enabled(level):
+            return False
+        if sample == 1:
+            return True
+        counter[0] += 1
+        return counter[0] % sample == 0
+
+    def log_result(args, kwargs, result):
+        logger.log(level, '%s called with args=%s kwargs=%s returned %s',
+                   name, _LazyRepr(args, maxlen), _LazyRepr(kwargs, maxlen), _LazyRepr(result, maxlen),
+                   extra={'call_args': args, 'call_kwargs': kwargs, 'call_result': result})
+
+    def log_error(args, kwargs, error):
+        logger.log(level, '%s called with args=%s kwargs=%s raised %s',
+                   name, _LazyRepr(args, maxlen), _LazyRepr(kwargs, maxlen), _LazyRepr(error, maxlen),
+                   extra={'call_args': args, 'call_kwargs': kwargs, 'call_error': error})
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def wrapper_log_calls(*args, **kwargs):
+            if not should_log():
+                return await func(*args, **kwargs)
+            try:
+                result = await func(*args, **kwargs)
+            except Exception as e:
+                log_error(args, kwargs, e)
+                raise
+            log_result(args, kwargs, result)
+            return result
+
+        return wrapper_log_calls
+
     @functools.wraps(func)
     def wrapper_log_calls(*args, **kwargs):
-        print(f"Calling {func.__name__} with args={args} kwargs={kwargs}")
-        result = func(*args, **kwargs)
-        print(f"{func.__name__} returned {result}")
+        if not should_log():
+            return func(*args, **kwargs)
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            log_error(args, kwargs, e)
+            raise
+        log_result(args, kwargs, result)
         return result
 
     return wrapper_log_calls
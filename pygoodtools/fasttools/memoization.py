@@ -22,31 +22,197 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 import functools
+import inspect
+import weakref
+
+from ._keys import make_key_builder
+from .cache import LRUCache
+from .storage import read_through
 
 __all__ = ['memoize']
-__version__ = '0.1.0'
+__version__ = '0.4.0'
 __description__ = 'Кэширует результаты вызова функции для повышения производительности.'
 
-def memoize(func):
+_MISSING = object()
+_POLICIES = ('lru', 'fifo')
+
+
+def memoize(func=None, *, maxsize=None, policy='lru', typed=False, weak=False, storage=None):
     """
     A decorator to cache the results of function calls with specific arguments.
     This decorator stores the results of function calls in a cache dictionary,
     using the function arguments as keys. If the function is called again with
     the same arguments, the cached result is returned instead of recomputing
     the result.
+
+    Can be applied bare (`@memoize`) or with options (`@memoize(maxsize=1024)`).
+    Coroutine functions get an awaitable wrapper that caches the awaited result.
     Args:
         func (callable): The function to be memoized.
+        maxsize (int, optional): Maximum number of cached results. Defaults to None (unbounded).
+        policy (str, optional): Eviction policy once `maxsize` is reached: 'lru' drops the least
+            recently used result, 'fifo' drops the oldest one. Defaults to 'lru'.
+        typed (bool, optional): Cache arguments of different types separately. Defaults to False.
+        weak (bool, optional): Reference weakly referenceable arguments (class instances,
+            functions) weakly. Such arguments are matched by identity, and their entries are
+            dropped as soon as the argument object is garbage collected. Defaults to False.
+        storage (Storage, optional): Persistent backend consulted when a result is not in
+            memory, e.g. `SqliteStorage('cache.db')`. Results written there survive restarts.
+            `cache_clear()` only clears the in-memory part. Defaults to None.
     Returns:
-        callable: A wrapper function that implements memoization.
+        callable: A wrapper function that implements memoization. It provides
+        `cache_clear()` and `cache_size()`.
+    Raises:
+        ValueError: If `policy` is unknown, `maxsize` is not positive, or `weak` is combined with `storage`.
+    Example:
+        @memoize(maxsize=10_000, typed=True)
+        def fib(n):
+            return n if n < 2 else fib(n - 1) + fib(n - 2)
+    """
+    if policy not in _POLICIES:
+        raise ValueError(f"Unknown eviction policy {policy!r}, expected one of {_POLICIES}")
+    if maxsize is not None and maxsize <= 0:
+        raise ValueError("maxsize must be a positive integer or None")
+    if weak and storage is not None:
+        raise ValueError("weak keys are matched by identity and cannot be stored persistently")
+
+    def decorator_memoize(func):
+        call = func if storage is None else read_through(func, storage, typed=typed)
+        make_key = make_key_builder(typed)
+        if maxsize is None:
+            store = _DictStore()
+        elif policy == 'lru':
+            store = LRUCache(maxsize)
+        else:
+            store = _FifoStore(maxsize)
+
+        if weak:
+            wrapper_memoize = _weak_wrapper(func, make_key, store)
+        elif inspect.iscoroutinefunction(func):
+            get, put = store.get, store.put
+
+            @functools.wraps(func)
+            async def wrapper_memoize(*args, **kwargs):
+                key = make_key(args, kwargs)
+                result = get(key, _MISSING)
+                if result is _MISSING:
+                    result = await call(*args, **kwargs)
+                    put(key, result)
+                return result
+        else:
+            get, put = store.get, store.put
+
+            @functools.wraps(func)
+            def wrapper_memoize(*args, **kwargs):
+                key = make_key(args, kwargs)
+                result = get(key, _MISSING)
+                if result is _MISSING:
+                    result = call(*args, **kwargs)
+                    put(key, result)
+                return result
+
+        wrapper_memoize.cache_clear = store.clear
+        wrapper_memoize.cache_size = store.__len__
+        return wrapper_memoize
+
+    if func is not None:
+        return decorator_memoize(func)
+    return decorator_memoize
+
+
+def _weak_wrapper(func, make_key, store):
+    """
+    Build a memoize wrapper that holds weakly referenceable arguments by weak reference.
+    The weak references are stored next to the result, so an evicted entry
+    takes its references (and their callbacks) with it.
     """
-    cache = {}
+
+    def key_and_refs(args, kwargs):
+        refs = []
+        key_args = []
+        for arg in args:
+            try:
+                refs.append(weakref.ref(arg))
+            except TypeError:
+                key_args.append(arg)
+            else:
+                key_args.append(_IdKey(id(arg)))
+        key_kwargs = {}
+        for name, arg in kwargs.items():
+            try:
+                refs.append(weakref.ref(arg))
+            except TypeError:
+                key_kwargs[name] = arg
+            else:
+                key_kwargs[name] = _IdKey(id(arg))
+        return make_key(tuple(key_args), key_kwargs), refs
+
+    def remember(key, refs, result):
+        if refs:
+            # Запись удаляется, как только умирает любой из аргументов
+            def drop(_, key=key):
+                store.pop(key, None)
+
+            refs = tuple(weakref.ref(ref(), drop) for ref in refs)
+        store.put(key, (result, refs))
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def wrapper_memoize(*args, **kwargs):
+            key, refs = key_and_refs(args, kwargs)
+            entry = store.get(key, _MISSING)
+            if entry is not _MISSING:
+                return entry[0]
+            result = await func(*args, **kwargs)
+            remember(key, refs, result)
+            return result
+
+        return wrapper_memoize
 
     @functools.wraps(func)
-    def wrapper_memoize(*args):
-        if args in cache:
-            return cache[args]
-        result = func(*args)
-        cache[args] = result
+    def wrapper_memoize(*args, **kwargs):
+        key, refs = key_and_refs(args, kwargs)
+        entry = store.get(key, _MISSING)
+        if entry is not _MISSING:
+            return entry[0]
+        result = func(*args, **kwargs)
+        remember(key, refs, result)
         return result
 
     return wrapper_memoize
+
+
+class _IdKey(int):
+    """
+    Identity of a weakly referenced argument, distinct from a plain int argument.
+    """
+    __slots__ = ()
+
+    def __eq__(self, other):
+        return type(other) is _IdKey and int.__eq__(self, other)
+
+    __hash__ = int.__hash__
+
+
+class _DictStore(dict):
+    """
+    Unbounded store with the same get/put/pop interface as LRUCache.
+    """
+    __slots__ = ()
+    put = dict.__setitem__
+
+
+class _FifoStore(dict):
+    """
+    Bounded store that evicts the oldest inserted entry first.
+    """
+    __slots__ = ('maxsize',)
+
+    def __init__(self, maxsize):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def put(self, key, value):
+        if key not in self and len(self) >= self.maxsize:
+            del self[next(iter(self))]
+        self[key] = value
@@ -22,50 +22,175 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 
+import asyncio
 import ctypes
 import functools
+import inspect
+import math
+import random
+import threading
 import time
+from typing import Iterator, Optional, Tuple, Type
 
-__all__ = ['retry', 'RetryParams']
-__version__ = '0.1.0'
+__all__ = ['retry', 'RetryParams', 'RetryBudget']
+__version__ = '0.3.0'
 __description__ = 'Повторяет вызов функции определенное количество раз в случае ошибки.'
+
+_JITTERS = (None, 'full', 'decorrelated')
+
+
 class RetryParams(ctypes.Structure):
-    _fields_ = [("retries", ctypes.c_int), ("delay", ctypes.c_int)]
-    
-def retry(retries=3, delay=1):
+    _fields_ = [
+        ("retries", ctypes.c_int),
+        ("delay", ctypes.c_double),
+        ("backoff", ctypes.c_double),
+        ("max_delay", ctypes.c_double),
+    ]
+
+
+class RetryBudget(object):
+    """
+    Token bucket limiting how many retries may happen per second.
+
+    Every retry takes a token; tokens are refilled at `rate` per second up to
+    `capacity`. When the bucket is empty, failing calls are not retried and the
+    exception is raised at once, so retries cannot multiply the load on a dependency
+    that is already failing. One budget can be shared by many decorated functions.
+    """
+
+    def __init__(self, capacity: float = 10.0, rate: float = 1.0) -> None:
+        """
+        :param capacity: maximum number of tokens, i.e. the largest burst of retries.
+        :param rate: number of tokens added per second.
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> bool:
+        """
+        Take a token for one retry. Returns False if the budget is exhausted.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+    @property
+    def tokens(self) -> float:
+        """
+        Number of tokens currently available.
+        """
+        with self._lock:
+            return min(self.capacity, self._tokens + (time.monotonic() - self._updated) * self.rate)
+
+
+def _delays(params: RetryParams, jitter: Optional[str]) -> Iterator[float]:
+    """
+    Yield the pause before each retry: `delay * backoff ** n` capped at `max_delay`,
+    randomized according to `jitter`.
+    """
+    delay, backoff, max_delay = params.delay, params.backoff, params.max_delay
+    if jitter == 'decorrelated':
+        # Decorrelated jitter: каждая пауза зависит от предыдущей, а не от номера попытки
+        sleep = delay
+        while True:
+            sleep = min(max_delay, random.uniform(delay, sleep * 3))
+            yield sleep
+    attempt_delay = delay
+    while True:
+        capped = min(max_delay, attempt_delay)
+        yield random.uniform(0, capped) if jitter == 'full' else capped
+        attempt_delay *= backoff
+
+
+def retry(retries: int = 3,
+          delay: float = 1,
+          backoff: float = 1.0,
+          max_delay: Optional[float] = None,
+          jitter: Optional[str] = None,
+          exceptions: Tuple[Type[BaseException], ...] = (Exception,),
+          budget: Optional[RetryBudget] = None):
     """
     A decorator that retries a function execution a specified number of times with a delay between attempts.
 
     Args:
         retries (int): The number of times to retry the function. Default is 3.
-        delay (int): The delay in seconds between each retry attempt. Default is 1.
+        delay (float): The delay in seconds before the first retry. Fractions of a second are allowed. Default is 1.
+        backoff (float): Factor by which the delay grows after every attempt; 2.0 gives
+            exponential backoff. Default is 1.0 (constant delay).
+        max_delay (float, optional): Upper bound of a single delay. Default is None (unbounded).
+        jitter (str, optional): Randomization of the delays, so that clients failing together do
+            not retry together: 'full' picks uniformly from [0, delay], 'decorrelated' picks from
+            [delay, 3 * previous delay]. Default is None (no jitter).
+        exceptions (tuple): Exception types that trigger a retry; any other exception is raised
+            immediately. Default is (Exception,).
+        budget (RetryBudget, optional): Shared limit on the rate of retries. When it is exhausted
+            the exception is raised without further attempts. Default is None.
 
     Returns:
         function: A wrapped function that will be retried upon failure.
 
+    Coroutine functions are retried by an awaitable wrapper that waits with `asyncio.sleep`,
+    so the event loop is not blocked between attempts.
+
     Raises:
+        ValueError: If `retries` is less than 1 or `jitter` is not one of None, 'full', 'decorrelated'.
         Exception: The last exception encountered after all retry attempts have been exhausted.
 
     Example:
-        @retry(retries=5, delay=2)
+        @retry(retries=5, delay=0.1, backoff=2, max_delay=5, jitter='full', exceptions=(ConnectionError,))
         def unstable_function():
             # Function implementation that might fail
             pass
     """
-    params = RetryParams(retries, delay)
+    # При retries < 1 цикл попыток не выполнился бы ни разу и вызов молча вернул бы None
+    if retries < 1:
+        raise ValueError(f"retries must be at least 1, got {retries}")
+    if jitter not in _JITTERS:
+        raise ValueError(f"Unknown jitter {jitter!r}, expected one of {_JITTERS}")
+    params = RetryParams(retries, delay, backoff, math.inf if max_delay is None else max_delay)
+
+    def should_retry(attempt: int) -> bool:
+        return attempt < params.retries - 1 and (budget is None or budget.acquire())
 
     def decorator_retry(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper_retry(*args, **kwargs):
+                delays = None
+                for attempt in range(params.retries):
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions:
+                        if not should_retry(attempt):
+                            raise
+                        if delays is None:
+                            delays = _delays(params, jitter)
+                        await asyncio.sleep(next(delays))
+
+            return wrapper_retry
+
         @functools.wraps(func)
         def wrapper_retry(*args, **kwargs):
-            last_exception = None
-            for _ in range(params.retries):
+            delays = None
+            for attempt in range(params.retries):
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
-                    last_exception = e
-                    time.sleep(params.delay)
-            raise last_exception
+                except exceptions:
+                    if not should_retry(attempt):
+                        raise
+                    # Генератор пауз создается только при первой ошибке
+                    if delays is None:
+                        delays = _delays(params, jitter)
+                    time.sleep(next(delays))
 
         return wrapper_retry
 
-    return decorator_retry
\ No newline at end of file
+    return decorator_retry
@@ -22,11 +22,45 @@
 # ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
 # POSSIBILITY OF SUCH DAMAGE.
 import functools
+import os
+import threading
+import weakref
 
 __all__ = ['singleton']
-__version__ = '0.1.0'
+__version__ = '0.2.0'
 __description__ = 'Обеспечивает, что класс имеет только один экземпляр.'
 
+_MISSING = object()
+
+
+class _Slot:
+    """
+    Holds the instance of one singleton class together with its own lock.
+    """
+    __slots__ = ('instance', 'lock', '__weakref__')
+
+    def __init__(self):
+        self.instance = _MISSING
+        self.lock = threading.Lock()
+
+
+# Все слоты, чтобы дочерний процесс после fork начинал с чистого состояния
+_slots = weakref.WeakSet()
+
+
+def _after_fork_in_child():
+    """
+    Drop inherited instances and locks: the child must not share the parent's
+    sockets or a lock that some parent thread held at fork time.
+    """
+    for slot in list(_slots):
+        slot.instance = _MISSING
+        slot.lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
 
 def singleton(cls):
     """
@@ -36,6 +70,15 @@ def singleton(cls):
     is created. If an instance of the class already exists, it returns the existing
     instance instead of creating a new one.
 
+    Creation is thread-safe: the first callers race for a lock owned by this class
+    only, so constructing one singleton never blocks another. Once the instance
+    exists it is returned without taking the lock. After `os.fork()` the child
+    process builds its own instance on first use.
+
+    The wrapper exposes `reset_instance(teardown=None)`, which forgets the current
+    instance (calling `teardown(instance)` if given) and returns it, or None if
+    there was none.
+
     Args:
         *args: Variable length argument list passed to the class constructor.
         **kwargs: Arbitrary keyword arguments passed to the class constructor.
@@ -43,12 +86,27 @@ def singleton(cls):
     Returns:
         The single instance of the class.
     """
-    instances = {}
+    slot = _Slot()
+    _slots.add(slot)
 
     @functools.wraps(cls)
     def get_instance(*args, **kwargs):
-        if cls not in instances:
-            instances[cls] = cls(*args, **kwargs)
-        return instances[cls]
+        instance = slot.instance
+        if instance is _MISSING:
+            with slot.lock:
+                instance = slot.instance
+                if instance is _MISSING:
+                    instance = slot.instance = cls(*args, **kwargs)
+        return instance
+
+    def reset_instance(teardown=None):
+        with slot.lock:
+            instance, slot.instance = slot.instance, _MISSING
+        if instance is _MISSING:
+            return None
+        if teardown is not None:
+            teardown(instance)
+        return instance
 
-    return get_instance
\ No newline at end of file
+    get_instance.reset_instance = reset_instance
+    return get_instance
@@ -0,0 +1,310 @@
+# COPYRIGHT (c) 2024 Massonskyi
+# All rights reserved.
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its contributors
+#    may be used to endorse or promote products derived from this software
+#    without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
+# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
+# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
+# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+"""
+Persistent storage backends for the caching decorators.
+
+`memoize(storage=...)` and `lru_cache(storage=...)` keep their in-memory cache
+and fall back to the storage on a miss, so results survive process restarts.
+
+Classes:
+    Storage: Interface of a storage backend.
+    SqliteStorage: Local store in an SQLite file, shared by processes on one host.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import marshal
+import os
+import pickle
+import sqlite3
+import threading
+from typing import Any, Callable
+
+__all__ = ['Storage', 'SqliteStorage', 'read_through']
+__version__ = '0.1.0'
+__description__ = 'Хранит результаты функций на диске между перезапусками.'
+
+_MISSING = object()
+# Фиксированный протокол: хэш ключа не должен зависеть от версии Python
+_KEY_PROTOCOL = 4
+
+
+def _encode_key(obj: Any, out: list) -> None:
+    """
+    Append a canonical byte encoding of `obj` to `out`: equal keys encode equally,
+    whatever objects they share. Numbers are normalized so that 1, 1.0 and True
+    collide, as they do in the in-memory caches; None, str, bytes, tuples, lists,
+    sets and dicts are encoded structurally. Other objects are pickled, so their
+    encoding is canonical only if their pickle does not depend on object identity.
+    """
+    kind = type(obj)
+    if obj is None:
+        out.append(b'N')
+    elif kind is str:
+        data = obj.encode('utf-8', 'surrogatepass')
+        out.append(b's%d:' % len(data))
+        out.append(data)
+    elif kind is bool or kind is int:
+        out.append(b'i%d;' % obj)
+    elif kind is float:
+        if obj.is_integer():
+            out.append(b'i%d;' % obj)
+        else:
+            out.append(b'f' + repr(obj).encode() + b';')
+    elif kind is bytes:
+        out.append(b'b%d:' % len(obj))
+        out.append(obj)
+    elif kind is tuple or kind is list:
+        out.append((b't' if kind is tuple else b'l') + b'%d:' % len(obj))
+        for item in obj:
+            _encode_key(item, out)
+    elif kind is frozenset or kind is set:
+        # Порядок обхода множества не определён: сортируем закодированные элементы
+        items = sorted(b''.join(_encoded(item)) for item in obj)
+        out.append(b'S%d:' % len(items))
+        for item in items:
+            out.append(b'%d:' % len(item))
+            out.append(item)
+    elif kind is dict:
+        items = sorted(b''.join(_encoded(k) + _encoded(v)) for k, v in obj.items())
+        out.append(b'D%d:' % len(items))
+        for item in items:
+            out.append(b'%d:' % len(item))
+            out.append(item)
+    else:
+        data = pickle.dumps(obj, protocol=_KEY_PROTOCOL)
+        out.append(b'p%d:' % len(data))
+        out.append(data)
+
+
+def _encoded(obj: Any) -> list:
+    out = []
+    _encode_key(obj, out)
+    return out
+
+_SERIALIZERS = {
+    'pickle': (functools.partial(pickle.dumps, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+    'json': (lambda value: json.dumps(value).encode('utf-8'), lambda data: json.loads(data)),
+    'marshal': (marshal.dumps, marshal.loads),
+}
+
+
+class Storage(object):
+    """
+    Interface of a storage backend. Keys are tuples of call arguments,
+    values are the results of the calls.
+    """
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        Return the value stored for `key`, or `default` if there is none.
+        """
+        raise NotImplementedError
+
+    def put(self, key: Any, value: Any) -> None:
+        """
+        Store `value` for `key`.
+        """
+        raise NotImplementedError
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        """
+        Remove `key` and return its value, or `default` if there is none.
+        """
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """
+        Remove all values of this storage.
+        """
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def bind(self, namespace: str) -> 'Storage':
+        """
+        Return a view of the storage whose keys do not collide with other namespaces.
+        """
+        return self
+
+
+class SqliteStorage(Storage):
+    """
+    Storage in a local SQLite database.
+
+    Keys are encoded canonically (see `_encode_key`) and hashed with BLAKE2b into
+    16-byte digests, so rows stay small whatever the arguments are and equal keys
+    always find the same row. Values are encoded by `serializer`:
+    'pickle' (default), 'json', 'marshal', or any object with `dumps`/`loads`.
+
+    Nothing is opened until the first access. Every thread and every process
+    gets its own connection (a forked child reconnects), and the database runs in
+    WAL mode with a busy timeout, so several processes on one host can share a file.
+    """
+
+    def __init__(self,
+                 path: str,
+                 serializer: Any = 'pickle',
+                 namespace: str = '',
+                 timeout: float = 30.0,
+                 mmap_size: int = 0):
+        """
+        :param path: path to the database file.
+        :param serializer: name of a built-in serializer or an object with `dumps`/`loads`.
+        :param namespace: prefix separating the keys of different functions.
+        :param timeout: seconds to wait for a lock held by another process.
+        :param mmap_size: bytes of the database to memory-map for reads, 0 to disable.
+        """
+        if isinstance(serializer, str):
+            if serializer not in _SERIALIZERS:
+                raise ValueError(f"Unknown serializer {serializer!r}, expected one of {tuple(_SERIALIZERS)}")
+            self._dumps, self._loads = _SERIALIZERS[serializer]
+        else:
+            self._dumps, self._loads = serializer.dumps, serializer.loads
+        self.serializer = serializer
+        self.path = os.fspath(path)
+        self.namespace = namespace
+        self.timeout = timeout
+        self.mmap_size = mmap_size
+        self._local = threading.local()
+
+    def bind(self, namespace: str) -> 'SqliteStorage':
+        return SqliteStorage(self.path, self.serializer, namespace, self.timeout, self.mmap_size)
+
+    def _connection(self) -> sqlite3.Connection:
+        local = self._local
+        pid = os.getpid()
+        if getattr(local, 'pid', None) != pid:
+            # Соединение, унаследованное через fork, использовать нельзя
+            connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            if self.mmap_size:
+                connection.execute(f'PRAGMA mmap_size={int(self.mmap_size)}')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS cache ('
+                'namespace TEXT NOT NULL, key BLOB NOT NULL, value BLOB NOT NULL, '
+                'PRIMARY KEY (namespace, key)) WITHOUT ROWID'
+            )
+            local.connection = connection
+            local.pid = pid
+        return local.connection
+
+    @staticmethod
+    def _hash(key: Any) -> bytes:
+        return hashlib.blake2b(b''.join(_encoded(key)), digest_size=16).digest()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        row = self._connection().execute(
+            'SELECT value FROM cache WHERE namespace = ? AND key = ?',
+            (self.namespace, self._hash(key)),
+        ).fetchone()
+        if row is None:
+            return default
+        return self._loads(row[0])
+
+    def put(self, key: Any, value: Any) -> None:
+        self._connection().execute(
+            'INSERT OR REPLACE INTO cache (namespace, key, value) VALUES (?, ?, ?)',
+            (self.namespace, self._hash(key), self._dumps(value)),
+        )
+
+    def pop(self, key: Any, default: Any = None) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            return default
+        self._connection().execute(
+            'DELETE FROM cache WHERE namespace = ? AND key = ?',
+            (self.namespace, self._hash(key)),
+        )
+        return value
+
+    def clear(self) -> None:
+        self._connection().execute('DELETE FROM cache WHERE namespace = ?', (self.namespace,))
+
+    def __len__(self) -> int:
+        return self._connection().execute(
+            'SELECT COUNT(*) FROM cache WHERE namespace = ?', (self.namespace,)
+        ).fetchone()[0]
+
+    def close(self) -> None:
+        """
+        Close the connection of the calling thread.
+        """
+        local = self._local
+        if getattr(local, 'pid', None) == os.getpid():
+            local.connection.close()
+        local.__dict__.clear()
+
+
+def _storage_key(args: tuple, kwargs: dict, typed: bool) -> tuple:
+    # Именованные аргументы сортируются: ключ не зависит от порядка их передачи
+    items = tuple(sorted(kwargs.items())) if kwargs else ()
+    key = (args, items) if kwargs else args
+    if typed:
+        # Типы аргументов входят в ключ: f(1), f(1.0) и f(True) хранятся отдельно
+        key = (key, tuple(type(a) for a in args), tuple(type(v) for _, v in items))
+    return key
+
+
+def read_through(func: Callable, storage: Storage, typed: bool = False) -> Callable:
+    """
+    Wrap `func` so that its results are looked up in and saved to `storage`.
+    The storage is bound to the qualified name of the function.
+
+    Args:
+        func (callable): The function whose results are stored.
+        storage (Storage): The storage backend.
+        typed (bool, optional): Store arguments of different types separately, so that
+            f(1), f(1.0) and f(True) get different rows. Defaults to False.
+    Returns:
+        callable: The wrapped function.
+    """
+    storage = storage.bind(f'{func.__module__}.{func.__qualname__}')
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def wrapper_read_through(*args, **kwargs):
+            key = _storage_key(args, kwargs, typed)
+            result = storage.get(key, _MISSING)
+            if result is _MISSING:
+                result = await func(*args, **kwargs)
+                storage.put(key, result)
+            return result
+
+        return wrapper_read_through
+
+    @functools.wraps(func)
+    def wrapper_read_through(*args, **kwargs):
+        key = _storage_key(args, kwargs, typed)
+        result = storage.get(key, _MISSING)
+        if result is _MISSING:
+            result = func(*args, **kwargs)
+            storage.put(key, result)
+        return result
+
+    return wrapper_read_through
@@ -23,19 +23,145 @@
 # POSSIBILITY OF SUCH DAMAGE.
 import time
 import functools
+import inspect
+import sys
+from typing import Dict, List
 
-__all__ = ['timeit']
-__version__ = '0.1.0'
+__all__ = ['timeit', 'Histogram', 'report', 'export', 'reset']
+__version__ = '0.3.0'
 __description__ = 'Измеряет время выполнения функции.'
 
+# Точность гистограммы: 2 ** (SUB_BITS - 1) интервалов на каждую степень двойки (~1.6%)
+_SUB_BITS = 7
+_HALF = 1 << (_SUB_BITS - 1)
+_BUCKETS = (64 + 2) * _HALF
 
-def timeit(func):
+# Гистограммы всех функций, отмеченных timeit(profile=True)
+_registry: Dict[str, 'Histogram'] = {}
+
+
+class Histogram(object):
+    """
+    Log-linear (HDR-style) histogram of durations in nanoseconds.
+
+    Values below 2 ** SUB_BITS are counted exactly; above that every power of two is
+    split into 2 ** (SUB_BITS - 1) equal buckets, so percentiles are accurate to about
+    1.6% with a fixed array of counters. Recording is a few integer operations and
+    takes no lock: concurrent updates from several threads may occasionally be lost.
+    """
+
+    __slots__ = ('name', 'calls', 'count', 'total', 'min', 'max', 'counts')
+
+    def __init__(self, name: str = '') -> None:
+        self.name = name
+        self.calls = 0
+        self.count = 0
+        self.total = 0
+        self.min = sys.maxsize
+        self.max = 0
+        self.counts = [0] * _BUCKETS
+
+    def record(self, value: int) -> None:
+        """
+        Add one duration in nanoseconds.
+        """
+        shift = value.bit_length() - _SUB_BITS
+        if shift > 0:
+            self.counts[shift * _HALF + (value >> shift)] += 1
+        else:
+            self.counts[value] += 1
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> float:
+        """
+        Return the approximate duration in nanoseconds below which `q` percent of the samples fall.
+        """
+        if not self.count:
+            return 0.0
+        target = max(1, -(-self.count * q // 100))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= target:
+                if index < 2 * _HALF:
+                    return float(index)
+                shift = index // _HALF - 1
+                low = (index - shift * _HALF) << shift
+                # Середина интервала, но не за пределами наблюдавшихся значений
+                return float(min(max(low + (1 << shift) / 2, self.min), self.max))
+        return float(self.max)
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Return the aggregated statistics as a dictionary. Durations are in nanoseconds.
+        """
+        return {
+            'name': self.name,
+            'calls': self.calls,
+            'count': self.count,
+            'sum': self.total,
+            'min': self.min if self.count else 0,
+            'max': self.max,
+            'mean': self.total / self.count if self.count else 0.0,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+        }
+
+    def reset(self) -> None:
+        """
+        Forget all recorded samples.
+        """
+        self.__init__(self.name)
+
+
+def export() -> List[Dict[str, float]]:
+    """
+    Return the statistics of every profiled function, see `Histogram.snapshot`.
+    """
+    return [histogram.snapshot() for histogram in _registry.values()]
+
+
+def report(file=None) -> None:
+    """
+    Print a table with the statistics of every profiled function, in microseconds.
+    """
+    file = file if file is not None else sys.stdout
+    print(f"{'function':<40} {'calls':>10} {'samples':>10} {'mean':>10} {'min':>10} "
+          f"{'p50':>10} {'p95':>10} {'p99':>10} {'max':>10}", file=file)
+    for s in export():
+        print(f"{s['name']:<40} {s['calls']:>10} {s['count']:>10} {s['mean'] / 1e3:>10.2f} {s['min'] / 1e3:>10.2f} "
+              f"{s['p50'] / 1e3:>10.2f} {s['p95'] / 1e3:>10.2f} {s['p99'] / 1e3:>10.2f} {s['max'] / 1e3:>10.2f}",
+              file=file)
+
+
+def reset() -> None:
+    """
+    Forget the samples of every profiled function.
+    """
+    for histogram in _registry.values():
+        histogram.reset()
+
+
+def timeit(func=None, *, profile=False, sample=1):
     """
     A decorator that measures the execution time of a function.
     This decorator wraps a function and prints the time it took to execute the function.
     It also prints the function's name, its positional arguments, and its keyword arguments.
+    For a coroutine function the time is measured until the coroutine completes.
+
+    With `profile=True` nothing is printed. Durations are measured with `perf_counter_ns`
+    and added to a per-function `Histogram`; read them with `wrapper.stats()` or, for all
+    profiled functions, with `report()` and `export()` from this module.
     Args:
         func (callable): The function to be wrapped by the decorator.
+        profile (bool, optional): Record into a histogram instead of printing. Defaults to False.
+        sample (int, optional): In profile mode, measure only every `sample`-th call. Defaults to 1.
     Returns:
         callable: The wrapped function that includes execution time measurement.
     Example:
@@ -45,8 +171,28 @@ def timeit(func):
             pass
         example_function(1, 2)
         # Output: Function 'example_function' with arguments (1, 2) and keywords arguments {} executed in X.XXXX seconds
+
+        @timeit(profile=True, sample=10)
+        def hot_function(x):
+            return x * 2
+        hot_function.stats()  # {'calls': ..., 'p50': ..., 'p99': ..., ...}
     """
-    
+    if func is None:
+        return functools.partial(timeit, profile=profile, sample=sample)
+    if profile:
+        return _profiled(func, sample)
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def wrapper_timeit(*args, **kwargs):
+            start_time = time.time()
+            result = await func(*args, **kwargs)
+            elapsed_time = time.time() - start_time
+            print(f"Function {func.__name__!r} with arguments {args!r} and keywords arguments {kwargs!r} executed in {elapsed_time:.4f} seconds")
+            return result
+
+        return wrapper_timeit
+
     @functools.wraps(func)
     def wrapper_timeit(*args, **kwargs):
         start_time = time.time()  # Record the start time
@@ -56,4 +202,50 @@ def timeit(func):
         print(f"Function {func.__name__!r} with arguments {args!r} and keywords arguments {kwargs!r} executed in {elapsed_time:.4f} seconds")
         return result  # Return the result of the function
 
-    return wrapper_timeit
\ No newline at end of file
+    return wrapper_timeit
+
+
+# Пакет fasttools экспортирует функцию timeit под именем модуля,
+# поэтому отчеты доступны и как timeit.report()/timeit.export()
+timeit.report = report
+timeit.export = export
+timeit.reset = reset
+
+
+def _profiled(func, sample: int):
+    """
+    Build the profile-mode wrapper recording into a registered histogram.
+    """
+    if sample < 1:
+        raise ValueError("sample must be a positive integer")
+    name = f'{func.__module__}.{func.__qualname__}'
+    histogram = _registry.setdefault(name, Histogram(name))
+    record = histogram.record
+    clock = time.perf_counter_ns
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def wrapper_timeit(*args, **kwargs):
+            histogram.calls += 1
+            if histogram.calls % sample:
+                return await func(*args, **kwargs)
+            start = clock()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                record(clock() - start)
+    else:
+        @functools.wraps(func)
+        def wrapper_timeit(*args, **kwargs):
+            histogram.calls += 1
+            if histogram.calls % sample:
+                return func(*args, **kwargs)
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(clock() - start)
+
+    wrapper_timeit.histogram = histogram
+    wrapper_timeit.stats = histogram.snapshot
+    return wrapper_timeit
@@ -23,21 +23,230 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 
+import collections.abc
 import ctypes
 import functools
+import inspect
+import itertools
+import types as _types
+import typing
 
-__all__ = ['is_type', 'TypeCheckParams']
-__version__ = '0.1.0'
+__all__ = ['is_type', 'TypeCheckParams', 'compile_validator']
+__version__ = '0.2.0'
 __description__ = 'Проверяет типы аргументов функции.'
 
+_NOT_PASSED = object()
+_UNION_TYPES = (typing.Union, getattr(_types, 'UnionType', typing.Union))
+# Числовая башня PEP 484: int подходит для float, int и float подходят для complex
+_NUMERIC_TOWER = {float: (float, int), complex: (complex, float, int)}
+
+
+def _accepted(cls):
+    """
+    Return the tuple of classes whose instances satisfy the plain class `cls`.
+    """
+    return _NUMERIC_TOWER.get(cls, (cls,))
+
+
 class TypeCheckParams(ctypes.Structure):
     _fields_ = [("types", ctypes.py_object)]
 
-def is_type(*types):
+
+def _plain_classes(tp):
+    """
+    Return the class or tuple of classes to pass to isinstance if `tp` is a plain class
+    or a union of plain classes, otherwise None.
+    """
+    if isinstance(tp, type) and typing.get_origin(tp) is None and tp is not object:
+        return _accepted(tp)
+    if tp is None:
+        return type(None)
+    if typing.get_origin(tp) in _UNION_TYPES:
+        params = typing.get_args(tp)
+        if all(isinstance(arg, type) and typing.get_origin(arg) is None and arg is not object for arg in params):
+            return tuple(cls for arg in params for cls in _accepted(arg))
+    return None
+
+
+def _predicate(tp):
+    """
+    Compile an annotation into a predicate `value -> bool`, or None if anything is accepted.
+    Supports classes, Any, Optional/Union (including `X | Y`), list/set/frozenset[X],
+    tuple[X, ...], tuple[X, Y], dict[K, V], Callable and Literal; other generics are
+    checked against their origin class only (so are Iterable, Iterator and Generator,
+    whose elements cannot be checked without consuming them). `int` is accepted for `float` and `int` or
+    `float` for `complex`, as in PEP 484.
+    """
+    if tp is typing.Any or tp is object or isinstance(tp, typing.TypeVar):
+        return None
+    if tp is None or tp is type(None):
+        return lambda value: value is None
+
+    origin = typing.get_origin(tp)
+    params = typing.get_args(tp)
+
+    if origin in _UNION_TYPES:
+        predicates = [_predicate(arg) for arg in params]
+        if any(p is None for p in predicates):
+            return None
+        plain = tuple(arg for arg in params if isinstance(arg, type) and not typing.get_args(arg))
+        if len(plain) == len(params):
+            plain = tuple(cls for arg in plain for cls in _accepted(arg))
+            # Объединение простых классов проверяется одним isinstance
+            return lambda value: isinstance(value, plain)
+        return lambda value: any(p(value) for p in predicates)
+
+    if origin is typing.Literal:
+        allowed = params
+        return lambda value: value in allowed
+
+    if origin is None:
+        if isinstance(tp, type):
+            accepted = _accepted(tp)
+            return lambda value: isinstance(value, accepted)
+        return None
+
+    if origin is collections.abc.Callable:
+        return callable
+
+    if not isinstance(origin, type):
+        return None
+
+    # Элементы проверяются только у контейнеров, которые можно обойти повторно:
+    # Iterable, Iterator и Generator проверяются по классу, иначе проверка их исчерпает
+    if origin in (list, set, frozenset, collections.abc.Sequence, collections.abc.Set,
+                  collections.abc.MutableSequence) and params:
+        item = _predicate(params[0])
+        if item is None:
+            return lambda value: isinstance(value, origin)
+        return lambda value: isinstance(value, origin) and all(map(item, value))
+
+    if origin is tuple and params:
+        if len(params) == 2 and params[1] is Ellipsis:
+            item = _predicate(params[0])
+            if item is None:
+                return lambda value: isinstance(value, tuple)
+            return lambda value: isinstance(value, tuple) and all(map(item, value))
+        items = [_predicate(arg) or (lambda value: True) for arg in params]
+        size = len(items)
+        return lambda value: (isinstance(value, tuple) and len(value) == size
+                              and all(p(v) for p, v in zip(items, value)))
+
+    if origin in (dict, collections.abc.Mapping, collections.abc.MutableMapping) and params:
+        key, val = _predicate(params[0]), _predicate(params[1])
+        if key is None and val is None:
+            return lambda value: isinstance(value, origin)
+        key = key or (lambda k: True)
+        val = val or (lambda v: True)
+        return lambda value: isinstance(value, origin) and all(key(k) and val(v) for k, v in value.items())
+
+    return lambda value: isinstance(value, origin)
+
+
+def compile_validator(func):
+    """
+    Build a function with the same signature as `func` that checks its arguments
+    against the annotations of `func` and raises TypeError on a mismatch.
+
+    All introspection happens here, once: the generated checker lets Python bind
+    positional, keyword and default arguments, then runs one precompiled predicate
+    per annotated parameter. Default values are not checked: an argument that was not
+    passed keeps its default unvalidated, so `def f(x: float = 0)` decorates fine.
+    Args:
+        func (callable): The annotated function.
+    Returns:
+        callable: The checker, or None if `func` has no checkable annotations.
+    """
+    signature = inspect.signature(func)
+    hints = typing.get_type_hints(func)
+    # Служебные имена с префиксом, чтобы не пересечься с именами параметров
+    namespace = {'_tc_not_passed': _NOT_PASSED, '_tc_fail': _fail}
+    params = []
+    checks = []
+    kind = inspect.Parameter
+    parameters = list(signature.parameters.values())
+
+    for index, parameter in enumerate(parameters):
+        name = parameter.name
+        predicate = _predicate(hints[name]) if name in hints else None
+        if predicate is not None:
+            namespace[f'_tc_p{index}'] = predicate
+            namespace[f'_tc_t{index}'] = hints[name]
+            classes = _plain_classes(hints[name])
+            if classes is not None:
+                # Простые классы проверяются прямым isinstance без вызова предиката
+                namespace[f'_tc_c{index}'] = classes
+                test = f'isinstance(%s, _tc_c{index})'
+            else:
+                test = f'_tc_p{index}(%s)'
+        fail = f'_tc_fail({name!r}, _tc_t{index}, '
+
+        if parameter.kind is kind.VAR_POSITIONAL:
+            params.append(f'*{name}')
+            if predicate is not None:
+                checks.append(f'    for _tc_v in {name}:\n'
+                              f'        if not {test % "_tc_v"}: {fail}_tc_v)')
+        elif parameter.kind is kind.VAR_KEYWORD:
+            params.append(f'**{name}')
+            if predicate is not None:
+                checks.append(f'    for _tc_v in {name}.values():\n'
+                              f'        if not {test % "_tc_v"}: {fail}_tc_v)')
+        else:
+            if parameter.kind is kind.KEYWORD_ONLY and not any(p.startswith('*') for p in params):
+                params.append('*')
+            if parameter.default is kind.empty:
+                params.append(name)
+                if predicate is not None:
+                    checks.append(f'    if not {test % name}: {fail}{name})')
+            else:
+                params.append(f'{name}=_tc_not_passed')
+                if predicate is not None:
+                    checks.append(f'    if {name} is not _tc_not_passed and not {test % name}: {fail}{name})')
+            if parameter.kind is kind.POSITIONAL_ONLY:
+                following = parameters[index + 1:]
+                if not following or following[0].kind is not kind.POSITIONAL_ONLY:
+                    params.append('/')
+
+    if not checks:
+        return None
+    source = f"def _tc_check({', '.join(params)}):\n" + '\n'.join(checks) + '\n'
+    exec(source, namespace)
+    return namespace['_tc_check']
+
+
+def _compile_positional(types):
+    """
+    Build the checker for explicit `is_type(*types)`: the argument count must match
+    and every positional argument must be an instance of the type at its position.
+    """
+    namespace = {f'_tc_t{i}': t for i, t in enumerate(types)}
+    lines = ['def _tc_check(*args, **kwargs):',
+             f'    if len(args) != {len(types)}: raise ValueError("Argument count does not match")']
+    if types:
+        lines.append(f"    {', '.join(f'_tc_a{i}' for i in range(len(types)))}, = args")
+    for i in range(len(types)):
+        lines.append(f'    if not isinstance(_tc_a{i}, _tc_t{i}): '
+                     f'raise TypeError(f"Expected {{_tc_t{i}}}, got {{type(_tc_a{i})}}")')
+    exec('\n'.join(lines) + '\n', namespace)
+    return namespace['_tc_check']
+
+
+def _fail(name, expected, value):
+    raise TypeError(f"Argument {name!r} expected {expected}, got {type(value)}")
+
+
+def is_type(*types, sample=None, first=None):
     """
     A decorator to enforce type checking on function arguments.
+
+    With explicit `types`, positional arguments are checked against them in order.
+    Without `types`, the checks are compiled from the function's annotations, so
+    keyword arguments, defaults and generics such as `Optional[int]`, `list[int]` and
+    `dict[str, X]` are validated too (see `compile_validator`).
     Parameters:
         *types: Variable length argument list of types to check against the function arguments.
+        sample (int, optional): Check only every `sample`-th call, for hot paths.
+        first (int, optional): Check only the first `first` calls.
     Returns:
         decorator_type_check (function): A decorator function that wraps the original function with type checking.
     Raises:
@@ -49,19 +258,53 @@ def is_type(*types):
             return f"{a} is an integer and {b} is a string"
         example_function(1, "hello")  # This will work
         example_function(1, 2)        # This will raise TypeError
+
+        @is_type()
+        def scale(values: list[float], factor: Optional[float] = None, *, names: dict[str, int]) -> None:
+            ...
     """
     params = TypeCheckParams(types)
 
     def decorator_type_check(func):
-        @functools.wraps(func)
-        def wrapper_type_check(*args, **kwargs):
-            if len(args) != len(params.types):
-                raise ValueError("Argument count does not match")
-            for a, t in zip(args, params.types):
-                if not isinstance(a, t):
-                    raise TypeError(f"Expected {t}, got {type(a)}")
-            return func(*args, **kwargs)
+        if params.types:
+            check = _compile_positional(params.types)
+        else:
+            check = compile_validator(func)
+            if check is None:
+                return func
+
+        if sample is None and first is None:
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def wrapper_type_check(*args, **kwargs):
+                    check(*args, **kwargs)
+                    return await func(*args, **kwargs)
+            else:
+                @functools.wraps(func)
+                def wrapper_type_check(*args, **kwargs):
+                    check(*args, **kwargs)
+                    return func(*args, **kwargs)
+            return wrapper_type_check
+
+        # Номер вызова решает, проверяется ли он
+        calls = itertools.count()
+        every = sample or 1
+        limit = first if first is not None else float('inf')
 
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper_type_check(*args, **kwargs):
+                n = next(calls)
+                if n < limit and not n % every:
+                    check(*args, **kwargs)
+                return await func(*args, **kwargs)
+        else:
+            @functools.wraps(func)
+            def wrapper_type_check(*args, **kwargs):
+                n = next(calls)
+                if n < limit and not n % every:
+                    check(*args, **kwargs)
+                return func(*args, **kwargs)
         return wrapper_type_check
 
-    return decorator_type_check
\ No newline at end of file
+    return decorator_type_check
@@ -0,0 +1,37 @@
+import sys
+import time
+from array import array
+
+from pygoodtools.basetypes.HashMap import HashMap
+from pygoodtools.basetypes.UnorderedMap import UnorderedMap
+
+RECORDS = 500_000
+
+
+def timed(action):
+    started = time.perf_counter()
+    result = action()
+    return result, time.perf_counter() - started
+
+
+def single_puts(factory, setter, records):
+    m = factory()
+    put = getattr(m, setter)
+    for k, v in records:
+        put(k, v)
+    return m
+
+
+if __name__ == '__main__':
+    RECORDS = int(sys.argv[1]) if len(sys.argv) > 1 else RECORDS
+    keys = array('q', range(RECORDS))
+    records = list(zip(keys.tolist(), range(RECORDS)))
+    for name, factory, setter in [('HashMap', HashMap, 'put'), ('UnorderedMap', UnorderedMap, 'insert')]:
+        m, loop = timed(lambda: single_puts(factory, setter, records))
+        _, bulk = timed(lambda: factory.from_items(records))
+        _, buffer = timed(lambda: factory.from_items(keys, keys))
+        get = m.get if setter == 'put' else m.find
+        _, get_loop = timed(lambda: [get(k) for k in keys.tolist()])
+        _, get_bulk = timed(lambda: m.get_many(keys))
+        print(f"{name:<13} put loop {loop:5.2f} s  from_items {bulk:5.2f} s  from buffer {buffer:5.2f} s  "
+              f"get loop {get_loop:5.2f} s  get_many {get_bulk:5.2f} s")
@@ -0,0 +1,99 @@
+import threading
+import unittest
+from array import array
+
+from pygoodtools.basetypes.HashMap import HashMap
+from pygoodtools.basetypes.UnorderedMap import UnorderedMap
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class BulkMixin:
+    def test_from_items_and_get_many(self):
+        m = self.map_type.from_items([(i, i * i) for i in range(1000)])
+        self.assertEqual(len(m), 1000)
+        self.assertEqual(m.get_many([3, 999, 5000], default=-1), [9, 998001, -1])
+
+    def test_put_many_accepts_mapping_pairs_and_parallel_sequences(self):
+        m = self.map_type()
+        m.put_many({'a': 1, 'b': 2})
+        m.put_many(iter([('b', 3), ('c', 4)]))
+        m.put_many(['d', 'e'], [5, 6])
+        self.assertEqual(m.get_many('abcde'), [1, 3, 4, 5, 6])
+        with self.assertRaises(ValueError):
+            m.put_many(['x'], [1, 2])
+
+    def test_buffers_are_read_as_python_ints(self):
+        keys = array('q', range(100))
+        m = self.map_type.from_items(keys, array('d', range(100)))
+        self.assertEqual(m.get_many(array('q', [0, 50, 99])), [0.0, 50.0, 99.0])
+        self.assertEqual(m.remove_many(memoryview(array('q', [1, 2, 2, 500]))), 2)
+        self.assertEqual(len(m), 98)
+
+    @unittest.skipUnless(numpy, 'requires numpy')
+    def test_numpy_arrays(self):
+        keys = numpy.arange(1000, dtype=numpy.int64)
+        m = self.map_type.from_items(keys, keys * 2)
+        self.assertEqual(m.get_many(numpy.array([10, 20])), [20, 40])
+        self.assertEqual(m.remove_many(keys[:500]), 500)
+
+
+class TestHashMapBulk(BulkMixin, unittest.TestCase):
+    map_type = HashMap
+
+    def test_put_many_grows_once(self):
+        m = HashMap()
+        m.put(0, 'old')
+        m.put_many((i, i) for i in range(1, 10000))
+        self.assertEqual(len(m), 10000)
+        self.assertEqual(m.get_many(range(10000)), [i if i else 'old' for i in range(10000)])
+
+    def test_put_many_finishes_pending_migration(self):
+        m = HashMap(incremental=True)
+        i = 0
+        while m._old_keys is None:
+            m.put(i, i)
+            i += 1
+        m.put_many([(i, i), (0, 'new')])
+        self.assertIsNone(m._old_keys)
+        self.assertEqual(len(m), i + 1)
+        self.assertEqual(m.get(0), 'new')
+
+    def test_remove_many_shrinks_once(self):
+        m = HashMap.from_items((i, i) for i in range(10000))
+        self.assertEqual(m.remove_many(range(9990)), 9990)
+        self.assertLessEqual(m.capacity.value, 64)
+        self.assertEqual(sorted(m.keys()), list(range(9990, 10000)))
+
+    def test_incremental_remove_many_then_put_does_not_hang(self):
+        n = 65536
+        m = HashMap(incremental=True)
+        for i in range(n):
+            m.put(i, i)
+        result = []
+
+        def run():
+            m.remove_many(range(n - 10))
+            # Сжатие после массового удаления не оставляет старую таблицу
+            result.append(m._old_keys is None)
+            for i in range(n, n + 1000):
+                m.put(i, i)
+            result.append(sorted(m.keys()))
+
+        worker = threading.Thread(target=run, daemon=True)
+        worker.start()
+        worker.join(timeout=30)
+        self.assertFalse(worker.is_alive(), 'put after remove_many hung')
+        self.assertEqual(result, [True, list(range(n - 10, n + 1000))])
+
+
+class TestUnorderedMapBulk(BulkMixin, unittest.TestCase):
+    map_type = UnorderedMap
+
+    def test_update_accepts_unordered_map(self):
+        m = UnorderedMap.from_items({'a': 1})
+        m.update(UnorderedMap.from_items({'b': 2}))
+        self.assertEqual(dict(m.items()), {'a': 1, 'b': 2})
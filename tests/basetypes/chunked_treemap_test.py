@@ -0,0 +1,67 @@
+import bisect
+import random
+import unittest
+from array import array
+
+from pygoodtools.basetypes.ChunkedTreeMap import ChunkedTreeMap
+
+
+class TestChunkedTreeMap(unittest.TestCase):
+    def test_random_operations_match_sorted_dict(self):
+        rng = random.Random(19)
+        m, expected = ChunkedTreeMap(load=8), {}
+        for _ in range(5000):
+            key = rng.randrange(1000)
+            if rng.random() < 0.6:
+                m.put(key, -key)
+                expected[key] = -key
+            else:
+                self.assertEqual(m.remove(key), expected.pop(key, None) is not None)
+            self.assertEqual(m.get(key), expected.get(key))
+        self.assertEqual(len(m), len(expected))
+        self.assertEqual(list(m.items()), sorted(expected.items()))
+        self.assertTrue(all(len(chunk) <= 16 for chunk in m._keys))
+        self.assertEqual(m._maxes, [chunk[-1] for chunk in m._keys])
+
+    def test_range_and_neighbour_queries(self):
+        m = ChunkedTreeMap.from_sorted([(k, k) for k in range(0, 100, 10)], load=4)
+        self.assertEqual([k for k, _ in m.irange(15, 50)], [20, 30, 40, 50])
+        self.assertEqual([k for k, _ in m.irange(20, 50, inclusive=(False, False))], [30, 40])
+        self.assertEqual([k for k, _ in m.irange(hi=25, reverse=True)], [20, 10, 0])
+        self.assertEqual([k for k, _ in m.irange(80)], [80, 90])
+        self.assertEqual(list(m.irange(91)), [])
+        self.assertEqual(m.floor(35), (30, 30))
+        self.assertEqual(m.floor(40), (40, 40))
+        self.assertIsNone(m.floor(-1))
+        self.assertEqual(m.floor(1000), (90, 90))
+        self.assertEqual(m.ceiling(35), (40, 40))
+        self.assertIsNone(m.ceiling(91))
+        self.assertEqual((m.first(), m.last()), ((0, 0), (90, 90)))
+        self.assertIsNone(ChunkedTreeMap().last())
+
+    def test_rank_select_and_islice(self):
+        rng = random.Random(5)
+        keys = sorted(rng.sample(range(10000), 500))
+        m = ChunkedTreeMap(load=16)
+        for k in rng.sample(keys, len(keys)):
+            m.put(k, None)
+        for probe in range(0, 10000, 37):
+            self.assertEqual(m.rank(probe), bisect.bisect_left(keys, probe))
+        for i in range(0, len(keys), 7):
+            self.assertEqual(m.select(i)[0], keys[i])
+        self.assertEqual(m.select(-1)[0], keys[-1])
+        with self.assertRaises(IndexError):
+            m.select(len(keys))
+        self.assertEqual([k for k, _ in m.islice(40, 90)], keys[40:90])
+        self.assertEqual([k for k, _ in m.islice(-5, reverse=True)], keys[-5:][::-1])
+
+    def test_from_sorted(self):
+        m = ChunkedTreeMap.from_sorted(array('q', range(0, 3000, 3)), array('q', range(1000)), load=100)
+        self.assertEqual(len(m._keys), 10)
+        self.assertEqual(m.get(2997), 999)
+        self.assertIn(300, m)
+        self.assertNotIn(301, m)
+        with self.assertRaises(ValueError):
+            ChunkedTreeMap.from_sorted([(1, 'a'), (1, 'b')])
+        with self.assertRaises(ValueError):
+            ChunkedTreeMap.from_sorted([2, 1], ['a', 'b'])
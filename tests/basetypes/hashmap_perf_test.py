@@ -0,0 +1,99 @@
+import ctypes
+import sys
+import time
+import tracemalloc
+
+from pygoodtools.basetypes.HashMap import HashMap
+
+ENTRIES = 1_000_000
+
+
+# HashMap в том виде, в каком он был до перехода на открытую адресацию
+class LegacyHashMap:
+    def __init__(self, initial_capacity=16):
+        self.capacity = ctypes.c_int(initial_capacity)
+        self.size = ctypes.c_int(0)
+        self.buckets = (ctypes.py_object * initial_capacity)()
+        for i in range(initial_capacity):
+            self.buckets[i] = []
+
+    def _hash(self, key):
+        return hash(key) % self.capacity.value
+
+    def put(self, key, value):
+        bucket = self.buckets[self._hash(key)]
+        for i in range(len(bucket)):
+            if bucket[i][0] == key:
+                bucket[i] = (key, value)
+                return
+        bucket.append((key, value))
+        self.size.value += 1
+        if self.size.value / self.capacity.value > 0.7:
+            self._resize()
+
+    def get(self, key):
+        for k, v in self.buckets[self._hash(key)]:
+            if k == key:
+                return v
+        return None
+
+    def _resize(self):
+        new_capacity = self.capacity.value * 2
+        new_buckets = (ctypes.py_object * new_capacity)()
+        for i in range(new_capacity):
+            new_buckets[i] = []
+        for i in range(self.capacity.value):
+            for k, v in self.buckets[i]:
+                new_buckets[hash(k) % new_capacity].append((k, v))
+        self.buckets = new_buckets
+        self.capacity.value = new_capacity
+
+
+class DictMap(dict):
+    put = dict.__setitem__
+    get = dict.get
+
+
+def fill(factory, keys):
+    m = factory()
+    put = m.put
+    for k in keys:
+        put(k, k)
+    return m
+
+
+def memory_used(factory, keys):
+    # tracemalloc замедляет выделения, поэтому память меряется отдельным прогоном
+    tracemalloc.start()
+    m = fill(factory, keys)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del m
+    return memory
+
+
+def build(factory, keys):
+    started = time.perf_counter()
+    m = fill(factory, keys)
+    return m, time.perf_counter() - started
+
+
+def lookup(m, keys):
+    get = m.get
+    started = time.perf_counter()
+    for k in keys:
+        get(k)
+    return time.perf_counter() - started
+
+
+if __name__ == '__main__':
+    ENTRIES = int(sys.argv[1]) if len(sys.argv) > 1 else ENTRIES
+    # Ключи создаются заранее, чтобы в память попадала только сама таблица
+    keys = [f'key-{i}' for i in range(ENTRIES)]
+    for name, factory in [('dict', DictMap), ('legacy HashMap', LegacyHashMap), ('HashMap', HashMap)]:
+        memory = memory_used(factory, keys)
+        m, put_time = build(factory, keys)
+        get_time = lookup(m, keys)
+        print(f"{name:<16} {memory / ENTRIES:7.1f} B/entry "
+              f"{ENTRIES / put_time / 1e6:6.2f} M put/s {ENTRIES / get_time / 1e6:6.2f} M get/s")
+        del m
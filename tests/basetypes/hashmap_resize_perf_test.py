@@ -0,0 +1,30 @@
+import sys
+import time
+
+from pygoodtools.basetypes.HashMap import HashMap
+
+ENTRIES = 2_000_000
+
+
+def fill(m, keys):
+    put = m.put
+    clock = time.perf_counter
+    worst = 0.0
+    started = clock()
+    for k in keys:
+        t = clock()
+        put(k, k)
+        worst = max(worst, clock() - t)
+    return clock() - started, worst
+
+
+if __name__ == '__main__':
+    ENTRIES = int(sys.argv[1]) if len(sys.argv) > 1 else ENTRIES
+    keys = list(range(ENTRIES))
+    cases = [('stop-the-world', HashMap()), ('incremental', HashMap(incremental=True))]
+    reserved = HashMap()
+    reserved.reserve(ENTRIES)
+    cases.append(('reserve(n)', reserved))
+    for name, m in cases:
+        total, worst = fill(m, keys)
+        print(f"{name:<16} total {total:6.2f} s   worst put {worst * 1e3:8.2f} ms")
@@ -0,0 +1,157 @@
+import random
+import unittest
+
+from pygoodtools.basetypes.HashMap import HashMap
+
+
+class CollidingKey:
+    """Key whose hash is shared by many instances."""
+
+    def __init__(self, n):
+        self.n = n
+
+    def __hash__(self):
+        return self.n % 7
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and other.n == self.n
+
+
+class TestHashMap(unittest.TestCase):
+    def test_put_get_update(self):
+        m = HashMap()
+        m.put('a', 1)
+        m.put('b', 2)
+        m.put('a', 3)
+        self.assertEqual(m.get('a'), 3)
+        self.assertEqual(m.get('b'), 2)
+        self.assertIsNone(m.get('c'))
+        self.assertEqual(len(m), 2)
+        self.assertTrue(m.contains_key('b'))
+        self.assertFalse(m.contains_key('c'))
+
+    def test_grows_and_keeps_entries(self):
+        m = HashMap(initial_capacity=4)
+        for i in range(1000):
+            m.put(i, str(i))
+        self.assertEqual(len(m), 1000)
+        self.assertGreaterEqual(m.capacity.value, 1000)
+        self.assertEqual(m.capacity.value & (m.capacity.value - 1), 0)
+        self.assertTrue(all(m.get(i) == str(i) for i in range(1000)))
+
+    def test_remove_keeps_probe_chains_intact(self):
+        m = HashMap()
+        keys = [CollidingKey(n) for n in range(50)]
+        for k in keys:
+            m.put(k, k.n)
+        for k in keys[::2]:
+            self.assertTrue(m.remove(k))
+        self.assertFalse(m.remove(keys[0]))
+        for k in keys:
+            self.assertEqual(m.contains_key(k), k.n % 2 == 1)
+        self.assertEqual(len(m), 25)
+
+    def test_random_operations_match_dict(self):
+        rng = random.Random(42)
+        m, expected = HashMap(), {}
+        for _ in range(20000):
+            key = rng.randrange(2000) - 1000
+            op = rng.random()
+            if op < 0.6:
+                m.put(key, op)
+                expected[key] = op
+            elif op < 0.9:
+                self.assertEqual(m.remove(key), expected.pop(key, None) is not None)
+            else:
+                self.assertEqual(m.get(key), expected.get(key))
+        self.assertEqual(len(m), len(expected))
+        self.assertEqual(sorted(m.items()), sorted(expected.items()))
+        self.assertEqual(sorted(m.keys()), sorted(expected))
+
+    def test_clear(self):
+        m = HashMap()
+        for i in range(100):
+            m.put(i, i)
+        m.clear()
+        self.assertEqual(len(m), 0)
+        self.assertEqual(m.items(), [])
+        self.assertEqual(m.capacity.value, 16)
+        m.put(1, 1)
+        self.assertEqual(m.get(1), 1)
+
+
+class TestHashMapResize(unittest.TestCase):
+    def test_incremental_resize_keeps_both_tables_consistent(self):
+        rng = random.Random(7)
+        m, expected = HashMap(incremental=True), {}
+        saw_migration = False
+        for _ in range(30000):
+            key = rng.randrange(3000)
+            op = rng.random()
+            if op < 0.55:
+                m.put(key, op)
+                expected[key] = op
+            elif op < 0.8:
+                self.assertEqual(m.remove(key), expected.pop(key, None) is not None)
+            elif op < 0.9:
+                self.assertEqual(m.contains_key(key), key in expected)
+            else:
+                self.assertEqual(m.get(key), expected.get(key))
+            if m._old_keys is not None:
+                saw_migration = True
+                # Старая таблица должна опустеть раньше, чем новая заполнится
+                self.assertLessEqual(m._used + m._old_live, m._limit)
+            self.assertEqual(len(m), len(expected))
+        self.assertTrue(saw_migration)
+        self.assertEqual(sorted(m.items()), sorted(expected.items()))
+
+    def test_incremental_put_moves_bounded_number_of_slots(self):
+        m = HashMap(initial_capacity=1024, incremental=True)
+        i = 0
+        while m._old_keys is None:
+            m.put(i, i)
+            i += 1
+        self.assertEqual(m._cursor, 0)
+        m.put(i, i)
+        self.assertEqual(m._cursor, 16)
+        self.assertEqual(len(m), i + 1)
+        self.assertTrue(all(m.get(k) == k for k in range(i + 1)))
+
+    def test_old_table_drains_before_new_one_fills(self):
+        m = HashMap.from_items(((i, i) for i in range(5000)), incremental=True)
+        for i in range(4990):
+            m._remove(i)
+        # Маленькая новая таблица и большая старая: шаг переноса должен это учесть
+        m._resize(32)
+        room = m._limit - m._old_live
+        for i in range(room):
+            m.put(-i - 1, i)
+        self.assertIsNone(m._old_keys)
+        m.put(-room - 1, room)
+        self.assertEqual(len(m), 10 + room + 1)
+        self.assertEqual(sorted(m.keys()), list(range(-room - 1, 0)) + list(range(4990, 5000)))
+
+    def test_reserve_presizes_and_prevents_shrinking(self):
+        m = HashMap()
+        m.reserve(10000)
+        capacity = m.capacity.value
+        self.assertGreaterEqual(capacity * 0.8, 10000)
+        for i in range(10000):
+            m.put(i, i)
+        self.assertEqual(m.capacity.value, capacity)
+        for i in range(10000):
+            m.remove(i)
+        self.assertEqual(m.capacity.value, capacity)
+
+    def test_shrinks_after_mass_remove(self):
+        for incremental in (False, True):
+            m = HashMap(incremental=incremental)
+            for i in range(10000):
+                m.put(i, i)
+            grown = m.capacity.value
+            for i in range(9990):
+                m.remove(i)
+            for i in range(100):
+                m.get(i)
+            self.assertLess(m.capacity.value, grown // 16)
+            self.assertEqual(sorted(m.keys()), list(range(9990, 10000)))
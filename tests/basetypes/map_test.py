@@ -0,0 +1,87 @@
+import random
+import unittest
+
+from pygoodtools.basetypes.Map import Map
+
+
+class TestMap(unittest.TestCase):
+    def test_put_replaces_existing_key_in_place(self):
+        m = Map()
+        m.put('a', 1)
+        m.put('b', 2)
+        m.put('a', 3)
+        self.assertEqual(len(m), 2)
+        self.assertEqual(m.items(), [('a', 3), ('b', 2)])
+
+    def test_remove_keeps_order_and_compacts(self):
+        m = Map()
+        for i in range(100):
+            m.put(i, str(i))
+        for i in range(0, 100, 3):
+            self.assertTrue(m.remove(i))
+        self.assertFalse(m.remove(0))
+        for i in range(1, 100, 3):
+            m.remove(i)
+        self.assertEqual(m.keys(), list(range(2, 100, 3)))
+        self.assertLessEqual(len(m._keys), 2 * len(m) + 16)
+        self.assertEqual(m.get(5), '5')
+        self.assertIsNone(m.get(4))
+
+    def test_get_key_returns_first_inserted_key(self):
+        m = Map()
+        m.put('a', 1)
+        m.put('b', 2)
+        m.put('c', 1)
+        self.assertEqual(m.get_key(1), 'a')
+        m.update('a', 5)
+        self.assertEqual(m.get_key(1), 'c')
+        self.assertEqual(m.get_key(5), 'a')
+        m.remove('c')
+        self.assertIsNone(m.get_key(1))
+
+    def test_unhashable_values(self):
+        m = Map()
+        m.put('a', [1])
+        m.put('b', [2])
+        m.put('c', [1])
+        self.assertEqual(m.get_key([1]), 'a')
+        m.remove('a')
+        self.assertEqual(m.get_key([1]), 'c')
+        m.update('c', 3)
+        self.assertIsNone(m.get_key([1]))
+        self.assertEqual(m.get_key(3), 'c')
+
+    def test_update_missing_key_raises(self):
+        with self.assertRaises(KeyError):
+            Map().update('x', 1)
+
+    def test_merge_and_size(self):
+        a, b = Map(), Map()
+        a.put('x', 1)
+        b.put('x', 2)
+        b.put('y', 3)
+        a.merge(b)
+        self.assertEqual(a.items(), [('x', 2), ('y', 3)])
+        self.assertEqual(a.size.value, 2)
+
+    def test_get_p_points_to_value(self):
+        m = Map()
+        m.put('a', 'value')
+        self.assertEqual(m.get_p('a').contents.value, 'value')
+        self.assertIsNone(m.get_p('b'))
+
+    def test_random_operations_match_dict(self):
+        rng = random.Random(3)
+        m, expected = Map(), {}
+        for _ in range(20000):
+            key = rng.randrange(500)
+            if rng.random() < 0.6:
+                value = rng.randrange(50)
+                m.put(key, value)
+                expected[key] = value
+            else:
+                self.assertEqual(m.remove(key), expected.pop(key, None) is not None)
+            value = rng.randrange(50)
+            first = next((k for k, v in expected.items() if v == value), None)
+            self.assertEqual(m.get_key(value), first)
+        self.assertEqual(m.items(), list(expected.items()))
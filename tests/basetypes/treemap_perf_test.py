@@ -0,0 +1,94 @@
+import bisect
+import random
+import sys
+import time
+import tracemalloc
+
+from pygoodtools.basetypes.ChunkedTreeMap import ChunkedTreeMap
+from pygoodtools.basetypes.TreeMap import TreeMap
+
+try:
+    from sortedcontainers import SortedDict
+except ImportError:
+    SortedDict = None
+
+KEYS = 1_000_000
+
+
+def timed(action):
+    started = time.perf_counter()
+    action()
+    return time.perf_counter() - started
+
+
+def bench_treemap(keys, probes, factory=TreeMap):
+    t = factory()
+    put, get = t.put, t.get
+    results = {'insert': timed(lambda: [put(k, k) for k in keys]),
+               'lookup': timed(lambda: [get(k) for k in probes]),
+               'range 1k': timed(lambda: [sum(1 for _ in t.irange(k, k + 1000)) for k in probes[:1000]]),
+               'iterate': timed(lambda: sum(1 for _ in t.items())),
+               'remove': timed(lambda: [t.remove(k) for k in probes])}
+    return results
+
+
+def bench_chunked(keys, probes):
+    results = bench_treemap(keys, probes, ChunkedTreeMap)
+    ordered = sorted(keys)
+    results['from_sorted'] = timed(lambda: ChunkedTreeMap.from_sorted(ordered, ordered))
+    return results
+
+
+def memory_per_key(factory, keys):
+    tracemalloc.start()
+    m = factory()
+    for k in keys:
+        m.put(k, k)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return memory / len(keys)
+
+
+def bench_sorted_dict(keys, probes):
+    d = SortedDict()
+    results = {'insert': timed(lambda: [d.__setitem__(k, k) for k in keys]),
+               'lookup': timed(lambda: [d.get(k) for k in probes]),
+               'range 1k': timed(lambda: [sum(1 for _ in d.irange(k, k + 1000)) for k in probes[:1000]]),
+               'iterate': timed(lambda: sum(1 for _ in d.items())),
+               'remove': timed(lambda: [d.pop(k, None) for k in probes])}
+    return results
+
+
+def bench_bisect(keys, probes):
+    # Отсортированный список с bisect: вставка в середину сдвигает хвост
+    lst = []
+
+    def lookup():
+        for k in probes:
+            i = bisect.bisect_left(lst, k)
+            i < len(lst) and lst[i] == k
+
+    results = {'insert': timed(lambda: [bisect.insort(lst, k) for k in keys]),
+               'lookup': timed(lookup),
+               'range 1k': timed(lambda: [len(lst[bisect.bisect_left(lst, k):bisect.bisect_right(lst, k + 1000)])
+                                          for k in probes[:1000]]),
+               'iterate': timed(lambda: sum(1 for _ in lst)),
+               'remove': timed(lambda: [lst.pop(bisect.bisect_left(lst, k)) for k in probes[:10000]])}
+    results['remove'] *= len(probes) / 10000
+    return results
+
+
+if __name__ == '__main__':
+    KEYS = int(sys.argv[1]) if len(sys.argv) > 1 else KEYS
+    rng = random.Random(1)
+    keys = rng.sample(range(KEYS * 10), KEYS)
+    probes = rng.sample(keys, len(keys) // 10)
+    engines = [('TreeMap', bench_treemap), ('ChunkedTreeMap', bench_chunked), ('bisect list', bench_bisect)]
+    if SortedDict is not None:
+        engines.append(('SortedDict', bench_sorted_dict))
+    for name, bench in engines:
+        results = bench(keys, probes)
+        print(f"{name:<14} " + "  ".join(f"{op} {seconds:6.2f} s" for op, seconds in results.items()))
+    # Ключи уже созданы, поэтому в память попадает только сама структура
+    for name, factory in [('TreeMap', TreeMap), ('ChunkedTreeMap', ChunkedTreeMap)]:
+        print(f"{name:<14} {memory_per_key(factory, keys):6.1f} B/key")
@@ -0,0 +1,86 @@
+import bisect
+import random
+import unittest
+
+from pygoodtools.basetypes.TreeMap import TreeMap
+
+
+def check_invariants(test, node):
+    if node is None:
+        return 0, 0
+    lh, ls = check_invariants(test, node.left)
+    rh, rs = check_invariants(test, node.right)
+    test.assertLessEqual(abs(lh - rh), 1)
+    test.assertEqual(node.height, max(lh, rh) + 1)
+    test.assertEqual(node.size, ls + rs + 1)
+    return node.height, node.size
+
+
+class TestTreeMap(unittest.TestCase):
+    def test_put_get_and_ordered_items(self):
+        t = TreeMap()
+        for k in [5, 3, 8, 1, 4, 7, 9, 3]:
+            t.put(k, str(k))
+        self.assertEqual(list(t.items()), [(k, str(k)) for k in [1, 3, 4, 5, 7, 8, 9]])
+        self.assertEqual(t.get(4), '4')
+        self.assertIsNone(t.get(6))
+        self.assertEqual(len(t), 7)
+        self.assertIn(8, t)
+
+    def test_sequential_inserts_do_not_recurse(self):
+        t = TreeMap()
+        for i in range(100000):
+            t.put(i, i)
+        self.assertLessEqual(t.root.height, 20)
+        self.assertEqual(t.select(-1), (99999, 99999))
+
+    def test_random_operations_keep_avl_invariants(self):
+        rng = random.Random(11)
+        t, expected = TreeMap(), {}
+        for _ in range(5000):
+            key = rng.randrange(1000)
+            if rng.random() < 0.6:
+                t.put(key, -key)
+                expected[key] = -key
+            else:
+                self.assertEqual(t.remove(key), expected.pop(key, None) is not None)
+        check_invariants(self, t.root)
+        self.assertEqual(list(t.items()), sorted(expected.items()))
+        self.assertEqual(list(t.keys()), sorted(expected))
+
+    def test_range_and_neighbour_queries(self):
+        t = TreeMap()
+        for k in range(0, 100, 10):
+            t.put(k, k)
+        self.assertEqual([k for k, _ in t.irange(15, 50)], [20, 30, 40, 50])
+        self.assertEqual([k for k, _ in t.irange(20, 50, inclusive=(False, False))], [30, 40])
+        self.assertEqual([k for k, _ in t.irange(hi=25, reverse=True)], [20, 10, 0])
+        self.assertEqual([k for k, _ in t.irange(80)], [80, 90])
+        self.assertEqual(t.floor(35), (30, 30))
+        self.assertEqual(t.floor(30), (30, 30))
+        self.assertIsNone(t.floor(-1))
+        self.assertEqual(t.ceiling(35), (40, 40))
+        self.assertIsNone(t.ceiling(91))
+        self.assertEqual(t.first(), (0, 0))
+        self.assertEqual(t.last(), (90, 90))
+        self.assertIsNone(TreeMap().first())
+
+    def test_rank_and_select(self):
+        rng = random.Random(5)
+        keys = sorted(rng.sample(range(10000), 500))
+        t = TreeMap()
+        for k in rng.sample(keys, len(keys)):
+            t.put(k, None)
+        for probe in range(0, 10000, 37):
+            self.assertEqual(t.rank(probe), bisect.bisect_left(keys, probe))
+        for i in range(len(keys)):
+            self.assertEqual(t.select(i)[0], keys[i])
+        with self.assertRaises(IndexError):
+            t.select(len(keys))
+
+    def test_items_is_lazy(self):
+        t = TreeMap()
+        for i in range(10):
+            t.put(i, i)
+        items = t.items()
+        self.assertEqual(next(items), (0, 0))
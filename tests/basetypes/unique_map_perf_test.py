@@ -0,0 +1,44 @@
+import random
+import sys
+import time
+
+from pygoodtools.basetypes.UniqueMap import UniqueMap
+
+OPERATIONS = 200_000
+
+
+# UniqueMap в том виде, в каком он был до перехода на один словарь
+class LegacyUniqueMap:
+    def __init__(self):
+        self._data = {}
+        self._order = []
+
+    def add(self, item):
+        if item not in self._data:
+            self._data[item] = None
+            self._order.append(item)
+
+    def remove(self, key):
+        if key in self._data:
+            del self._data[key]
+            self._order.remove(key)
+
+
+def churn(m, stream):
+    add, remove = m.add, m.remove
+    started = time.perf_counter()
+    for item, adding in stream:
+        if adding:
+            add(item)
+        else:
+            remove(item)
+    return time.perf_counter() - started
+
+
+if __name__ == '__main__':
+    OPERATIONS = int(sys.argv[1]) if len(sys.argv) > 1 else OPERATIONS
+    rng = random.Random(1)
+    # Окно дедупликации: добавления новых элементов вперемешку с удалением старых
+    stream = [(rng.randrange(OPERATIONS // 2), rng.random() < 0.6) for _ in range(OPERATIONS)]
+    for name, factory in [('legacy UniqueMap', LegacyUniqueMap), ('UniqueMap', UniqueMap)]:
+        print(f"{name:<17} {churn(factory(), stream):6.2f} s for {OPERATIONS} operations")
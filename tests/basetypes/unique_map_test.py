@@ -0,0 +1,89 @@
+import random
+import unittest
+
+from pygoodtools.basetypes.UniqueMap import UniqueMap
+
+
+class TestUniqueMap(unittest.TestCase):
+    def test_add_remove_keep_insertion_order(self):
+        m = UniqueMap()
+        for item in 'abcab':
+            m.add(item)
+        m.remove('b')
+        m.remove('z')
+        m.add('b')
+        self.assertEqual(list(m), ['a', 'c', 'b'])
+        self.assertEqual(m.order, ['a', 'c', 'b'])
+        self.assertIn('c', m)
+        self.assertEqual(len(m), 3)
+
+    def test_positional_access_skips_holes_without_compaction(self):
+        m = UniqueMap()
+        m.add_many(range(100))
+        self.assertEqual(m.item_at(10), 10)
+        m.remove(50)
+        self.assertEqual(m.item_at(10), 10)
+        # Позиции за дырой находятся пропуском дыр, индекс не пересобирается
+        self.assertEqual(m.item_at(50), 51)
+        self.assertEqual(m.item_at(97), 98)
+        self.assertEqual(m._holes, 1)
+        self.assertEqual(m.index(99), 98)
+        self.assertEqual(m.index(51), 50)
+        self.assertEqual(m._holes, 1)
+        self.assertEqual(m.item_at(-1), 99)
+        with self.assertRaises(IndexError):
+            m.item_at(99)
+        with self.assertRaises(ValueError):
+            m.index(50)
+
+    def test_tail_queries_between_removals_do_not_compact(self):
+        m = UniqueMap()
+        m.add_many(range(10000))
+        m.item_at(0)
+        compactions = []
+        compact = m._compact
+        m._compact = lambda: (compactions.append(1), compact())
+        for i in range(0, 4000, 2):
+            m.remove(i)
+            self.assertEqual(m.item_at(-1), 9999)
+            self.assertEqual(m.index(9998), len(m) - 2)
+        self.assertEqual(compactions, [])
+        self.assertEqual(m.item_at(0), 1)
+
+    def test_random_churn_matches_ordered_dict(self):
+        rng = random.Random(20)
+        m, expected = UniqueMap(), {}
+        for _ in range(5000):
+            item = rng.randrange(300)
+            op = rng.random()
+            if op < 0.5:
+                m.add(item)
+                expected.setdefault(item, None)
+            elif op < 0.9:
+                m.remove(item)
+                expected.pop(item, None)
+            elif expected:
+                position = rng.randrange(len(expected))
+                self.assertEqual(m.item_at(position), list(expected)[position])
+                self.assertEqual(m.index(list(expected)[position]), position)
+        self.assertEqual(m.order, list(expected))
+
+    def test_add_many_and_difference_update(self):
+        m = UniqueMap()
+        m.add_many([3, 1, 3, 2])
+        m['x'] = 'value'
+        m.add_many([1, 4])
+        self.assertEqual(m.order, [3, 1, 2, 'x', 4])
+        self.assertEqual(m['x'], 'value')
+        m.difference_update([1, 'x'])
+        self.assertEqual(m.order, [3, 2, 4])
+        m.difference_update(iter([3]))
+        self.assertEqual(m.order, [2, 4])
+        self.assertEqual(m.item_at(1), 4)
+
+    def test_setters(self):
+        m = UniqueMap()
+        m.order = ['b', 'a', 'b']
+        self.assertEqual(m.order, ['b', 'a'])
+        with self.assertRaises(ValueError):
+            m.collection = {'c'}
@@ -0,0 +1,82 @@
+import gc
+import threading
+import time
+import unittest
+import weakref
+
+from pygoodtools.core.CoalescingSignal import CoalescingSignal
+
+
+class TestCoalescingSignal(unittest.TestCase):
+    def test_count_threshold_delivers_batches(self):
+        signal, batches = CoalescingSignal(window=60, max_count=100), []
+        self.addCleanup(signal.close)
+        signal.connect(batches.append)
+        for i in range(1000):
+            signal.emit(i)
+        self.assertEqual(len(batches), 10)
+        self.assertEqual([v for batch in batches for v in batch], list(range(1000)))
+
+    def test_latest_mode_delivers_last_value(self):
+        signal, values = CoalescingSignal(window=60, max_count=50, mode=CoalescingSignal.LATEST), []
+        signal.connect(values.append)
+        for i in range(120):
+            signal.emit(i)
+        signal.close()
+        self.assertEqual(values, [49, 99, 119])
+
+    def test_window_flushes_from_timer(self):
+        signal, delivered = CoalescingSignal(window=0.02), threading.Event()
+        self.addCleanup(signal.close)
+        batches = []
+
+        def slot(batch):
+            batches.append(batch)
+            delivered.set()
+
+        signal.connect(slot)
+        for i in range(500):
+            signal.emit(i)
+        self.assertTrue(delivered.wait(2))
+        time.sleep(0.05)
+        self.assertLessEqual(len(batches), 5)
+        self.assertEqual([v for batch in batches for v in batch], list(range(500)))
+
+    def test_flush_without_pending_values_calls_nothing(self):
+        signal, batches = CoalescingSignal(), []
+        signal.connect(batches.append)
+        signal.flush()
+        signal.close()
+        self.assertEqual(batches, [])
+
+    def test_idle_window_stops_timer_and_next_emit_restarts_it(self):
+        signal, batches = CoalescingSignal(window=0.01), []
+        self.addCleanup(signal.close)
+        signal.connect(batches.append)
+        signal.emit(1)
+        time.sleep(0.1)
+        self.assertIsNone(signal._timer)
+        signal.emit(2)
+        self.assertIsNotNone(signal._timer)
+        time.sleep(0.1)
+        self.assertEqual(batches, [[1], [2]])
+
+    def test_dropped_signal_is_collected(self):
+        refs = []
+        for i in range(200):
+            signal = CoalescingSignal(window=0.01)
+            signal.connect(lambda batch: None)
+            signal.emit(i)
+            refs.append(weakref.ref(signal))
+        del signal
+        deadline = time.monotonic() + 2
+        while any(ref() is not None for ref in refs) and time.monotonic() < deadline:
+            time.sleep(0.02)
+            gc.collect()
+        self.assertEqual([ref for ref in refs if ref() is not None], [])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            CoalescingSignal(mode='median')
+        with self.assertRaises(ValueError):
+            CoalescingSignal(window=0)
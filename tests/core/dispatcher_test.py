@@ -0,0 +1,137 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from pygoodtools.core.Dispatcher import BLOCK, DROP_NEWEST, DROP_OLDEST, Dispatcher
+from pygoodtools.core.Signal import Signal
+
+
+class TestDispatcher(unittest.TestCase):
+    def blocked_dispatcher(self, overflow):
+        """Dispatcher whose single worker is stuck until `release` is set."""
+        release = threading.Event()
+        started = threading.Event()
+        dispatcher = Dispatcher(workers=1, maxsize=2, overflow=overflow)
+
+        def hold():
+            started.set()
+            release.wait(5)
+
+        dispatcher.submit(hold)
+        started.wait(5)
+        self.addCleanup(dispatcher.shutdown)
+        self.addCleanup(release.set)
+        return dispatcher, release
+
+    def test_drop_newest(self):
+        dispatcher, release = self.blocked_dispatcher(DROP_NEWEST)
+        done = []
+        results = [dispatcher.submit(done.append, (i,)) for i in range(4)]
+        self.assertEqual(results, [True, True, False, False])
+        release.set()
+        dispatcher.shutdown()
+        self.assertEqual(done, [0, 1])
+        self.assertEqual(dispatcher.dropped, 2)
+
+    def test_drop_oldest(self):
+        dispatcher, release = self.blocked_dispatcher(DROP_OLDEST)
+        done = []
+        for i in range(4):
+            dispatcher.submit(done.append, (i,))
+        release.set()
+        dispatcher.shutdown()
+        self.assertEqual(done, [2, 3])
+        self.assertEqual(dispatcher.dropped, 2)
+
+    def test_block_waits_for_room(self):
+        dispatcher, release = self.blocked_dispatcher(BLOCK)
+        done = []
+        dispatcher.submit(done.append, (0,))
+        dispatcher.submit(done.append, (1,))
+        threading.Timer(0.05, release.set).start()
+        started = time.perf_counter()
+        dispatcher.submit(done.append, (2,))
+        self.assertGreaterEqual(time.perf_counter() - started, 0.04)
+        dispatcher.shutdown()
+        self.assertEqual(done, [0, 1, 2])
+
+    def test_submit_after_shutdown_raises(self):
+        dispatcher = Dispatcher()
+        dispatcher.shutdown()
+        with self.assertRaises(RuntimeError):
+            dispatcher.submit(print)
+        with self.assertRaises(ValueError):
+            Dispatcher(overflow='spill')
+
+
+class TestSignalDispatchModes(unittest.TestCase):
+    def test_queued_slot_does_not_stall_emitter(self):
+        dispatcher = Dispatcher(workers=1)
+        self.addCleanup(dispatcher.shutdown)
+        signal, calls = Signal(), []
+
+        def slow(value):
+            time.sleep(0.05)
+            calls.append((value, threading.current_thread().name))
+
+        signal.connect(slow, Signal.QUEUED, dispatcher=dispatcher)
+        started = time.perf_counter()
+        for i in range(3):
+            signal.emit(i)
+        self.assertLess(time.perf_counter() - started, 0.05)
+        dispatcher.shutdown()
+        self.assertEqual([value for value, _ in calls], [0, 1, 2])
+        self.assertTrue(all(name.startswith('Dispatcher') for _, name in calls))
+
+    def test_default_queued_dispatch_keeps_emit_order(self):
+        signal, calls, done = Signal(), [], threading.Event()
+
+        def slot(value):
+            calls.append(value)
+            if value == 999:
+                done.set()
+
+        signal.connect(slot, Signal.QUEUED)
+        for i in range(1000):
+            signal.emit(i)
+        self.assertTrue(done.wait(5))
+        self.assertEqual(calls, list(range(1000)))
+
+    def test_loop_mode_runs_on_event_loop(self):
+        async def main():
+            signal = Signal()
+            received = asyncio.Queue()
+            loop_thread = threading.get_ident()
+
+            def plain(value):
+                received.put_nowait(('plain', value, threading.get_ident() == loop_thread))
+
+            async def coroutine(value):
+                await received.put(('coroutine', value, threading.get_ident() == loop_thread))
+
+            signal.connect(plain, Signal.LOOP)
+            signal.connect(coroutine, Signal.LOOP)
+            emitter = threading.Thread(target=signal.emit, args=(7,))
+            emitter.start()
+            emitter.join()
+            return sorted([await asyncio.wait_for(received.get(), 1) for _ in range(2)])
+
+        self.assertEqual(asyncio.run(main()), [('coroutine', 7, True), ('plain', 7, True)])
+
+    def test_invalid_modes(self):
+        signal = Signal()
+        with self.assertRaises(ValueError):
+            signal.connect(print, 'sideways')
+        with self.assertRaises(ValueError):
+            signal.connect(print, Signal.LOOP)
+
+    def test_disconnect_queued_slot(self):
+        dispatcher = Dispatcher()
+        self.addCleanup(dispatcher.shutdown)
+        signal, calls = Signal(), []
+        signal.connect(calls.append, Signal.QUEUED, dispatcher=dispatcher)
+        signal.disconnect(calls.append)
+        signal.emit(1)
+        dispatcher.shutdown()
+        self.assertEqual(calls, [])
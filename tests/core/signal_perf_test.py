@@ -0,0 +1,50 @@
+import ctypes
+import threading
+import timeit
+
+from pygoodtools.core.Signal import Signal
+
+EMITS = 200_000
+
+
+# Signal в том виде, в каком он был до перехода на кортеж слотов
+class LegacySignal:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._slots = (ctypes.py_object * 64)()
+        self._slot_count = ctypes.c_int(0)
+
+    def connect(self, func):
+        with self._lock:
+            if self._slot_count.value < len(self._slots):
+                self._slots[self._slot_count.value] = ctypes.py_object(func)
+                self._slot_count.value += 1
+            else:
+                raise OverflowError('Maximum number of callbacks reached')
+
+    def emit(self, *args, **kwargs):
+        count = self._slot_count.value
+        callbacks = [self._slots[i] for i in range(count)]
+        for callback in callbacks:
+            if callback:
+                callback(*args, **kwargs)
+
+
+def slot(value):
+    pass
+
+
+def emits_per_second(factory, slots):
+    signal = factory()
+    for _ in range(slots):
+        signal.connect(slot)
+    number = max(1, EMITS // slots)
+    return number / timeit.timeit(lambda: signal.emit(1), number=number)
+
+
+if __name__ == '__main__':
+    for slots in (1, 64, 10_000):
+        line = f"{slots:>6} slots  Signal {emits_per_second(Signal, slots):12.0f} emit/s"
+        if slots <= 64:
+            line += f"  legacy {emits_per_second(LegacySignal, slots):12.0f} emit/s"
+        print(line)
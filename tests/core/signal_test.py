@@ -0,0 +1,152 @@
+import threading
+import unittest
+
+from pygoodtools.core.Signal import Signal
+
+
+class TestSignal(unittest.TestCase):
+    def test_emit_calls_slots_in_connection_order(self):
+        signal, calls = Signal(), []
+        signal.connect(lambda x: calls.append(('a', x)))
+        signal.connect(lambda x: calls.append(('b', x)))
+        signal.emit(1)
+        self.assertEqual(calls, [('a', 1), ('b', 1)])
+
+    def test_no_slot_limit(self):
+        signal, calls = Signal(), []
+        for _ in range(1000):
+            signal.connect(calls.append)
+        signal.emit(0)
+        self.assertEqual(len(calls), 1000)
+        self.assertEqual(len(signal), 1000)
+
+    def test_disconnect(self):
+        class Receiver:
+            def __init__(self):
+                self.calls = 0
+
+            def slot(self):
+                self.calls += 1
+
+        signal, receiver = Signal(), Receiver()
+        signal.connect(receiver.slot)
+        signal.disconnect(receiver.slot)
+        signal.emit()
+        self.assertEqual(receiver.calls, 0)
+        with self.assertRaises(ValueError):
+            signal.disconnect(receiver.slot)
+        with self.assertRaises(ValueError):
+            signal.connect(None)
+
+    def test_connect_during_emit_applies_to_next_emit(self):
+        signal, calls = Signal(), []
+
+        def first():
+            calls.append('first')
+            signal.connect(lambda: calls.append('late'))
+            signal.disconnect(second)
+
+        def second():
+            calls.append('second')
+
+        signal.connect(first)
+        signal.connect(second)
+        signal.emit()
+        # Отключённый слот не вызывается даже текущим emit
+        self.assertEqual(calls, ['first'])
+        signal.disconnect(first)
+        signal.emit()
+        self.assertEqual(calls, ['first', 'late'])
+
+    def test_concurrent_connects_are_not_lost(self):
+        signal, calls = Signal(), []
+        start = threading.Barrier(8)
+
+        def worker():
+            start.wait()
+            for _ in range(200):
+                signal.connect(lambda: calls.append(1))
+
+        workers = [threading.Thread(target=worker) for _ in range(8)]
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        signal.emit()
+        self.assertEqual(len(calls), 1600)
+
+
+class Receiver:
+    def __init__(self, calls):
+        self.calls = calls
+
+    def slot(self, value):
+        self.calls.append(value)
+
+
+class TestSignalConnections(unittest.TestCase):
+    def test_connection_handle_disconnects(self):
+        signal, calls = Signal(), []
+        first = signal.connect(lambda v: calls.append(('first', v)))
+        signal.connect(lambda v: calls.append(('second', v)))
+        first.disconnect()
+        first.disconnect()
+        signal.emit(1)
+        self.assertEqual(calls, [('second', 1)])
+        self.assertFalse(first.alive)
+        self.assertEqual(len(signal), 1)
+
+    def test_disconnect_by_handle_through_signal(self):
+        signal, other = Signal(), Signal()
+        connection = signal.connect(print)
+        with self.assertRaises(ValueError):
+            other.disconnect(connection)
+        signal.disconnect(connection)
+        self.assertEqual(len(signal), 0)
+
+    def test_dead_connections_are_compacted(self):
+        signal = Signal()
+        connections = [signal.connect(print) for _ in range(100)]
+        for connection in connections[:60]:
+            connection.disconnect()
+        self.assertLess(len(signal._slots), 100)
+        self.assertEqual(len(signal), 40)
+        self.assertTrue(all(c.alive for c in signal._slots[-10:]))
+
+    def test_weak_bound_method_is_collected(self):
+        signal, calls = Signal(), []
+        receiver = Receiver(calls)
+        connection = signal.connect(receiver.slot, weak=True)
+        signal.emit(1)
+        del receiver
+        signal.emit(2)
+        self.assertEqual(calls, [1])
+        self.assertFalse(connection.alive)
+        self.assertIsNone(connection.func)
+        self.assertEqual(len(signal), 0)
+
+    def test_weak_function_and_disconnect_by_callable(self):
+        signal, calls = Signal(), []
+        receiver = Receiver(calls)
+        signal.connect(receiver.slot, weak=True)
+        signal.disconnect(receiver.slot)
+        signal.emit(1)
+        self.assertEqual(calls, [])
+
+        def slot(value):
+            calls.append(value)
+
+        signal.connect(slot, weak=True)
+        signal.emit(2)
+        self.assertEqual(calls, [2])
+
+    def test_weak_queued_connection(self):
+        from pygoodtools.core.Dispatcher import Dispatcher
+
+        dispatcher = Dispatcher()
+        signal, calls = Signal(), []
+        receiver = Receiver(calls)
+        signal.connect(receiver.slot, Signal.QUEUED, dispatcher=dispatcher, weak=True)
+        signal.emit(1)
+        dispatcher.shutdown()
+        self.assertEqual(calls, [1])
@@ -0,0 +1,84 @@
+import os
+import threading
+import time
+import unittest
+
+from pygoodtools.core.Singleton import Singleton
+
+
+class TestSingletonMeta(unittest.TestCase):
+    def tearDown(self):
+        Singleton.reset_all()
+
+    def test_concurrent_calls_build_one_instance(self):
+        built = []
+
+        class Client(metaclass=Singleton):
+            def __init__(self):
+                time.sleep(0.05)
+                built.append(self)
+
+        start = threading.Barrier(16)
+        results = []
+
+        def worker():
+            start.wait()
+            results.append(Client())
+
+        workers = [threading.Thread(target=worker) for _ in range(16)]
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        self.assertEqual(len(built), 1)
+        self.assertTrue(all(r is built[0] for r in results))
+
+    def test_subclasses_have_own_instances(self):
+        class Base(metaclass=Singleton):
+            pass
+
+        class Child(Base):
+            pass
+
+        self.assertIsNot(Base(), Child())
+        self.assertIs(Child(), Child())
+
+    def test_reset_instance_and_reset_all(self):
+        class Client(metaclass=Singleton):
+            closed = False
+
+            def close(self):
+                self.closed = True
+
+        class Other(metaclass=Singleton):
+            pass
+
+        first, other = Client(), Other()
+        self.assertIs(Client.reset_instance(lambda c: c.close()), first)
+        self.assertTrue(first.closed)
+        self.assertIsNot(Client(), first)
+        Singleton.reset_all()
+        self.assertIsNot(Other(), other)
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+    def test_child_process_gets_fresh_instance(self):
+        built = []
+
+        class Client(metaclass=Singleton):
+            def __init__(self):
+                built.append(self)
+
+        Client()
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read)
+            Client()
+            os.write(write, str(len(built)).encode())
+            os._exit(0)
+        os.close(write)
+        with os.fdopen(read) as f:
+            child_built = f.read()
+        os.waitpid(pid, 0)
+        self.assertEqual(child_built, '2')
+        self.assertEqual(len(built), 1)
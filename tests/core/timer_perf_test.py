@@ -0,0 +1,76 @@
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+from pygoodtools.core.Timer import Timer
+
+TIMERS = 10_000
+INTERVAL = 0.1
+DURATION = 3.0
+
+
+# Timer в том виде, в каком он был до общего планировщика: поток на каждый таймер
+class LegacyTimer:
+    def __init__(self, interval, callback):
+        self.interval = interval
+        self.callback = callback
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._timer_thread = None
+
+    def _run(self):
+        next_call = time.perf_counter()
+        while not self._stop_event.is_set():
+            with self._lock:
+                current_interval = self.interval
+            next_call += current_interval
+            time_to_sleep = next_call - time.perf_counter()
+            if time_to_sleep > 0:
+                time.sleep(time_to_sleep)
+            if self._stop_event.is_set():
+                break
+            self.callback()
+
+    def start(self):
+        self._timer_thread = threading.Thread(target=self._run, daemon=True)
+        self._timer_thread.start()
+
+
+def rss_mb():
+    with open('/proc/self/statm') as statm:
+        return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+
+
+def measure(kind, count):
+    # Для каждого таймера запоминаем моменты срабатываний, чтобы оценить джиттер
+    ticks = [[] for _ in range(count)]
+    factory = LegacyTimer if kind == 'legacy' else Timer
+    timers = [factory(INTERVAL, lambda t=t: t.append(time.monotonic())) for t in ticks]
+    rss = rss_mb()
+    cpu = time.process_time()
+    for timer in timers:
+        timer.start()
+    time.sleep(DURATION)
+    cpu = time.process_time() - cpu
+    threads = threading.active_count()
+    rss = rss_mb() - rss
+    deviations = [abs(b - a - INTERVAL) * 1e3 for t in ticks for a, b in zip(t, t[1:])]
+    calls = sum(len(t) for t in ticks)
+    print(f"{kind:<9} {count:>6} timers  threads {threads:>6}  cpu {cpu:6.2f} s  rss +{rss:7.1f} MB  "
+          f"calls {calls:>7}  jitter mean {statistics.fmean(deviations or [0]):6.2f} ms  "
+          f"p99 {sorted(deviations or [0])[int(len(deviations) * 0.99)]:7.2f} ms")
+    sys.stdout.flush()
+    # Потоки-демоны старой версии не останавливаются: join ждал бы каждый сон
+    os._exit(0)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 2:
+        measure(sys.argv[1], int(sys.argv[2]))
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else TIMERS
+    # Каждый вариант в отдельном процессе, чтобы потоки и память не смешивались
+    for kind in ('scheduler', 'legacy'):
+        subprocess.run([sys.executable, __file__, kind, str(count)], check=False)
@@ -0,0 +1,121 @@
+import os
+import threading
+import time
+import unittest
+
+from pygoodtools.core.Scheduler import Scheduler
+from pygoodtools.core.Timer import Timer
+
+
+class TestScheduler(unittest.TestCase):
+    def test_calls_run_in_deadline_order(self):
+        scheduler, order, done = Scheduler(), [], threading.Event()
+        now = time.monotonic()
+        scheduler.call_at(now + 0.03, lambda: (order.append(3), done.set()))
+        scheduler.call_at(now + 0.01, lambda: order.append(1))
+        scheduler.call_at(now + 0.02, lambda: order.append(2))
+        self.assertTrue(done.wait(1))
+        self.assertEqual(order, [1, 2, 3])
+
+    def test_cancelled_call_does_not_run(self):
+        scheduler, calls, done = Scheduler(), [], threading.Event()
+        entry = scheduler.call_later(0.01, lambda: calls.append('cancelled'))
+        scheduler.call_later(0.02, done.set)
+        scheduler.cancel(entry)
+        scheduler.cancel(entry)
+        self.assertTrue(done.wait(1))
+        self.assertEqual(calls, [])
+        self.assertEqual(scheduler.pending(), 0)
+
+
+class TestTimer(unittest.TestCase):
+    def test_periodic_timer_repeats(self):
+        calls = []
+        timer = Timer(0.01, lambda: calls.append(time.monotonic()))
+        timer.start()
+        time.sleep(0.15)
+        timer.stop()
+        self.assertGreaterEqual(len(calls), 5)
+
+    def test_stop_prevents_further_calls(self):
+        calls = []
+        timer = Timer(0.01, lambda: calls.append(1))
+        timer.start()
+        time.sleep(0.05)
+        timer.stop()
+        count = len(calls)
+        time.sleep(0.05)
+        self.assertEqual(len(calls), count)
+
+    def test_single_shot_stops_after_result(self):
+        calls, done = [], threading.Event()
+
+        class Sink:
+            def emit(self, value):
+                calls.append(value)
+                done.set()
+
+        timer = Timer(0.01, lambda: 42, single_shot=True, _ext=Sink())
+        timer.start()
+        self.assertTrue(done.wait(1))
+        time.sleep(0.05)
+        self.assertEqual(calls, [42])
+
+    def test_argv_is_passed_to_callback(self):
+        calls, done = [], threading.Event()
+        timer = Timer(0.01, lambda a, b: (calls.append((a, b)), done.set()) and None, argv=[1, 2])
+        timer.start()
+        self.assertTrue(done.wait(1))
+        timer.stop()
+        self.assertEqual(calls[0], (1, 2))
+
+    def test_set_interval_applies_to_next_call(self):
+        calls = []
+        timer = Timer(60, lambda: calls.append(1))
+        timer.start()
+        timer.stop()
+        timer.setInterval(0.01)
+        timer.start()
+        time.sleep(0.1)
+        timer.stop()
+        self.assertGreaterEqual(len(calls), 3)
+
+    def test_timers_share_one_thread(self):
+        scheduler = Scheduler()
+        before = threading.active_count()
+        timers = [Timer(0.01, lambda: None, _scheduler=scheduler) for _ in range(200)]
+        for timer in timers:
+            timer.start()
+        self.assertLessEqual(threading.active_count() - before, 1)
+        for timer in timers:
+            timer.stop()
+        self.assertEqual(scheduler.pending(), 0)
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+    def test_parent_timers_do_not_fire_in_forked_child(self):
+        parent_calls = []
+        timer = Timer(0.02, lambda: parent_calls.append(os.getpid()))
+        timer.start()
+        self.addCleanup(timer.stop)
+        time.sleep(0.05)
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read)
+            child_calls = []
+            child = Timer(0.01, lambda: child_calls.append(1))
+            child.start()
+            time.sleep(0.1)
+            child.stop()
+            fired = sum(1 for p in parent_calls if p == os.getpid())
+            os.write(write, f'{fired} {len(child_calls) > 0}'.encode())
+            os._exit(0)
+        os.close(write)
+        with os.fdopen(read) as f:
+            result = f.read()
+        os.waitpid(pid, 0)
+        self.assertEqual(result, '0 True')
+
+
+if __name__ == '__main__':
+    unittest.main()
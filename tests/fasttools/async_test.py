@@ -0,0 +1,90 @@
+import asyncio
+import contextlib
+import io
+import unittest
+
+from pygoodtools.fasttools.cache import lru_cache
+from pygoodtools.fasttools.memoization import memoize
+from pygoodtools.fasttools.retry import retry
+from pygoodtools.fasttools.timeit import timeit
+
+
+class TestAsyncDecorators(unittest.TestCase):
+    def test_lru_cache_coalesces_concurrent_awaits(self):
+        calls = []
+
+        @lru_cache(maxsize=8)
+        async def fetch(x):
+            calls.append(x)
+            await asyncio.sleep(0.01)
+            return x * 2
+
+        async def main():
+            results = await asyncio.gather(*(fetch(3) for _ in range(10)))
+            return results, await fetch(3)
+
+        results, cached = asyncio.run(main())
+        self.assertEqual(results, [6] * 10)
+        self.assertEqual(cached, 6)
+        self.assertEqual(calls, [3])
+        self.assertEqual(fetch.cache_info().currsize, 1)
+
+    def test_lru_cache_does_not_cache_exceptions(self):
+        attempts = []
+
+        @lru_cache()
+        async def flaky(x):
+            attempts.append(x)
+            if len(attempts) == 1:
+                raise RuntimeError('first call fails')
+            return x
+
+        async def main():
+            with self.assertRaises(RuntimeError):
+                await flaky(1)
+            return await flaky(1)
+
+        self.assertEqual(asyncio.run(main()), 1)
+
+    def test_memoize_caches_awaited_result(self):
+        calls = []
+
+        @memoize
+        async def load(x):
+            calls.append(x)
+            return x + 1
+
+        async def main():
+            return await load(1), await load(1)
+
+        self.assertEqual(asyncio.run(main()), (2, 2))
+        self.assertEqual(calls, [1])
+
+    def test_retry_sees_coroutine_exceptions(self):
+        attempts = []
+
+        @retry(retries=3, delay=0)
+        async def unstable():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise ConnectionError
+            return 'ok'
+
+        self.assertEqual(asyncio.run(unstable()), 'ok')
+        self.assertEqual(len(attempts), 3)
+
+    def test_timeit_measures_until_completion(self):
+        @timeit
+        async def sleepy():
+            await asyncio.sleep(0.05)
+            return 1
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.assertEqual(asyncio.run(sleepy()), 1)
+        elapsed = float(output.getvalue().rsplit(' in ', 1)[1].split()[0])
+        self.assertGreaterEqual(elapsed, 0.04)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+import threading
+import time
+import unittest
+
+from pygoodtools.fasttools.cache import LRUCache, lru_cache
+
+
+class TestLRUCache(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(len(cache), 2)
+
+    def test_put_refreshes_existing_key(self):
+        cache = LRUCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.put('a', 10)
+        cache.put('c', 3)
+        self.assertEqual(cache.get('a'), 10)
+        self.assertIsNone(cache.get('b'))
+
+    def test_decorator_reuses_results(self):
+        calls = []
+
+        @lru_cache(maxsize=2)
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(calls, [3])
+
+    def test_decorator_caches_none_results(self):
+        calls = []
+
+        @lru_cache(maxsize=2)
+        def lookup(x):
+            calls.append(x)
+            return None
+
+        lookup(1)
+        lookup(1)
+        self.assertEqual(calls, [1])
+
+    def test_cache_info_and_clear(self):
+        @lru_cache(maxsize=4)
+        def double(x):
+            return x * 2
+
+        double(1)
+        double(1)
+        double(2)
+        self.assertEqual(double.cache_info(), (1, 2, 4, 2))
+        self.assertEqual(double.cache_parameters()['maxsize'], 4)
+        double.cache_clear()
+        self.assertEqual(double.cache_info(), (0, 0, 4, 0))
+
+
+class TestLRUCacheLimits(unittest.TestCase):
+    def test_entries_expire_lazily(self):
+        cache = LRUCache(8, ttl=0.02)
+        cache.put('a', 1)
+        cache.put('b', 2, ttl=10)
+        self.assertEqual(cache.get('a'), 1)
+        time.sleep(0.03)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('b'), 2)
+        self.assertEqual(cache.stats().expirations, 1)
+
+    def test_background_sweep_removes_expired_entries(self):
+        cache = LRUCache(8, ttl=0.01, sweep_interval=0.01)
+        try:
+            cache.put('a', 1)
+            time.sleep(0.1)
+            self.assertEqual(len(cache), 0)
+            self.assertEqual(cache.stats().expirations, 1)
+        finally:
+            cache.close()
+
+    def test_byte_budget_evicts_least_recently_used(self):
+        cache = LRUCache(100, maxbytes=10, sizeof=len)
+        cache.put('a', 'xxxx')
+        cache.put('b', 'yyyy')
+        cache.get('a')
+        cache.put('c', 'zzzz')
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 'xxxx')
+        self.assertEqual(cache.stats().currbytes, 8)
+
+    def test_value_larger_than_budget_is_not_stored(self):
+        cache = LRUCache(100, maxbytes=4, sizeof=len)
+        cache.put('a', 'xxxxxxxx')
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats().currbytes, 0)
+
+    def test_counters(self):
+        cache = LRUCache(1)
+        cache.put('a', 1)
+        cache.get('a')
+        cache.get('b')
+        cache.put('b', 2)
+        stats = cache.stats()
+        self.assertEqual((stats.hits, stats.misses, stats.evictions, stats.currsize), (1, 1, 1, 1))
+
+
+class TestThreadSafeLRUCache(unittest.TestCase):
+    def test_concurrent_misses_are_coalesced(self):
+        calls = []
+        barrier = threading.Barrier(32)
+
+        @lru_cache(maxsize=16, thread_safe=True)
+        def slow(x):
+            calls.append(x)
+            time.sleep(0.05)
+            return x + 1
+
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(slow(1))
+
+        threads = [threading.Thread(target=worker) for _ in range(32)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(calls, [1])
+        self.assertEqual(results, [2] * 32)
+
+    def test_waiters_receive_leader_exception(self):
+        barrier = threading.Barrier(4)
+
+        @lru_cache(thread_safe=True)
+        def failing(x):
+            time.sleep(0.05)
+            raise RuntimeError(x)
+
+        errors = []
+
+        def worker():
+            barrier.wait()
+            try:
+                failing(7)
+            except RuntimeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(errors), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
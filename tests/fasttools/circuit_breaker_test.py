@@ -0,0 +1,112 @@
+import contextlib
+import io
+import time
+import unittest
+
+from pygoodtools.fasttools.circuit_breaker import CircuitBreaker, CircuitOpenError, circuit_breaker
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    def make_failing(self, **params):
+        calls = []
+
+        @circuit_breaker(**params)
+        def call(fail=True):
+            calls.append(fail)
+            if fail:
+                raise ConnectionError
+            return 'ok'
+
+        return call, calls
+
+    def test_opens_after_failure_rate_is_exceeded(self):
+        call, calls = self.make_failing(min_calls=4, failure_rate=0.5, recovery_timeout=60)
+        for _ in range(4):
+            with self.assertRaises(ConnectionError):
+                call()
+        self.assertEqual(call.breaker.state, 'open')
+        with self.assertRaises(CircuitOpenError):
+            call()
+        self.assertEqual(len(calls), 4)
+
+    def test_stays_closed_below_min_calls(self):
+        call, _ = self.make_failing(min_calls=10)
+        for _ in range(5):
+            with self.assertRaises(ConnectionError):
+                call()
+        self.assertEqual(call.breaker.state, 'closed')
+
+    def test_half_open_trial_closes_circuit(self):
+        changes = []
+        call, _ = self.make_failing(min_calls=2, recovery_timeout=0.02,
+                                    on_state_change=lambda old, new: changes.append((old, new)))
+        for _ in range(2):
+            with self.assertRaises(ConnectionError):
+                call()
+        time.sleep(0.03)
+        self.assertEqual(call(fail=False), 'ok')
+        self.assertEqual(changes, [('closed', 'open'), ('open', 'half_open'), ('half_open', 'closed')])
+
+    def test_half_open_failure_reopens_circuit(self):
+        call, _ = self.make_failing(min_calls=2, recovery_timeout=0.02)
+        for _ in range(2):
+            with self.assertRaises(ConnectionError):
+                call()
+        time.sleep(0.03)
+        with self.assertRaises(ConnectionError):
+            call()
+        self.assertEqual(call.breaker.state, 'open')
+
+    def test_listener_errors_do_not_replace_the_result(self):
+        def broken(old, new):
+            raise RuntimeError('listener failed')
+
+        call, _ = self.make_failing(min_calls=2, recovery_timeout=0.02, on_state_change=broken)
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
+            for _ in range(2):
+                with self.assertRaises(ConnectionError):
+                    call()
+            time.sleep(0.03)
+            self.assertEqual(call(fail=False), 'ok')
+        self.assertEqual(call.breaker.state, 'closed')
+        self.assertIn('listener failed', stderr.getvalue())
+
+    def test_stale_completion_is_not_a_trial_result(self):
+        breaker = CircuitBreaker(min_calls=2, recovery_timeout=0.02)
+        slow = breaker.before_call()
+        breaker.record_failure(breaker.before_call())
+        breaker.record_failure(breaker.before_call())
+        self.assertEqual(breaker.state, 'open')
+        time.sleep(0.03)
+        trial = breaker.before_call()
+        self.assertEqual(breaker.state, 'half_open')
+        # Вызов, допущенный ещё в закрытом состоянии, завершается во время пробы
+        breaker.record_success(slow)
+        self.assertEqual(breaker.state, 'half_open')
+        breaker.record_failure(slow)
+        self.assertEqual(breaker.state, 'half_open')
+        breaker.record_success(trial)
+        self.assertEqual(breaker.state, 'closed')
+
+    def test_old_failures_leave_the_window(self):
+        breaker = CircuitBreaker(min_calls=3, window=0.05, buckets=5)
+        breaker.record_failure()
+        breaker.record_failure()
+        time.sleep(0.06)
+        breaker.record_failure()
+        self.assertEqual(breaker.state, 'closed')
+
+    def test_uncounted_exceptions_pass_through(self):
+        breaker = CircuitBreaker(min_calls=1, exceptions=(ConnectionError,))
+
+        @breaker
+        def bad_input():
+            raise ValueError
+
+        with self.assertRaises(ValueError):
+            bad_input()
+        self.assertEqual(breaker.state, 'closed')
+
+
+if __name__ == '__main__':
+    unittest.main()
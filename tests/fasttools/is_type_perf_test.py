@@ -0,0 +1,55 @@
+import ctypes
+import functools
+import timeit
+from typing import Optional
+
+from pygoodtools.fasttools.type_checked import is_type
+
+CALLS = 500_000
+
+
+# Декоратор в том виде, в каком он был до компиляции проверок
+class LegacyTypeCheckParams(ctypes.Structure):
+    _fields_ = [("types", ctypes.py_object)]
+
+
+def legacy_is_type(*types):
+    params = LegacyTypeCheckParams(types)
+
+    def decorator_type_check(func):
+        @functools.wraps(func)
+        def wrapper_type_check(*args, **kwargs):
+            if len(args) != len(params.types):
+                raise ValueError("Argument count does not match")
+            for a, t in zip(args, params.types):
+                if not isinstance(a, t):
+                    raise TypeError(f"Expected {t}, got {type(a)}")
+            return func(*args, **kwargs)
+
+        return wrapper_type_check
+
+    return decorator_type_check
+
+
+def plain(a, b, c):
+    return a
+
+
+def annotated(a: int, b: str, c: Optional[float] = None):
+    return a
+
+
+CASES = {
+    'undecorated': plain,
+    'legacy is_type(int, str, float)': legacy_is_type(int, str, float)(plain),
+    'is_type(int, str, float)': is_type(int, str, float)(plain),
+    'is_type() from annotations': is_type()(annotated),
+    'is_type(sample=10)': is_type(sample=10)(annotated),
+    'is_type(first=100)': is_type(first=100)(annotated),
+}
+
+
+if __name__ == '__main__':
+    for name, func in CASES.items():
+        elapsed = timeit.timeit(lambda: func(1, 'x', 2.0), number=CALLS)
+        print(f"{name:<34} {elapsed / CALLS * 1e9:8.1f} ns/call")
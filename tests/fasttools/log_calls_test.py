@@ -0,0 +1,127 @@
+import logging
+import queue
+import unittest
+
+from pygoodtools.fasttools.log_calls import log_calls, start_background_logging
+
+
+class _ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class _Unprintable(object):
+    def __repr__(self):
+        raise AssertionError('repr must not be computed for disabled levels')
+
+
+class TestLogCalls(unittest.TestCase):
+    def setUp(self):
+        self.logger = logging.getLogger(f'log_calls_test.{self.id()}')
+        self.logger.propagate = False
+        self.logger.setLevel(logging.DEBUG)
+        self.handler = _ListHandler()
+        self.logger.addHandler(self.handler)
+
+    def test_records_call_and_result(self):
+        @log_calls(logger=self.logger)
+        def add(a, b):
+            return a + b
+
+        self.assertEqual(add(2, b=3), 5)
+        record, = self.handler.records
+        self.assertEqual(record.getMessage(), "TestLogCalls.test_records_call_and_result.<locals>.add "
+                                              "called with args=(2,) kwargs={'b': 3} returned 5")
+        self.assertEqual(record.call_result, 5)
+
+    def test_disabled_level_skips_formatting(self):
+        @log_calls(logger=self.logger, level=logging.DEBUG)
+        def echo(x):
+            return x
+
+        self.logger.setLevel(logging.INFO)
+        echo(_Unprintable())
+        self.assertEqual(self.handler.records, [])
+
+    def test_reprs_are_truncated(self):
+        @log_calls(logger=self.logger, maxlen=20)
+        def echo(x):
+            return x
+
+        echo('x' * 1000)
+        self.assertLess(len(self.handler.records[0].getMessage()), 150)
+
+    def test_sampling(self):
+        @log_calls(logger=self.logger, sample=10)
+        def noop():
+            return None
+
+        for _ in range(100):
+            noop()
+        self.assertEqual(len(self.handler.records), 10)
+
+    def test_exceptions_are_logged(self):
+        @log_calls(logger=self.logger)
+        def fail():
+            raise KeyError('missing')
+
+        with self.assertRaises(KeyError):
+            fail()
+        self.assertIn('raised', self.handler.records[0].getMessage())
+
+    def test_background_logging_delivers_records(self):
+        listener = start_background_logging(self.logger)
+
+        @log_calls(logger=self.logger)
+        def add(a, b):
+            return a + b
+
+        for i in range(10):
+            add(i, i)
+        listener.stop()
+        self.assertEqual(len(self.handler.records), 10)
+
+    def test_background_logging_snapshots_arguments(self):
+        listener = start_background_logging(self.logger)
+
+        @log_calls(logger=self.logger)
+        def append(items, value):
+            items.append(value)
+
+        items = []
+        append(items, 1)
+        # Аргумент меняется уже после вызова, но запись должна показывать его прежним
+        items.append('changed later')
+        listener.stop()
+        self.assertEqual(self.handler.records[0].getMessage(),
+                         f'{append.__qualname__} called with args=([1], 1) kwargs={{}} returned None')
+
+    def test_handlerless_logger_uses_propagated_handlers(self):
+        child = logging.getLogger(f'{self.logger.name}.child')
+        self.assertEqual(child.handlers, [])
+        listener = start_background_logging(child)
+        child.debug('routed %d', 1)
+        listener.stop()
+        self.assertFalse(child.propagate)
+        self.assertEqual([r.getMessage() for r in self.handler.records], ['routed 1'])
+
+    def test_logger_without_any_handlers_is_rejected(self):
+        self.logger.removeHandler(self.handler)
+        with self.assertRaises(ValueError):
+            start_background_logging(self.logger)
+
+    def test_full_queue_drops_records(self):
+        listener = start_background_logging(self.logger, self.handler, maxsize=1)
+        listener.stop()
+        for i in range(5):
+            self.logger.debug('message %d', i)
+        self.assertIsInstance(listener.queue, queue.Queue)
+        self.assertEqual(listener.handler.dropped, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import random
+import threading
+import time
+
+from pygoodtools.fasttools.cache import lru_cache
+
+THREADS = (1, 4, 16, 32)
+CALLS_PER_THREAD = 50_000
+KEYS = 10_000
+
+
+def measure_throughput(threads, thread_safe):
+    @lru_cache(maxsize=KEYS // 2, thread_safe=thread_safe)
+    def cached(x):
+        return x * 2
+
+    keys = [random.randrange(KEYS) for _ in range(CALLS_PER_THREAD)]
+    barrier = threading.Barrier(threads + 1)
+
+    def worker():
+        barrier.wait()
+        for key in keys:
+            cached(key)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+    return threads * CALLS_PER_THREAD / elapsed
+
+
+def measure_stampede(threads=32, delay=0.05):
+    calls = []
+
+    @lru_cache(maxsize=16, thread_safe=True)
+    def expensive(x):
+        calls.append(x)
+        time.sleep(delay)
+        return x
+
+    barrier = threading.Barrier(threads)
+
+    def worker():
+        barrier.wait()
+        expensive(42)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return len(calls)
+
+
+if __name__ == '__main__':
+    # Без блокировки кэш можно использовать только из одного потока
+    print(f"single thread, thread_safe=False: {measure_throughput(1, False):.0f} calls/s")
+    print(f"{'threads':>8} {'thread_safe, calls/s':>21}")
+    for n in THREADS:
+        print(f"{n:>8} {measure_throughput(n, True):>21.0f}")
+    print(f"32 concurrent misses on one key -> {measure_stampede()} call(s) of the wrapped function")
@@ -0,0 +1,39 @@
+import random
+import time
+
+from pygoodtools.fasttools.cache import LRUCache
+
+SIZES = (128, 1_000, 10_000, 100_000, 1_000_000)
+OPERATIONS = 200_000
+
+
+def measure_hits(maxsize, operations=OPERATIONS):
+    cache = LRUCache(maxsize)
+    for i in range(maxsize):
+        cache.put(i, i)
+    keys = [random.randrange(maxsize) for _ in range(operations)]
+
+    start = time.perf_counter_ns()
+    for key in keys:
+        cache.get(key)
+    return (time.perf_counter_ns() - start) / operations
+
+
+def measure_misses(maxsize, operations=OPERATIONS):
+    cache = LRUCache(maxsize)
+    for i in range(maxsize):
+        cache.put(i, i)
+    keys = range(maxsize, maxsize + operations)
+
+    # Каждый промах вытесняет самый старый элемент
+    start = time.perf_counter_ns()
+    for key in keys:
+        if cache.get(key) is None:
+            cache.put(key, key)
+    return (time.perf_counter_ns() - start) / operations
+
+
+if __name__ == '__main__':
+    print(f"{'maxsize':>10} {'hit, ns/op':>12} {'miss, ns/op':>12}")
+    for maxsize in SIZES:
+        print(f"{maxsize:>10} {measure_hits(maxsize):>12.1f} {measure_misses(maxsize):>12.1f}")
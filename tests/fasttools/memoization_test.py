@@ -0,0 +1,75 @@
+import gc
+import unittest
+
+from pygoodtools.fasttools.memoization import memoize
+
+
+class TestMemoize(unittest.TestCase):
+    def test_bare_decorator_supports_keywords(self):
+        calls = []
+
+        @memoize
+        def add(a, b=0):
+            calls.append((a, b))
+            return a + b
+
+        self.assertEqual(add(1, b=2), 3)
+        self.assertEqual(add(1, b=2), 3)
+        self.assertEqual(add(1), 1)
+        self.assertEqual(calls, [(1, 2), (1, 0)])
+
+    def test_maxsize_bounds_growth(self):
+        @memoize(maxsize=100)
+        def identity(x):
+            return x
+
+        for i in range(100_000):
+            identity(i)
+        self.assertEqual(identity.cache_size(), 100)
+
+    def test_fifo_policy_evicts_oldest(self):
+        calls = []
+
+        @memoize(maxsize=2, policy='fifo')
+        def identity(x):
+            calls.append(x)
+            return x
+
+        identity(1)
+        identity(2)
+        identity(1)
+        identity(3)
+        identity(1)
+        self.assertEqual(calls, [1, 2, 3, 1])
+
+    def test_typed_separates_argument_types(self):
+        @memoize(typed=True)
+        def kind(x):
+            return type(x)
+
+        self.assertIs(kind(1), int)
+        self.assertIs(kind(1.0), float)
+
+    def test_weak_entries_die_with_their_arguments(self):
+        class Request:
+            pass
+
+        @memoize(weak=True)
+        def handle(request, n):
+            return n
+
+        request = Request()
+        self.assertEqual(handle(request, 1), 1)
+        self.assertEqual(handle(request, 1), 1)
+        self.assertEqual(handle.cache_size(), 1)
+        del request
+        gc.collect()
+        self.assertEqual(handle.cache_size(), 0)
+
+    def test_unknown_policy_is_rejected(self):
+        with self.assertRaises(ValueError):
+            memoize(maxsize=1, policy='random')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import sys
+import tracemalloc
+
+from pygoodtools.fasttools.memoization import memoize
+
+CALLS = 10_000_000
+CHECKPOINT = 1_000_000
+
+
+class Request:
+    pass
+
+
+def measure_growth(decorator, make_arg, calls=CALLS):
+    @decorator
+    def handler(arg):
+        return 0
+
+    tracemalloc.start()
+    samples = []
+    for i in range(calls):
+        handler(make_arg(i))
+        if (i + 1) % CHECKPOINT == 0:
+            current, _ = tracemalloc.get_traced_memory()
+            samples.append((i + 1, handler.cache_size(), current / (1024 ** 2)))
+    tracemalloc.stop()
+    return samples
+
+
+def report(title, samples):
+    print(title)
+    for calls, size, memory in samples:
+        print(f"  {calls:>10} calls: {size:>8} entries, {memory:8.1f} MB")
+
+
+if __name__ == '__main__':
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else CALLS
+    report('memoize(maxsize=10_000)', measure_growth(memoize(maxsize=10_000), int, calls))
+    report("memoize(maxsize=10_000, policy='fifo')", measure_growth(memoize(maxsize=10_000, policy='fifo'), int, calls))
+    report('memoize(weak=True)', measure_growth(memoize(weak=True), lambda i: Request(), calls))
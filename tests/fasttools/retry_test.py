@@ -0,0 +1,89 @@
+import time
+import unittest
+from unittest import mock
+
+from pygoodtools.fasttools.retry import RetryBudget, RetryParams, _delays, retry
+
+
+class TestRetry(unittest.TestCase):
+    def test_exponential_backoff_is_capped(self):
+        delays = _delays(RetryParams(5, 0.1, 2.0, 0.5), None)
+        self.assertEqual([round(next(delays), 3) for _ in range(5)], [0.1, 0.2, 0.4, 0.5, 0.5])
+
+    def test_full_jitter_stays_below_backoff(self):
+        delays = _delays(RetryParams(5, 0.1, 2.0, 10.0), 'full')
+        for attempt in range(10):
+            self.assertLessEqual(next(delays), 0.1 * 2 ** attempt)
+
+    def test_decorrelated_jitter_is_bounded(self):
+        delays = _delays(RetryParams(5, 0.1, 1.0, 1.0), 'decorrelated')
+        for _ in range(50):
+            self.assertTrue(0.1 <= next(delays) <= 1.0)
+
+    def test_no_sleep_after_last_attempt(self):
+        @retry(retries=3, delay=0.01)
+        def failing():
+            raise ConnectionError
+
+        with mock.patch('time.sleep') as sleep:
+            with self.assertRaises(ConnectionError):
+                failing()
+        self.assertEqual(sleep.call_count, 2)
+
+    def test_unlisted_exceptions_are_not_retried(self):
+        attempts = []
+
+        @retry(retries=5, delay=0, exceptions=(ConnectionError,))
+        def failing():
+            attempts.append(1)
+            raise ValueError
+
+        with self.assertRaises(ValueError):
+            failing()
+        self.assertEqual(len(attempts), 1)
+
+    def test_budget_limits_retries(self):
+        budget = RetryBudget(capacity=2, rate=0)
+        attempts = []
+
+        @retry(retries=10, delay=0, budget=budget)
+        def failing():
+            attempts.append(1)
+            raise ConnectionError
+
+        with self.assertRaises(ConnectionError):
+            failing()
+        self.assertEqual(len(attempts), 3)
+        with self.assertRaises(ConnectionError):
+            failing()
+        self.assertEqual(len(attempts), 4)
+
+    def test_budget_refills(self):
+        budget = RetryBudget(capacity=1, rate=100)
+        self.assertTrue(budget.acquire())
+        time.sleep(0.02)
+        self.assertTrue(budget.acquire())
+
+    def test_unknown_jitter_is_rejected(self):
+        with self.assertRaises(ValueError):
+            retry(jitter='equal')
+
+    def test_retries_below_one_are_rejected(self):
+        for retries in (0, -1):
+            with self.assertRaises(ValueError):
+                retry(retries=retries)
+
+    def test_single_attempt_calls_once(self):
+        calls = []
+
+        @retry(retries=1, delay=0)
+        def once():
+            calls.append(1)
+            return 'ok'
+
+        self.assertEqual(once(), 'ok')
+        self.assertEqual(calls, [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+import os
+import threading
+import time
+import unittest
+
+from pygoodtools.fasttools.singleton import singleton
+
+
+def _build_concurrently(factory, threads=16):
+    start = threading.Barrier(threads)
+    results = []
+
+    def worker():
+        start.wait()
+        results.append(factory())
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    return results
+
+
+class TestSingleton(unittest.TestCase):
+    def test_concurrent_calls_build_one_instance(self):
+        built = []
+
+        @singleton
+        class Client:
+            def __init__(self):
+                time.sleep(0.05)
+                built.append(self)
+
+        results = _build_concurrently(Client)
+        self.assertEqual(len(built), 1)
+        self.assertTrue(all(r is built[0] for r in results))
+
+    def test_slow_construction_does_not_block_other_singletons(self):
+        release = threading.Event()
+
+        @singleton
+        class Slow:
+            def __init__(self):
+                release.wait(5)
+
+        @singleton
+        class Fast:
+            pass
+
+        t = threading.Thread(target=Slow)
+        t.start()
+        try:
+            self.assertIsInstance(Fast(), Fast.__wrapped__)
+        finally:
+            release.set()
+            t.join()
+
+    def test_reset_instance_calls_teardown(self):
+        @singleton
+        class Client:
+            closed = False
+
+            def close(self):
+                self.closed = True
+
+        first = Client()
+        self.assertIs(Client.reset_instance(teardown=lambda c: c.close()), first)
+        self.assertTrue(first.closed)
+        self.assertIsNot(Client(), first)
+        Client.reset_instance()
+        self.assertIsNone(Client.reset_instance())
+
+    def test_failed_construction_is_retried(self):
+        attempts = []
+
+        @singleton
+        class Flaky:
+            def __init__(self):
+                attempts.append(1)
+                if len(attempts) == 1:
+                    raise ConnectionError
+
+        with self.assertRaises(ConnectionError):
+            Flaky()
+        self.assertIsInstance(Flaky(), Flaky.__wrapped__)
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork')
+    def test_child_process_gets_fresh_instance(self):
+        built = []
+
+        @singleton
+        class Client:
+            def __init__(self):
+                built.append(self)
+
+        Client()
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read)
+            Client()
+            os.write(write, str(len(built)).encode())
+            os._exit(0)
+        os.close(write)
+        with os.fdopen(read) as f:
+            child_built = f.read()
+        os.waitpid(pid, 0)
+        self.assertEqual(child_built, '2')
+        self.assertEqual(len(built), 1)
@@ -0,0 +1,109 @@
+import multiprocessing
+import os
+import tempfile
+import unittest
+
+from pygoodtools.fasttools.cache import lru_cache
+from pygoodtools.fasttools.memoization import memoize
+from pygoodtools.fasttools.storage import SqliteStorage
+
+
+def _fill(path, start):
+    storage = SqliteStorage(path).bind('shared')
+    for i in range(start, start + 200):
+        storage.put((i,), i * i)
+
+
+class TestSqliteStorage(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'cache.db')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_results_survive_restart(self):
+        calls = []
+
+        def build():
+            @memoize(storage=SqliteStorage(self.path))
+            def square(x):
+                calls.append(x)
+                return x * x
+            return square
+
+        self.assertEqual(build()(4), 16)
+        # Новый декоратор с пустой памятью, но тем же файлом
+        self.assertEqual(build()(4), 16)
+        self.assertEqual(calls, [4])
+
+    def test_lru_cache_reads_through_storage(self):
+        calls = []
+
+        def build():
+            @lru_cache(maxsize=2, storage=SqliteStorage(self.path, serializer='json'))
+            def describe(x, sep='-'):
+                calls.append(x)
+                return [x, sep]
+            return describe
+
+        self.assertEqual(build()(1, sep='+'), [1, '+'])
+        self.assertEqual(build()(1, sep='+'), [1, '+'])
+        self.assertEqual(calls, [1])
+
+    def test_equal_keys_hit_the_same_row(self):
+        storage = SqliteStorage(self.path)
+        a = ''.join(['sha', 'red'])
+        b = ''.join(['sh', 'ared'])
+        self.assertIsNot(a, b)
+        storage.put(((a, a), {'k': 1}), 'value')
+        # Равные ключи из разных объектов и числа 1 / 1.0 дают одну и ту же запись
+        self.assertEqual(storage.get(((a, b), {'k': 1.0})), 'value')
+        self.assertEqual(storage.get(((b, b), {'k': True})), 'value')
+        self.assertIsNone(storage.get(((a, b), {'k': 2})))
+        storage.put((frozenset({'x', 'y', 3}),), 'set')
+        self.assertEqual(storage.get((frozenset({3.0, 'y', 'x'}),)), 'set')
+        self.assertEqual(len(storage), 2)
+
+    def test_typed_memoize_keeps_types_apart_in_storage(self):
+        calls = []
+
+        def build():
+            @memoize(typed=True, storage=SqliteStorage(self.path))
+            def kind(x, *, y=0):
+                calls.append(x)
+                return type(x).__name__ + type(y).__name__
+            return kind
+
+        self.assertEqual(build()(1), 'intint')
+        # Память каждого декоратора пуста: из хранилища берётся только результат для того же типа
+        self.assertEqual(build()(1.0), 'floatint')
+        self.assertEqual(build()(True), 'boolint')
+        self.assertEqual(build()(1, y=1.0), 'intfloat')
+        self.assertEqual(build()(1.0), 'floatint')
+        self.assertEqual(calls, [1, 1.0, True, 1])
+
+    def test_namespaces_are_isolated(self):
+        storage = SqliteStorage(self.path)
+        first, second = storage.bind('first'), storage.bind('second')
+        first.put((1,), 'a')
+        self.assertIsNone(second.get((1,)))
+        self.assertEqual(len(first), 1)
+        first.clear()
+        self.assertEqual(len(first), 0)
+
+    def test_concurrent_processes(self):
+        context = multiprocessing.get_context('fork')
+        processes = [context.Process(target=_fill, args=(self.path, i * 100)) for i in range(4)]
+        for p in processes:
+            p.start()
+        for p in processes:
+            p.join()
+        self.assertTrue(all(p.exitcode == 0 for p in processes))
+        storage = SqliteStorage(self.path).bind('shared')
+        self.assertEqual(len(storage), 500)
+        self.assertEqual(storage.get((450,)), 450 * 450)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import contextlib
+import io
+import random
+import unittest
+
+from pygoodtools.fasttools.timeit import Histogram, export, report, timeit
+
+
+class TestHistogram(unittest.TestCase):
+    def test_percentiles_are_within_precision(self):
+        histogram = Histogram()
+        values = [random.randrange(1_000, 10_000_000) for _ in range(10_000)]
+        for value in values:
+            histogram.record(value)
+        values.sort()
+        for q in (50, 95, 99):
+            exact = values[int(len(values) * q / 100) - 1]
+            self.assertAlmostEqual(histogram.percentile(q) / exact, 1.0, delta=0.02)
+        self.assertEqual(histogram.min, values[0])
+        self.assertEqual(histogram.max, values[-1])
+
+    def test_small_values_are_exact(self):
+        histogram = Histogram()
+        for value in (0, 1, 5, 100):
+            histogram.record(value)
+        self.assertEqual(histogram.percentile(50), 1)
+        self.assertEqual(histogram.percentile(100), 100)
+
+
+class TestProfileMode(unittest.TestCase):
+    def test_profile_mode_records_without_output(self):
+        @timeit(profile=True)
+        def work(x):
+            return x + 1
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            for i in range(100):
+                work(i)
+        stats = work.stats()
+        self.assertEqual(output.getvalue(), '')
+        self.assertEqual((stats['calls'], stats['count']), (100, 100))
+        self.assertLessEqual(stats['min'], stats['p50'])
+        self.assertLessEqual(stats['p50'], stats['max'])
+
+    def test_sampling_measures_every_nth_call(self):
+        @timeit(profile=True, sample=10)
+        def work():
+            return None
+
+        for _ in range(1000):
+            work()
+        self.assertEqual(work.stats()['count'], 100)
+        self.assertEqual(work.stats()['calls'], 1000)
+
+    def test_report_lists_profiled_functions(self):
+        @timeit(profile=True)
+        def reported():
+            return None
+
+        reported()
+        names = [s['name'] for s in export()]
+        self.assertIn(reported.histogram.name, names)
+        output = io.StringIO()
+        report(file=output)
+        self.assertIn('reported', output.getvalue())
+        self.assertIs(timeit.report, report)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+import unittest
+from typing import Dict, Generator, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pygoodtools.fasttools.type_checked import is_type
+
+
+class TestIsType(unittest.TestCase):
+    def test_explicit_types(self):
+        @is_type(int, str)
+        def example(a, b):
+            return a, b
+
+        self.assertEqual(example(1, 'x'), (1, 'x'))
+        with self.assertRaises(TypeError):
+            example(1, 2)
+        with self.assertRaises(ValueError):
+            example(1)
+
+    def test_annotations_with_keywords_and_defaults(self):
+        @is_type()
+        def scale(values: list[float], factor: Optional[float] = None, *, names: dict[str, int]):
+            return len(values)
+
+        self.assertEqual(scale([1.0, 2.0], names={'a': 1}), 2)
+        self.assertEqual(scale([1.0], factor=2.0, names={}), 1)
+        with self.assertRaises(TypeError):
+            scale([1.0, 'x'], names={})
+        with self.assertRaises(TypeError):
+            scale([1.0], factor='2', names={})
+        with self.assertRaises(TypeError):
+            scale([1.0], names={'a': 'b'})
+
+    def test_typing_generics(self):
+        @is_type()
+        def pack(pair: Tuple[int, str], rest: List[Union[int, str]], extra: Dict[str, Optional[int]] = {}):
+            return pair
+
+        self.assertEqual(pack((1, 'a'), [1, 'b'], {'k': None}), (1, 'a'))
+        with self.assertRaises(TypeError):
+            pack((1, 2), [])
+        with self.assertRaises(TypeError):
+            pack((1, 'a'), [1.5])
+
+    def test_varargs_and_positional_only(self):
+        @is_type()
+        def total(first: int, /, *rest: int, **named: str):
+            return first + sum(rest)
+
+        self.assertEqual(total(1, 2, 3, a='x'), 6)
+        with self.assertRaises(TypeError):
+            total(1, 2.5)
+        with self.assertRaises(TypeError):
+            total(1, a=1)
+
+    def test_defaults_are_not_checked_at_decoration(self):
+        @is_type()
+        def lenient(x: int = 'zero'):
+            return x
+
+        self.assertEqual(lenient(), 'zero')
+        with self.assertRaises(TypeError):
+            lenient('one')
+
+    def test_numeric_tower(self):
+        @is_type()
+        def mix(x: float = 0, z: complex = 1.5, *, n: Optional[float] = None, v: list[float] = None):
+            return x, z
+
+        self.assertEqual(mix(), (0, 1.5))
+        self.assertEqual(mix(1, 2, n=3, v=[1, 2.5]), (1, 2))
+        with self.assertRaises(TypeError):
+            mix('1')
+        with self.assertRaises(TypeError):
+            mix(z=1j, v=['x'])
+
+    def test_one_shot_iterables_are_not_consumed(self):
+        @is_type()
+        def collect(values: Iterable[int]):
+            return list(values)
+
+        @is_type()
+        def drain(values: Iterator[int], gen: Generator[int, None, None]):
+            return list(values) + list(gen)
+
+        self.assertEqual(collect(iter([1, 2, 3])), [1, 2, 3])
+        self.assertEqual(collect(x for x in range(3)), [0, 1, 2])
+        self.assertEqual(drain(iter([1]), (x for x in range(2))), [1, 0, 1])
+        with self.assertRaises(TypeError):
+            drain([1], (x for x in range(2)))
+
+    def test_first_calls_only(self):
+        @is_type(first=2)
+        def echo(x: int):
+            return x
+
+        with self.assertRaises(TypeError):
+            echo('a')
+        echo(1)
+        self.assertEqual(echo('b'), 'b')
+
+    def test_sampling(self):
+        @is_type(sample=2)
+        def echo(x: int):
+            return x
+
+        with self.assertRaises(TypeError):
+            echo('a')
+        self.assertEqual(echo('b'), 'b')
+        with self.assertRaises(TypeError):
+            echo('c')
+
+
+if __name__ == '__main__':
+    unittest.main()